@@ -0,0 +1,105 @@
+"""MCP 도구 디스패치 오버헤드 벤치마크.
+
+Notion API 호출을 즉시 반환하는 스텁 클라이언트로 바꿔,
+tools/list 와 tools/call 처리에 드는 서버 측 시간만 측정한다.
+
+사용법:
+    python benchmarks/bench_dispatch.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from mcp.server import Server
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+from notion_task_mcp.metrics import Metrics
+from notion_task_mcp.models import Task
+from notion_task_mcp.tools import register_task_tools
+from notion_task_mcp.tools.task_tools import build_tools, dispatch_tool
+
+
+class StubClient:
+    """Notion API를 호출하지 않는 NotionTaskClient 대역."""
+
+    def __init__(self) -> None:
+        self.task = Task(id="00000000-0000-0000-0000-000000000000", no="WIRB-1", title="벤치마크 Task")
+        self.metrics = Metrics()
+        self.store = None
+
+    async def get_task(self, task_id: str) -> Task:
+        return self.task
+
+    async def list_tasks(
+        self, filter_: Any = None, page_size: int = 100, sort_by: Any = None, descending: bool = False
+    ) -> list[Task]:
+        return [self.task]
+
+    async def update_task(self, task_id: str, data: Any) -> Task:
+        return self.task
+
+
+def assert_not_error(label: str, response: Any) -> None:
+    """도구 응답이 오류가 아닌지 확인 (스텁이 어긋나 오류 경로를 측정하는 것을 막는다)."""
+    result = getattr(response, "root", response)
+    contents = getattr(result, "content", result if isinstance(result, list) else [])
+    errors = [content.text for content in contents if content.text.startswith("Error")]
+    assert not getattr(result, "isError", False) and not errors, f"{label}: {errors}"
+
+
+async def measure(label: str, fn: Callable[[], Awaitable[Any]], iterations: int) -> None:
+    """fn을 반복 실행하여 호출당 평균 시간 출력."""
+    assert_not_error(label, await fn())
+    for _ in range(min(100, iterations)):
+        await fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<48} {elapsed / iterations * 1e6:>10.1f} us/call")
+
+
+async def main(iterations: int) -> None:
+    client: Any = StubClient()
+    server = Server("bench")
+    register_task_tools(server, client)
+    list_handler = server.request_handlers[ListToolsRequest]
+    call_handler = server.request_handlers[CallToolRequest]
+
+    list_request = ListToolsRequest(method="tools/list")
+
+    def call_request(name: str, arguments: dict[str, Any]) -> CallToolRequest:
+        return CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+
+    get_args = {"task_id": "00000000-0000-0000-0000-000000000000"}
+    list_args = {"task_type": "Task", "status": "진행중", "labels": ["백엔드"], "start_date_from": "2026-01-01"}
+    update_args = {**get_args, "status": "완료", "priority": "높음", "end_date": "2026-02-01"}
+
+    async def rebuild_schemas() -> None:
+        build_tools()
+
+    print(f"iterations: {iterations}")
+    await measure("schema rebuild (per-request baseline)", rebuild_schemas, iterations)
+    await measure("tools/list (precomputed)", lambda: list_handler(list_request), iterations)
+    await measure("dispatch_tool get_task", lambda: dispatch_tool(client, "get_task", get_args), iterations)
+    await measure("dispatch_tool list_tasks", lambda: dispatch_tool(client, "list_tasks", list_args), iterations)
+    await measure("dispatch_tool update_task", lambda: dispatch_tool(client, "update_task", update_args), iterations)
+    await measure(
+        "tools/call get_task (via MCP handler)",
+        lambda: call_handler(call_request("get_task", get_args)),
+        iterations,
+    )
+    await measure(
+        "tools/call list_tasks (via MCP handler)",
+        lambda: call_handler(call_request("list_tasks", list_args)),
+        iterations,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="측정 반복 횟수")
+    asyncio.run(main(parser.parse_args().iterations))
@@ -0,0 +1,236 @@
+"""핫패스 마이크로벤치마크.
+
+가짜 Notion 서버의 시드 데이터(한글 제목, 다중 선택, 상위/하위 관계)를 그대로 사용해
+다음 함수를 측정한다.
+- `_parse_task`: Notion 페이지 → Task (1k / 10k / 100k 행)
+- `task_to_dict`, `json.dumps`: 도구 응답 생성과 같은 방식의 직렬화 (행 수별)
+- `_build_filter`: 필터 형태별 1회 호출
+- `_build_properties`: 생성/수정 요청 형태별 1회 호출
+
+결과는 JSON으로 저장되며, 같은 경로에 이전 결과가 있으면(또는 --baseline 지정 시)
+케이스별 변화율을 함께 출력한다. 기준보다 --threshold(%) 이상 느려진 케이스는 ▲로 표시된다.
+
+사용법:
+    python benchmarks/bench_hotpaths.py [--sizes 1000,10000,100000] [--repeat N]
+        [--output PATH] [--baseline PATH] [--threshold PCT] [--fail-on-regression]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import date
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from notion_task_mcp.models import Priority, StatusGroup, Task, TaskCreate, TaskFilter, TaskStatus, TaskType, TaskUpdate
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.tools.task_tools import task_to_dict
+
+# 가짜 Notion 서버는 테스트 지원 모듈(tests/fake_notion.py)에 있다
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.fake_notion import DEFAULT_DATABASE_ID, FakeDatabase  # noqa: E402
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "hotpaths.json"
+
+PARENT_ID = "fa4e0000-0000-4000-8000-0000000000aa"
+
+FILTER_SHAPES: dict[str, TaskFilter] = {
+    "empty": TaskFilter(),
+    "status": TaskFilter(status=TaskStatus.IN_PROGRESS),
+    "status_group": TaskFilter(status_group=StatusGroup.TODO),
+    "type_labels_services": TaskFilter(task_type=TaskType.TASK, labels=["백엔드", "버그"], services=["결제", "정산"]),
+    "date_ranges": TaskFilter(
+        start_date_from=date(2026, 3, 1),
+        start_date_to=date(2026, 3, 31),
+        end_date_from=date(2026, 3, 1),
+        end_date_to=date(2026, 4, 30),
+    ),
+    "all": TaskFilter(
+        task_type=TaskType.TASK,
+        status_group=StatusGroup.IN_PROGRESS,
+        priority=Priority.HIGH,
+        assignee="user-1",
+        labels=["백엔드", "프론트엔드", "버그"],
+        services=["결제"],
+        start_date_from=date(2026, 3, 1),
+        end_date_to=date(2026, 6, 30),
+        parent_id=PARENT_ID,
+    ),
+}
+
+PROPERTY_SHAPES: dict[str, tuple[TaskCreate | TaskUpdate, bool]] = {
+    "create_minimal": (TaskCreate(title="결제 모듈 리팩터링"), False),
+    "create_full": (
+        TaskCreate(
+            title="[긴급] 정산 배치 타임아웃 원인 분석 및 재처리 스크립트 작성",
+            task_type=TaskType.ISSUE,
+            status=TaskStatus.IN_PROGRESS,
+            priority=Priority.HIGH,
+            assignee="user-1",
+            start_date=date(2026, 3, 2),
+            end_date=date(2026, 3, 13),
+            labels=["백엔드", "버그", "운영"],
+            services=["결제", "정산"],
+            parent_id=PARENT_ID,
+        ),
+        False,
+    ),
+    "update_status": (TaskUpdate(status=TaskStatus.DONE), True),
+    "update_labels": (TaskUpdate(labels=["백엔드", "리팩터링"], services=["정산"]), True),
+}
+
+
+def build_pages(size: int, seed: int) -> list[dict[str, Any]]:
+    """가짜 DB를 시드하고 타입 분포가 고르도록 섞은 페이지 목록 반환."""
+    database = FakeDatabase()
+    database.seed(size, seed=seed)
+    pages = list(database.pages.values())
+    random.Random(seed).shuffle(pages)
+    return pages
+
+
+def measure(func: Callable[[], object], repeat: int, number: int = 1) -> list[float]:
+    """func를 number번 실행하는 시간을 repeat회 측정 (초).
+
+    할당이 많은 경로의 GC 비용도 실제 비용이므로 GC는 끄지 않고, 매 측정 전에 한 번 수거한다.
+    """
+    samples: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples: list[float], ops: int) -> dict[str, float | int]:
+    """측정값 요약. per_op_us는 중앙값 기준 1회(1행)당 시간."""
+    median = statistics.median(samples)
+    return {
+        "ops": ops,
+        "min_ms": round(min(samples) * 1000, 4),
+        "median_ms": round(median * 1000, 4),
+        "per_op_us": round(median / ops * 1_000_000, 4),
+    }
+
+
+def parse_all(client: NotionTaskClient, pages: list[dict[str, Any]]) -> list[Task]:
+    """페이지 목록을 모두 Task로 변환."""
+    return [client._parse_task(page) for page in pages]
+
+
+def to_dicts(tasks: list[Task]) -> list[dict[str, Any]]:
+    """Task 목록을 응답용 딕셔너리로 변환."""
+    return [task_to_dict(task) for task in tasks]
+
+
+def dumps(result: dict[str, Any]) -> str:
+    """dispatch_tool과 같은 옵션으로 직렬화."""
+    return json.dumps(result, ensure_ascii=False, indent=2)
+
+
+def run(sizes: list[int], repeat: int, calls: int, seed: int) -> dict[str, dict[str, float | int]]:
+    """모든 케이스를 측정해 {케이스 이름: 요약} 반환."""
+    client = NotionTaskClient(
+        api_key="bench-key",
+        database_id=DEFAULT_DATABASE_ID,
+        rate_limiter=RateLimiter(requests_per_second=0),
+    )
+    results: dict[str, dict[str, float | int]] = {}
+
+    for name, filter_ in FILTER_SHAPES.items():
+        samples = measure(partial(client._build_filter, filter_), repeat, calls)
+        results[f"build_filter/{name}"] = summarize(samples, calls)
+
+    for name, (data, is_update) in PROPERTY_SHAPES.items():
+        samples = measure(partial(client._build_properties, data, is_update), repeat, calls)
+        results[f"build_properties/{name}"] = summarize(samples, calls)
+
+    print(f"시드 데이터 생성 중 ({max(sizes):,}행)...", file=sys.stderr)
+    all_pages = build_pages(max(sizes), seed)
+    for size in sizes:
+        pages = all_pages[:size]
+        tasks = parse_all(client, pages)
+        dicts = {"count": len(tasks), "tasks": to_dicts(tasks)}
+
+        results[f"parse_task/{size}"] = summarize(measure(partial(parse_all, client, pages), repeat), size)
+        results[f"task_to_dict/{size}"] = summarize(measure(partial(to_dicts, tasks), repeat), size)
+        results[f"json_dumps/{size}"] = summarize(measure(partial(dumps, dicts), repeat), size)
+    return results
+
+
+def load_results(path: Path) -> dict[str, Any] | None:
+    """이전 결과 파일 로드. 없거나 읽을 수 없으면 None."""
+    try:
+        data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data
+
+
+def report(results: dict[str, dict[str, float | int]], baseline: dict[str, Any] | None, threshold: float) -> list[str]:
+    """결과 표 출력. 기준 대비 threshold(%) 이상 느려진 케이스 이름 목록 반환."""
+    previous: dict[str, Any] = baseline["results"] if baseline else {}
+    regressions: list[str] = []
+    print(f"{'case':<34}{'median ms':>12}{'min ms':>12}{'µs/op':>12}{'vs base':>10}")
+    for name, stats in results.items():
+        line = f"{name:<34}{stats['median_ms']:>12.3f}{stats['min_ms']:>12.3f}{stats['per_op_us']:>12.3f}"
+        before = previous.get(name)
+        if before and before.get("per_op_us"):
+            change = (stats["per_op_us"] / before["per_op_us"] - 1) * 100
+            marker = " ▲" if change >= threshold else ""
+            line += f"{change:>+9.1f}%{marker}"
+            if marker:
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="행 수 목록 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=5, help="케이스별 측정 횟수 (중앙값 보고)")
+    parser.add_argument("--calls", type=int, default=10_000, help="빌더 케이스의 측정 1회당 호출 수")
+    parser.add_argument("--seed", type=int, default=7, help="시드 데이터 난수 시드")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, help="비교 기준 결과 (기본: 덮어쓰기 전 --output)")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 표시할 변화율 (%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    baseline = load_results(args.baseline or args.output)
+    results = run(sizes, args.repeat, args.calls, args.seed)
+    regressions = report(results, baseline, args.threshold)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "repeat": args.repeat,
+            "calls": args.calls,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    args.output.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"\n결과 저장: {args.output}", file=sys.stderr)
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
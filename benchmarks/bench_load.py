@@ -0,0 +1,269 @@
+"""엔드투엔드 MCP 부하 테스트.
+
+가짜 Notion 서버를 같은 프로세스에서 띄우고, 그 서버를 가리키는 stdio MCP 서버를
+자식 프로세스로 실행한 뒤 스크립트로 만든 도구 호출 묶음을 동시성 단계별로 재생한다.
+
+단계별 출력:
+- 처리량 (calls/s), 도구별·전체 p50/p95/p99 지연 시간, 오류 수
+- MCP 서버 프로세스의 최대 RSS (Linux /proc 기준, 단계마다 초기화)
+- 도구 호출당 Notion 요청 수 (엔드포인트별 내역 포함, 429/5xx 응답도 요청으로 센다)
+
+같은 --seed면 같은 호출 순서를 재생하므로 변경 전후 비교에 쓸 수 있다.
+
+사용법:
+    python benchmarks/bench_load.py [--mix read|write|mixed|TOOL=W,...] [--concurrency 1,4,16]
+        [--calls N] [--size N] [--latency MS] [--rate-limit RPS] [--no-store] [--output PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from mcp_stdio import MCPStdioClient
+
+from notion_task_mcp.models import Priority, TaskStatus
+
+# 가짜 Notion 서버는 테스트 지원 모듈(tests/fake_notion.py)에 있다
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.fake_notion import FakeDatabase, FakeNotionServer, FaultConfig  # noqa: E402
+
+MIXES: dict[str, dict[str, int]] = {
+    "read": {"list_tasks": 2, "get_task": 7, "update_task": 1},
+    "write": {"get_task": 3, "update_task": 5, "batch_update_status": 2},
+    "mixed": {"list_tasks": 2, "get_task": 4, "update_task": 2, "batch_update": 1, "batch_update_status": 1},
+}
+
+BATCH_SIZE = 5
+
+Call = tuple[str, dict[str, Any]]
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """미리 정의된 이름 또는 `tool=가중치,...` 형식 해석."""
+    if value in MIXES:
+        return MIXES[value]
+    mix: dict[str, int] = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = int(weight or 1)
+    unknown = set(mix) - {tool for weights in MIXES.values() for tool in weights}
+    if unknown:
+        raise argparse.ArgumentTypeError(f"지원하지 않는 도구: {', '.join(sorted(unknown))}")
+    return mix
+
+
+def build_script(mix: dict[str, int], calls: int, database: FakeDatabase, seed: int) -> list[Call]:
+    """가중치에 따라 (도구, 인자) 호출 목록을 결정적으로 생성."""
+    rng = random.Random(seed)
+    ids = sorted(database.pages)
+    epics = sorted(
+        pid for pid, page in database.pages.items() if page["properties"]["타입"]["select"]["name"] == "Epic"
+    )
+    statuses = [status.value for status in TaskStatus]
+    priorities = [priority.value for priority in Priority]
+    filters: list[dict[str, Any]] = [
+        {"status_group": "할일"},
+        {"task_type": "Task", "labels": ["백엔드"]},
+        {"status": "진행중", "services": ["결제", "정산"]},
+        {"parent_id": rng.choice(epics)} if epics else {},
+    ]
+
+    def arguments(tool: str) -> dict[str, Any]:
+        if tool == "list_tasks":
+            return dict(rng.choice(filters))
+        if tool == "get_task":
+            return {"task_id": rng.choice(ids)}
+        if tool == "update_task":
+            return {"task_id": rng.choice(ids), "status": rng.choice(statuses), "priority": rng.choice(priorities)}
+        if tool == "batch_update_status":
+            return {"task_ids": rng.sample(ids, BATCH_SIZE), "status": rng.choice(statuses)}
+        # batch_update
+        return {
+            "updates": [
+                {
+                    "task_id": task_id,
+                    "status": rng.choice(statuses),
+                    "labels": rng.sample(["백엔드", "버그", "개선"], 2),
+                }
+                for task_id in rng.sample(ids, BATCH_SIZE)
+            ]
+        }
+
+    tools = rng.choices(list(mix), weights=list(mix.values()), k=calls)
+    return [(tool, arguments(tool)) for tool in tools]
+
+
+def reset_peak_rss(pid: int) -> None:
+    """프로세스 최대 RSS(VmHWM) 초기화. 지원하지 않는 환경이면 무시."""
+    try:
+        Path(f"/proc/{pid}/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mib(pid: int) -> float | None:
+    """프로세스 최대 RSS (MiB). /proc가 없으면 None."""
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """지연 시간 요약 (ms)."""
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return {"p50_ms": value, "p95_ms": value, "p99_ms": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50_ms": cuts[49] * 1000, "p95_ms": cuts[94] * 1000, "p99_ms": cuts[98] * 1000}
+
+
+async def run_level(
+    client: MCPStdioClient, fake: FakeNotionServer, script: list[Call], concurrency: int
+) -> dict[str, Any]:
+    """script를 concurrency개 작업자로 재생하고 결과 요약."""
+    assert client.process is not None
+    pid = client.process.pid
+    reset_peak_rss(pid)
+    before = Counter(fake.stats())
+    latencies: dict[str, list[float]] = {}
+    errors: Counter[str] = Counter()
+    calls = iter(script)
+
+    async def worker() -> None:
+        for tool, arguments in calls:
+            text, seconds = await client.call_tool(tool, arguments)
+            latencies.setdefault(tool, []).append(seconds)
+            if text.startswith("Error:"):
+                errors[tool] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    notion = Counter(fake.stats())
+    notion.subtract(before)
+    notion_total = sum(notion.values())
+    every = [seconds for samples in latencies.values() for seconds in samples]
+    return {
+        "concurrency": concurrency,
+        "calls": len(script),
+        "seconds": elapsed,
+        "throughput": len(script) / elapsed,
+        "errors": sum(errors.values()),
+        "peak_rss_mib": peak_rss_mib(pid),
+        "latency": percentiles(every),
+        "tools": {
+            tool: {"count": len(samples), "errors": errors[tool], **percentiles(samples)}
+            for tool, samples in sorted(latencies.items())
+        },
+        "notion_requests": notion_total,
+        "notion_per_call": notion_total / len(script),
+        "notion_endpoints": {name: count for name, count in sorted(notion.items()) if count},
+    }
+
+
+def print_level(result: dict[str, Any]) -> None:
+    """단계 결과 출력."""
+    latency = result["latency"]
+    rss = result["peak_rss_mib"]
+    print(
+        f"\n== concurrency {result['concurrency']}: {result['calls']} calls in {result['seconds']:.2f}s"
+        f" ({result['throughput']:.1f} calls/s), errors {result['errors']},"
+        f" peak RSS {f'{rss:.1f} MiB' if rss is not None else 'n/a'}"
+    )
+    print(f"{'tool':<22}{'count':>7}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for tool, stats in result["tools"].items():
+        print(
+            f"{tool:<22}{stats['count']:>7}{stats['errors']:>5}"
+            f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+    print(
+        f"{'(all)':<22}{result['calls']:>7}{result['errors']:>5}"
+        f"{latency['p50_ms']:>10.1f}{latency['p95_ms']:>10.1f}{latency['p99_ms']:>10.1f}"
+    )
+    endpoints = ", ".join(f"{name} {count}" for name, count in result["notion_endpoints"].items())
+    print(f"Notion requests: {result['notion_requests']} ({result['notion_per_call']:.2f}/call) — {endpoints}")
+
+
+async def main(options: argparse.Namespace) -> None:
+    database = FakeDatabase()
+    database.seed(options.size, seed=options.seed)
+    script = build_script(options.mix, options.calls, database, options.seed)
+    faults = FaultConfig(latency=options.latency / 1000, jitter=options.jitter / 1000)
+
+    with FakeNotionServer(database, faults) as fake, tempfile.TemporaryDirectory() as cache_dir:
+        env = {
+            "NOTION_API_KEY": "bench-fake-key",
+            "NOTION_DATABASE_ID": database.database_id,
+            "NOTION_BASE_URL": fake.base_url,
+            "NOTION_TASK_CACHE_DIR": cache_dir,
+            "NOTION_TASK_SNAPSHOT": "0" if options.no_store else "1",
+        }
+        # 기본은 서버 기본값(초당 3회)을 그대로 사용. 가짜 서버 대상이므로 0(제한 없음)으로 서버 자체 한계를 볼 수 있다.
+        if options.rate_limit is not None:
+            env["NOTION_RATE_LIMIT"] = str(options.rate_limit)
+        if options.max_concurrency is not None:
+            env["NOTION_MAX_CONCURRENCY"] = str(options.max_concurrency)
+        client = MCPStdioClient(env=env)
+        await client.start()
+        try:
+            await client.initialize()
+            # 초기 동기화와 SDK 클라이언트 생성이 측정에 섞이지 않도록 먼저 몇 번 호출
+            for tool, arguments in script[: options.warmup]:
+                await client.call_tool(tool, arguments)
+            await asyncio.sleep(options.settle)
+
+            rate_limit = "default" if options.rate_limit is None else f"{options.rate_limit:g}/s"
+            print(
+                f"mix: {json.dumps(options.mix)}, size: {options.size}, calls/level: {options.calls},"
+                f" latency: {options.latency:g}ms, rate limit: {rate_limit},"
+                f" store: {'off' if options.no_store else 'on'}"
+            )
+            results = []
+            for concurrency in options.concurrency:
+                result = await run_level(client, fake, script, concurrency)
+                print_level(result)
+                results.append(result)
+        finally:
+            await client.close()
+
+    if options.output:
+        payload = {"options": {k: v for k, v in vars(options).items() if k != "output"}, "levels": results}
+        options.output.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n결과 저장: {options.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mix", type=parse_mix, default="mixed", help="호출 구성 (read, write, mixed 또는 tool=W,...)")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda v: [int(c) for c in v.split(",")],
+        default=[1, 4, 16],
+        help="동시성 단계 (쉼표 구분)",
+    )
+    parser.add_argument("--calls", type=int, default=300, help="단계별 호출 수")
+    parser.add_argument("--size", type=int, default=2000, help="가짜 DB Task 수")
+    parser.add_argument("--seed", type=int, default=7, help="데이터/호출 순서 난수 시드")
+    parser.add_argument("--latency", type=float, default=0.0, help="Notion 응답 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 상한 (ms)")
+    parser.add_argument("--warmup", type=int, default=10, help="측정 전 워밍업 호출 수")
+    parser.add_argument("--settle", type=float, default=1.0, help="워밍업 후 대기 시간 (초, 초기 동기화용)")
+    parser.add_argument("--rate-limit", type=float, help="서버의 NOTION_RATE_LIMIT (0이면 제한 없음)")
+    parser.add_argument("--max-concurrency", type=int, help="서버의 NOTION_MAX_CONCURRENCY")
+    parser.add_argument("--no-store", action="store_true", help="로컬 복제본(스냅샷) 없이 실행")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,70 @@
+"""서버 콜드 스타트 벤치마크.
+
+매 실행마다 새 `notion-task-mcp` 프로세스를 띄워 다음 시점을 측정한다.
+- initialize 응답까지 (MCP 클라이언트가 세션을 시작할 수 있는 시점)
+- 첫 tools/list 응답까지
+- 첫 tools/call 결과까지 (NOTION_API_KEY가 설정된 경우, 또는 --call 지정 시)
+
+사용법:
+    python benchmarks/bench_startup.py [--runs N] [--call TOOL] [--args JSON]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from typing import Any
+
+from mcp_stdio import MCPStdioClient
+
+
+async def run_once(call: str | None, arguments: dict[str, Any], env: dict[str, str]) -> dict[str, float]:
+    """프로세스 하나를 띄워 각 단계까지의 시간을 측정."""
+    client = MCPStdioClient(env=env)
+    started = time.perf_counter()
+    await client.start()
+    try:
+        await client.initialize()
+        timings = {"initialize": time.perf_counter() - started}
+        await client.request("tools/list")
+        timings["tools/list"] = time.perf_counter() - started
+        if call:
+            await client.call_tool(call, arguments)
+            timings["first tool result"] = time.perf_counter() - started
+        return timings
+    finally:
+        await client.close()
+
+
+async def main(runs: int, call: str | None, arguments: dict[str, Any]) -> None:
+    # 자격 증명이 없어도 기동은 가능하도록 더미 값 사용 (도구 호출은 생략)
+    env = {
+        "NOTION_API_KEY": os.environ.get("NOTION_API_KEY", "bench-dummy-key"),
+        "NOTION_DATABASE_ID": os.environ.get("NOTION_DATABASE_ID", "bench-dummy-db"),
+    }
+
+    samples: dict[str, list[float]] = {}
+    for _ in range(runs):
+        for phase, seconds in (await run_once(call, arguments, env)).items():
+            samples.setdefault(phase, []).append(seconds)
+
+    print(f"runs: {runs}" + (f", call: {call} {json.dumps(arguments, ensure_ascii=False)}" if call else ""))
+    for phase, values in samples.items():
+        print(
+            f"{phase:<20} median {statistics.median(values) * 1000:8.1f} ms"
+            f"   min {min(values) * 1000:8.1f} ms   max {max(values) * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="측정 횟수")
+    parser.add_argument("--call", help="첫 호출 도구 (기본: NOTION_API_KEY가 있으면 list_tasks)")
+    parser.add_argument("--args", default=None, help="도구 인자 JSON (기본: {\"page_size\": 1})")
+    options = parser.parse_args()
+
+    tool = options.call or ("list_tasks" if os.environ.get("NOTION_API_KEY") else None)
+    tool_args = json.loads(options.args) if options.args else {"page_size": 1}
+    asyncio.run(main(options.runs, tool, tool_args))
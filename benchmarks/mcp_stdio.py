@@ -0,0 +1,103 @@
+"""벤치마크용 최소 MCP stdio 클라이언트.
+
+서버 프로세스를 띄우고 줄 단위 JSON-RPC로 요청을 주고받는다.
+여러 요청을 동시에 보낼 수 있도록 응답은 id로 매칭한다.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any
+
+PROTOCOL_VERSION = "2025-06-18"
+
+
+class MCPStdioClient:
+    """notion-task-mcp 서버를 자식 프로세스로 실행하는 MCP 클라이언트."""
+
+    def __init__(self, env: dict[str, str] | None = None, command: list[str] | None = None) -> None:
+        self.env = {**os.environ, **(env or {})}
+        self.command = command or [sys.executable, "-m", "notion_task_mcp.server"]
+        self.process: asyncio.subprocess.Process | None = None
+        self._next_id = 0
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._reader: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """서버 프로세스 시작."""
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self.env,
+            limit=64 * 1024 * 1024,
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        assert self.process and self.process.stdout
+        while line := await self.process.stdout.readline():
+            message = json.loads(line)
+            future = self._pending.pop(message.get("id", -1), None)
+            if future and not future.done():
+                future.set_result(message)
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("MCP 서버가 종료되었습니다."))
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        assert self.process and self.process.stdin
+        self.process.stdin.write(json.dumps(message, ensure_ascii=False).encode() + b"\n")
+        await self.process.stdin.drain()
+
+    async def request(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """요청을 보내고 응답(result)을 반환."""
+        self._next_id += 1
+        request_id = self._next_id
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+        response = await future
+        if "error" in response:
+            raise RuntimeError(f"{method} 실패: {response['error']}")
+        return response["result"]  # type: ignore[no-any-return]
+
+    async def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """알림 전송 (응답 없음)."""
+        await self._send({"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    async def initialize(self) -> dict[str, Any]:
+        """MCP initialize 핸드셰이크."""
+        result = await self.request(
+            "initialize",
+            {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "notion-task-mcp-bench", "version": "0"},
+            },
+        )
+        await self.notify("notifications/initialized")
+        return result
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> tuple[str, float]:
+        """도구 호출. (응답 텍스트, 소요 시간 초) 반환."""
+        started = time.perf_counter()
+        result = await self.request("tools/call", {"name": name, "arguments": arguments})
+        return result["content"][0]["text"], time.perf_counter() - started
+
+    async def close(self) -> None:
+        """서버 종료 (stdin을 닫으면 stdio 서버가 스스로 종료)."""
+        if self.process is None:
+            return
+        if self.process.stdin:
+            self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=5)
+        except TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+        if self._reader:
+            await self._reader
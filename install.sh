@@ -204,6 +204,18 @@ cat > "$INSTALL_PATH/config.json" << EOF
     "priority": "중간",
     "type": "Task",
     "auto_assign": true
+  },
+  "cache": {
+    "enabled": true,
+    "ttl": {
+      "list": 60,
+      "get": 60,
+      "schema": 300
+    }
+  },
+  "daemon": {
+    "enabled": true,
+    "idle_timeout": 600
   }
 }
 EOF
@@ -0,0 +1,186 @@
+"""워크스페이스/통합 토큰(프로필)별 Notion 클라이언트 풀.
+
+하나의 서버 프로세스가 여러 워크스페이스를 처리할 때, 도구 호출마다 profile 인자로 클라이언트를 고른다.
+Notion 속도 제한은 통합 토큰 단위이므로 클라이언트마다 속도 제한기와 HTTP 연결 풀을 따로 두고,
+메트릭은 프로세스 전체가 공유한다.
+"""
+
+import json
+import os
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .database_group import DatabaseConfig, DatabaseGroupClient, database_configs
+from .metrics import Metrics
+from .notion_client import NotionTaskClient
+from .rate_limit import RateLimiter
+
+# 동시에 유지할 클라이언트 수 기본값 (NOTION_POOL_SIZE)
+DEFAULT_POOL_SIZE = 8
+
+
+@dataclass
+class Profile:
+    """프로필 설정.
+
+    Attributes:
+        name: 프로필 이름 (도구 호출의 profile 인자).
+        api_key: Notion 통합 토큰.
+        database_id: Task DB ID (databases가 없을 때).
+        databases: 여러 DB를 함께 조회할 때의 DB 설정.
+        rate_limit: 초당 최대 요청 수. 없으면 NOTION_RATE_LIMIT.
+        max_concurrency: 동시 요청 수. 없으면 NOTION_MAX_CONCURRENCY.
+        base_url: Notion API 주소. 없으면 NOTION_BASE_URL.
+    """
+
+    name: str
+    api_key: str
+    database_id: str | None = None
+    databases: list[DatabaseConfig] = field(default_factory=list)
+    rate_limit: float | None = None
+    max_concurrency: int | None = None
+    base_url: str | None = None
+
+    def create_client(self, metrics: Metrics) -> NotionTaskClient:
+        """이 프로필의 클라이언트 생성 (전용 속도 제한기, 공용 메트릭)."""
+        rate_limiter = RateLimiter(
+            requests_per_second=self.rate_limit
+            if self.rate_limit is not None
+            else float(os.environ.get("NOTION_RATE_LIMIT", "3")),
+            max_concurrency=self.max_concurrency
+            if self.max_concurrency is not None
+            else int(os.environ.get("NOTION_MAX_CONCURRENCY", "3")),
+        )
+        if self.databases:
+            return DatabaseGroupClient(self.databases, self.api_key, rate_limiter, metrics, self.base_url)
+        return NotionTaskClient(self.api_key, self.database_id, rate_limiter, metrics, self.base_url)
+
+
+def parse_profiles(value: str) -> dict[str, Profile]:
+    """NOTION_PROFILES 값 해석.
+
+    JSON 객체 {"이름": {"api_key" 또는 "api_key_env", "database_id" 또는 "databases", ...}} 또는
+    그런 JSON 파일 경로를 받는다. api_key_env는 토큰을 담은 환경변수 이름이다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 토큰/DB가 없음.
+    """
+    value = value.strip()
+    data: dict[str, Any] = json.loads(value if value.startswith("{") else Path(value).expanduser().read_text())
+    profiles: dict[str, Profile] = {}
+    for name, item in data.items():
+        api_key = item.get("api_key") or os.environ.get(item.get("api_key_env", ""))
+        if not api_key:
+            raise ValueError(f"'{name}' 프로필에 API 키가 없습니다.")
+        databases = database_configs(item["databases"]) if item.get("databases") else []
+        if not (databases or item.get("database_id")):
+            raise ValueError(f"'{name}' 프로필에 database_id가 없습니다.")
+        profiles[name] = Profile(
+            name,
+            api_key,
+            item.get("database_id"),
+            databases,
+            item.get("rate_limit"),
+            item.get("max_concurrency"),
+            item.get("base_url"),
+        )
+    if not profiles:
+        raise ValueError("NOTION_PROFILES에 프로필이 없습니다.")
+    return profiles
+
+
+class ClientPool:
+    """프로필별 NotionTaskClient 풀.
+
+    클라이언트는 처음 쓸 때 만든다. max_clients를 넘으면 가장 오래 쓰지 않은 유휴 클라이언트를 닫아
+    연결과 캐시를 해제하므로, 프로필이 많아도 메모리 사용량은 max_clients개 분량으로 제한된다.
+    고정(pinned) 프로필과 사용 중인 클라이언트는 닫지 않는다.
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, Profile],
+        metrics: Metrics | None = None,
+        max_clients: int = DEFAULT_POOL_SIZE,
+        default: str | None = None,
+    ) -> None:
+        """초기화.
+
+        Args:
+            profiles: 이름 → 프로필.
+            metrics: 모든 클라이언트가 공유할 메트릭 저장소. 없으면 새로 생성.
+            max_clients: 동시에 유지할 클라이언트 수.
+            default: 기본 프로필 이름 (닫지 않음). 없으면 첫 번째 프로필.
+        """
+        self.profiles = profiles
+        self.metrics = metrics or Metrics()
+        self.max_clients = max(1, max_clients)
+        self.default = default or next(iter(profiles))
+        if self.default not in profiles:
+            raise ValueError(f"알 수 없는 기본 프로필입니다: {self.default}")
+        self._clients: OrderedDict[str, NotionTaskClient] = OrderedDict()
+        self._in_use: Counter[str] = Counter()
+
+    @classmethod
+    def from_env(cls, metrics: Metrics | None = None) -> "ClientPool | None":
+        """환경변수(NOTION_PROFILES, NOTION_DEFAULT_PROFILE, NOTION_POOL_SIZE)로 생성. 프로필이 없으면 None."""
+        value = os.environ.get("NOTION_PROFILES")
+        if not value:
+            return None
+        return cls(
+            parse_profiles(value),
+            metrics,
+            int(os.environ.get("NOTION_POOL_SIZE", DEFAULT_POOL_SIZE)),
+            os.environ.get("NOTION_DEFAULT_PROFILE"),
+        )
+
+    @property
+    def names(self) -> list[str]:
+        """프로필 이름 목록."""
+        return list(self.profiles)
+
+    def client(self, name: str) -> NotionTaskClient:
+        """프로필의 클라이언트 (없으면 생성).
+
+        Raises:
+            ValueError: 알 수 없는 프로필.
+        """
+        profile = self.profiles.get(name)
+        if profile is None:
+            raise ValueError(f"알 수 없는 프로필입니다: {name} (가능한 값: {', '.join(self.profiles)})")
+        client = self._clients.get(name)
+        self.metrics.record_cache("client_pool", client is not None)
+        if client is None:
+            client = self._clients[name] = profile.create_client(self.metrics)
+        self._clients.move_to_end(name)
+        return client
+
+    @asynccontextmanager
+    async def acquire(self, name: str) -> AsyncIterator[NotionTaskClient]:
+        """도구 호출 동안 프로필의 클라이언트를 사용 중으로 표시하고 넘겨준다."""
+        client = self.client(name)
+        self._in_use[name] += 1
+        try:
+            await self._evict()
+            yield client
+        finally:
+            self._in_use[name] -= 1
+
+    async def _evict(self) -> None:
+        """max_clients를 넘는 만큼 오래 쓰지 않은 유휴 클라이언트를 닫는다."""
+        for name in list(self._clients):
+            if len(self._clients) <= self.max_clients:
+                break
+            if name == self.default or self._in_use[name] > 0:
+                continue
+            await self._clients.pop(name).aclose()
+
+    async def aclose(self) -> None:
+        """모든 클라이언트를 닫는다."""
+        while self._clients:
+            _, client = self._clients.popitem()
+            await client.aclose()
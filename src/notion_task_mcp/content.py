@@ -0,0 +1,125 @@
+"""Notion 페이지 본문(블록 트리)을 간결한 Markdown으로 변환.
+
+블록은 blocks.children.list 응답 형식이며, 하위 블록은 각 블록의 "children" 키에 붙여 둔다.
+출력이 max_chars를 넘으면 거기서 멈추고 잘렸음을 표시한다.
+"""
+
+from typing import Any
+
+# 들여쓰기 한 단계
+INDENT = "  "
+# 출력이 잘렸을 때 끝에 붙이는 표시
+TRUNCATED_MARK = "…(이하 생략)"
+
+_HEADINGS = {"heading_1": "# ", "heading_2": "## ", "heading_3": "### "}
+# 본문 없이 URL만 보여주는 블록
+_LINK_BLOCKS = ("image", "video", "file", "pdf", "audio", "bookmark", "embed", "link_preview")
+
+
+def rich_text_to_markdown(rich_text: list[dict[str, Any]]) -> str:
+    """rich_text 배열을 Markdown 문자열로 변환 (굵게/기울임/취소선/코드/링크)."""
+    parts = []
+    for item in rich_text:
+        text = item.get("plain_text", "")
+        if not text:
+            continue
+        annotations = item.get("annotations") or {}
+        if annotations.get("code"):
+            text = f"`{text}`"
+        if annotations.get("bold"):
+            text = f"**{text}**"
+        if annotations.get("italic"):
+            text = f"*{text}*"
+        if annotations.get("strikethrough"):
+            text = f"~~{text}~~"
+        if item.get("href"):
+            text = f"[{text}]({item['href']})"
+        parts.append(text)
+    return "".join(parts)
+
+
+def plain_text_length(block: dict[str, Any]) -> int:
+    """블록 자체의 글자 수 (하위 블록 제외). 조회를 언제 멈출지 추정하는 데 쓴다."""
+    value = block.get(block.get("type", ""), {})
+    return sum(len(item.get("plain_text", "")) for item in value.get("rich_text", [])) + 1
+
+
+def _block_line(block: dict[str, Any], number: int) -> str | None:
+    """블록 하나를 한 줄(또는 코드 블록)로 변환. 표시하지 않는 블록이면 None."""
+    block_type = block.get("type", "")
+    value = block.get(block_type) or {}
+    text = rich_text_to_markdown(value.get("rich_text", []))
+
+    if block_type == "paragraph":
+        return text
+    if block_type in _HEADINGS:
+        return _HEADINGS[block_type] + text
+    if block_type == "bulleted_list_item":
+        return f"- {text}"
+    if block_type == "numbered_list_item":
+        return f"{number}. {text}"
+    if block_type == "to_do":
+        return f"- [{'x' if value.get('checked') else ' '}] {text}"
+    if block_type == "toggle":
+        return f"▸ {text}"
+    if block_type == "quote":
+        return f"> {text}"
+    if block_type == "callout":
+        icon = (value.get("icon") or {}).get("emoji", "💡")
+        return f"> {icon} {text}"
+    if block_type == "code":
+        return f"```{value.get('language', '')}\n{text}\n```"
+    if block_type == "equation":
+        return f"$$ {value.get('expression', '')} $$"
+    if block_type == "divider":
+        return "---"
+    if block_type in ("child_page", "child_database"):
+        return f"📄 {value.get('title', '')}"
+    if block_type == "table_row":
+        cells = [rich_text_to_markdown(cell) for cell in value.get("cells", [])]
+        return "| " + " | ".join(cells) + " |"
+    if block_type in _LINK_BLOCKS:
+        target = value.get(value.get("type", ""), {}) if "type" in value else value
+        url = target.get("url") or value.get("url") or ""
+        caption = rich_text_to_markdown(value.get("caption", []))
+        return f"[{caption or block_type}]({url})" if url else None
+    return text or None
+
+
+def render_blocks(blocks: list[dict[str, Any]], max_chars: int) -> tuple[str, bool]:
+    """블록 트리를 Markdown으로 변환.
+
+    Args:
+        blocks: 최상위 블록 목록 (하위 블록은 "children" 키).
+        max_chars: 최대 글자 수. 넘으면 블록 경계에서 멈춘다.
+
+    Returns:
+        (Markdown, 잘렸는지 여부)
+    """
+    lines: list[str] = []
+    size = 0
+
+    def walk(items: list[dict[str, Any]], depth: int) -> bool:
+        nonlocal size
+        number = 0
+        for index, block in enumerate(items):
+            number = number + 1 if block.get("type") == "numbered_list_item" else 0
+            line = _block_line(block, number)
+            if line is not None:
+                line = "\n".join(INDENT * depth + part for part in line.split("\n"))
+                if size + len(line) + 1 > max_chars:
+                    return False
+                lines.append(line)
+                size += len(line) + 1
+            if block.get("type") == "table_row" and index == 0:
+                # 첫 행 아래에 머리글 구분선
+                columns = len((block.get("table_row") or {}).get("cells", []))
+                lines.append(INDENT * depth + "|" + " --- |" * columns)
+            if not walk(block.get("children", []), depth + 1):
+                return False
+        return True
+
+    complete = walk(blocks, 0)
+    if not complete:
+        lines.append(TRUNCATED_MARK)
+    return "\n".join(lines), not complete
@@ -0,0 +1,365 @@
+"""여러 Task DB를 함께 조회하는 클라이언트.
+
+팀마다 Task DB를 따로 두는 경우, 목록 조회를 모든 DB에 동시에 보내고 결과를 합친다.
+DB별 클라이언트는 속도 제한기와 메트릭을 공유하므로 DB 수와 관계없이 전체 요청 속도 제한은 하나다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from .metrics import Metrics
+from .models import BatchItemResult, SortField, Task, TaskContent, TaskFilter, TaskUpdate
+from .notion_client import NotionTaskClient
+from .rate_limit import RateLimiter
+from .store import sort_key
+
+T = TypeVar("T")
+
+# 스트림별로 미리 받아 둘 항목 수 (Notion 한 페이지 분량)
+MERGE_BUFFER = 100
+
+
+@dataclass
+class DatabaseConfig:
+    """Task DB 설정.
+
+    Attributes:
+        id: Notion 데이터베이스 ID.
+        name: 이름 (Task의 database 필드). 없으면 ID.
+        properties: 속성 이름 매핑 ({"status": "State"}처럼 PROP_* 이름의 소문자 → 실제 이름).
+    """
+
+    id: str
+    name: str | None = None
+    properties: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        """Task에 붙일 DB 이름."""
+        return self.name or self.id
+
+
+def parse_database_configs(value: str) -> list[DatabaseConfig]:
+    """NOTION_DATABASES 값 해석.
+
+    JSON 배열(ID 문자열 또는 {"id", "name", "properties"} 객체) 또는 쉼표로 구분한 ID 목록을 받는다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 DB가 없음.
+    """
+    value = value.strip()
+    if value.startswith("["):
+        return database_configs(json.loads(value))
+    return database_configs([part.strip() for part in value.split(",") if part.strip()])
+
+
+def database_configs(items: list[Any]) -> list[DatabaseConfig]:
+    """JSON 값(ID 문자열 또는 {"id", "name", "properties"} 객체 목록)을 DB 설정으로 변환.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 DB가 없음.
+    """
+    configs: list[DatabaseConfig] = []
+    for item in items:
+        if isinstance(item, str):
+            configs.append(DatabaseConfig(item))
+        elif isinstance(item, dict) and item.get("id"):
+            configs.append(DatabaseConfig(item["id"], item.get("name"), dict(item.get("properties") or {})))
+        else:
+            raise ValueError(f"DB 설정 형식이 잘못되었습니다: {item!r}")
+    if not configs:
+        raise ValueError("DB 설정이 비어 있습니다.")
+    return configs
+
+
+class _Failure:
+    """스트림에서 발생한 예외 (소비하는 쪽에서 다시 발생)."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_END = object()
+
+
+async def merge_streams(
+    streams: list[AsyncIterator[T]],
+    key: Callable[[T], Any] | None = None,
+    reverse: bool = False,
+    buffer: int = MERGE_BUFFER,
+) -> AsyncIterator[T]:
+    """여러 비동기 스트림을 동시에 받아 하나로 합친다.
+
+    스트림마다 별도 태스크에서 최대 buffer개까지 미리 받는다. key가 없으면 도착한 순서대로,
+    있으면 각 스트림이 key(reverse) 순서로 정렬되어 있다고 보고 그 순서를 유지하며 합친다.
+    소비를 멈추면 남은 스트림 조회도 취소된다.
+
+    Args:
+        streams: 합칠 스트림 목록.
+        key: 정렬 키 함수. 없으면 도착 순서.
+        reverse: 내림차순 여부.
+        buffer: 스트림별 선행 버퍼 크기.
+
+    Yields:
+        스트림 항목.
+
+    Raises:
+        Exception: 스트림에서 발생한 첫 예외.
+    """
+    shared = key is None
+    queues: list[asyncio.Queue[tuple[int, Any]]] = [
+        asyncio.Queue(maxsize=buffer) for _ in range(1 if shared else len(streams))
+    ]
+
+    async def produce(index: int, stream: AsyncIterator[T]) -> None:
+        queue = queues[0 if shared else index]
+        try:
+            async for item in stream:
+                await queue.put((index, item))
+        except Exception as e:
+            await queue.put((index, _Failure(e)))
+        else:
+            await queue.put((index, _END))
+
+    async def receive(index: int) -> Any:
+        _, item = await queues[index].get()
+        if isinstance(item, _Failure):
+            raise item.error
+        return item
+
+    producers = [asyncio.create_task(produce(index, stream)) for index, stream in enumerate(streams)]
+    try:
+        if key is None:
+            remaining = len(streams)
+            while remaining:
+                item = await receive(0)
+                if item is _END:
+                    remaining -= 1
+                else:
+                    yield item
+        else:
+            heads: dict[int, Any] = {}
+            for index in range(len(streams)):
+                if (item := await receive(index)) is not _END:
+                    heads[index] = item
+            pick = max if reverse else min
+            while heads:
+                index = pick(heads, key=lambda i: key(heads[i]))
+                yield heads[index]
+                if (item := await receive(index)) is _END:
+                    del heads[index]
+                else:
+                    heads[index] = item
+    finally:
+        for producer in producers:
+            producer.cancel()
+
+
+class DatabaseGroupClient(NotionTaskClient):
+    """여러 Task DB를 함께 조회하는 클라이언트.
+
+    자신은 첫 번째 DB의 클라이언트이고(생성 대상), 나머지 DB마다 속도 제한기/메트릭을 공유하는
+    NotionTaskClient를 둔다. 목록 조회는 모든 DB에 동시에 보내 합치고, 단건 조회/수정은 Task가 속한
+    DB의 클라이언트가 처리한다 (DB마다 속성 이름이 다를 수 있으므로). 처음 보는 Task는 쓰기 전에
+    페이지를 조회해 소속 DB를 확인한다.
+    """
+
+    def __init__(
+        self,
+        databases: list[DatabaseConfig],
+        api_key: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        metrics: Metrics | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        """초기화.
+
+        Args:
+            databases: DB 설정 목록. 첫 번째 DB에 Task를 생성한다.
+            api_key: Notion API 키. 없으면 환경변수에서 읽음.
+            rate_limiter: 모든 DB가 공유할 속도 제한기. 없으면 환경변수 기준으로 생성.
+            metrics: 모든 DB가 공유할 메트릭 저장소.
+            base_url: Notion API 주소 (/v1 제외).
+
+        Raises:
+            ValueError: DB가 없거나 설정 오류.
+        """
+        if not databases:
+            raise ValueError("DB가 하나 이상 필요합니다.")
+        first, *rest = databases
+        super().__init__(
+            api_key,
+            first.id,
+            rate_limiter,
+            metrics,
+            base_url,
+            database_name=first.label,
+            property_names=first.properties,
+        )
+        self.others = [
+            NotionTaskClient(
+                self.api_key,
+                config.id,
+                self.rate_limiter,
+                self.metrics,
+                self.base_url,
+                database_name=config.label,
+                property_names=config.properties,
+            )
+            for config in rest
+        ]
+        # 하이픈 없는 DB ID → 클라이언트
+        self._by_database = {_compact(client.database_id): client for client in self.database_clients}
+        # 받은 Task ID → 그 Task가 속한 DB의 클라이언트
+        self._sources: dict[str, NotionTaskClient] = {}
+
+    @property
+    def database_clients(self) -> list[NotionTaskClient]:
+        """DB별 클라이언트 (첫 번째가 자기 자신)."""
+        return [self, *self.others]
+
+    def _client_for(self, task_id: str) -> NotionTaskClient | None:
+        """이미 본 Task가 속한 DB의 클라이언트. 모르면 None."""
+        if client := self._sources.get(task_id):
+            return client
+        for client in self.database_clients:
+            if client.store is not None and client.store.get(task_id):
+                return client
+        return None
+
+    async def _route(self, task_id: str) -> NotionTaskClient:
+        """Task가 속한 DB의 클라이언트. 모르는 Task는 페이지를 조회해 parent.database_id로 판단한다.
+
+        수정 요청의 속성 이름은 DB마다 다르므로 요청을 만들기 전에 소속을 확인해야 한다.
+        """
+        if client := self._client_for(task_id):
+            return client
+        page = await self._request(self.client.pages.retrieve, page_id=task_id)
+        client = self._owner(page)
+        self._sources[task_id] = client
+        return client
+
+    def _owner(self, page: dict[str, Any]) -> NotionTaskClient:
+        """페이지의 parent.database_id에 해당하는 DB 클라이언트 (모르는 DB면 자기 자신)."""
+        database_id = (page.get("parent") or {}).get("database_id")
+        return self._by_database.get(_compact(database_id), self) if database_id else self
+
+    def _track(self, page: dict[str, Any]) -> Task:
+        """페이지가 속한 DB 클라이언트로 파싱하고 소속을 기억."""
+        client = self._owner(page)
+        task = super()._track(page) if client is self else client._track(page)
+        self._sources[task.id] = client
+        return task
+
+    async def _from(self, client: NotionTaskClient, tasks: AsyncIterator[Task]) -> AsyncIterator[Task]:
+        """client의 Task 스트림에서 소속을 기억하며 그대로 전달."""
+        async for task in tasks:
+            self._sources[task.id] = client
+            yield task
+
+    async def warm_up(self) -> None:
+        """모든 DB 클라이언트의 SDK 클라이언트를 미리 생성."""
+        await asyncio.gather(super().warm_up(), *(client.warm_up() for client in self.others))
+
+    async def aclose(self) -> None:
+        """모든 DB 클라이언트의 연결을 닫고 캐시를 비운다."""
+        await asyncio.gather(super().aclose(), *(client.aclose() for client in self.others))
+        self._sources.clear()
+
+    async def iter_tasks(
+        self,
+        filter_: TaskFilter | None = None,
+        page_size: int = 100,
+        sort_by: SortField | None = None,
+        descending: bool = False,
+    ) -> AsyncIterator[Task]:
+        """모든 DB의 Task를 동시에 받아 하나의 스트림으로 합친다.
+
+        정렬 기준이 있으면 DB별 정렬 결과를 순서를 유지하며 합치고, 없으면 도착한 순서대로 내보낸다.
+        """
+        streams = [self._from(self, super().iter_tasks(filter_, page_size, sort_by, descending))]
+        streams += [
+            self._from(client, client.iter_tasks(filter_, page_size, sort_by, descending)) for client in self.others
+        ]
+        key = sort_key(sort_by, descending) if sort_by else None
+        async for task in merge_streams(streams, key, reverse=descending, buffer=page_size):
+            yield task
+
+    async def list_tasks(
+        self,
+        filter_: TaskFilter | None = None,
+        page_size: int = 100,
+        sort_by: SortField | None = None,
+        descending: bool = False,
+    ) -> list[Task]:
+        """모든 DB의 Task 목록을 동시에 조회해 합친다 (DB별 로컬 복제본 사용)."""
+        results = await asyncio.gather(
+            super().list_tasks(filter_, page_size, sort_by, descending),
+            *(client.list_tasks(filter_, page_size, sort_by, descending) for client in self.others),
+        )
+        for client, tasks in zip(self.database_clients, results, strict=True):
+            for task in tasks:
+                self._sources[task.id] = client
+        if sort_by:
+            return list(heapq.merge(*results, key=sort_key(sort_by, descending), reverse=descending))
+        return list(itertools.chain.from_iterable(results))
+
+    async def get_task(self, task_id: str) -> Task:
+        """Task가 속한 DB의 클라이언트로 단건 조회 (모르는 Task는 응답의 parent로 판단)."""
+        client = self._client_for(task_id) or self
+        return await (super().get_task(task_id) if client is self else client.get_task(task_id))
+
+    async def get_task_content(
+        self, task_id: str, max_depth: int | None = None, max_chars: int | None = None
+    ) -> TaskContent:
+        """Task가 속한 DB의 클라이언트로 본문 조회."""
+        client = await self._route(task_id)
+        if client is self:
+            return await super().get_task_content(task_id, max_depth, max_chars)
+        return await client.get_task_content(task_id, max_depth, max_chars)
+
+    async def update_task(self, task_id: str, data: TaskUpdate) -> Task:
+        """Task가 속한 DB의 속성 이름으로 수정."""
+        client = await self._route(task_id)
+        return await (super().update_task(task_id, data) if client is self else client.update_task(task_id, data))
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Task가 속한 DB의 클라이언트로 삭제 (그 DB의 로컬 복제본에서도 제거)."""
+        client = await self._route(task_id)
+        return await (super().delete_task(task_id) if client is self else client.delete_task(task_id))
+
+    async def delete_tasks_by_filter(self, filter_: TaskFilter, page_size: int = 100) -> list[BatchItemResult]:
+        """모든 DB에서 조건에 맞는 Task를 동시에 모은 뒤, 각 Task가 속한 DB의 클라이언트로 아카이브.
+
+        Raises:
+            ValueError: 필터 조건이 없음.
+        """
+        matches = await asyncio.gather(
+            super()._matching_task_ids(filter_, page_size),
+            *(client._matching_task_ids(filter_, page_size) for client in self.others),
+        )
+        for client, task_ids in zip(self.database_clients, matches, strict=True):
+            for task_id in task_ids:
+                self._sources[task_id] = client
+        results = await self.delete_tasks(list(itertools.chain.from_iterable(matches)))
+        return [result.model_copy(update={"task": None}) for result in results]
+
+    async def _set_archived(self, task_id: str, archived: bool) -> BatchItemResult:
+        """Task가 속한 DB의 클라이언트로 아카이브 상태 변경. 실패는 예외 대신 결과로 반환."""
+        try:
+            client = await self._route(task_id)
+        except Exception as e:
+            return BatchItemResult(task_id=task_id, success=False, error=str(e))
+        if client is self:
+            return await super()._set_archived(task_id, archived)
+        return await client._set_archived(task_id, archived)
+
+
+def _compact(database_id: str | None) -> str:
+    """비교용 DB ID (하이픈 제거)."""
+    return (database_id or "").replace("-", "")
@@ -0,0 +1,86 @@
+"""도구 호출 마감 시간과 부분 결과.
+
+느린 목록 조회/일괄 처리가 마감 시간을 넘기면 호출 태스크를 취소한다. 취소는 진행 중인 Notion 요청,
+속도 제한 대기, 페이지네이션과 일괄 처리 루프까지 그대로 전파되므로 남은 요청을 더 보내지 않는다.
+MCP 클라이언트의 취소 알림(notifications/cancelled)도 SDK가 같은 방식으로 호출 태스크를 취소한다.
+
+목록/일괄 처리는 완료한 항목을 report()로 남기고, 마감 시간을 넘기면 도구가 그 항목을 부분 결과로 돌려준다.
+
+환경변수:
+    NOTION_TASK_TIMEOUT  : 모든 도구의 기본 제한 시간 (초, 기본 60, 0이면 제한 없음)
+    NOTION_TASK_TIMEOUTS : 도구별 제한 시간 JSON ({"list_tasks": 20, "server_stats": 0})
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+# 기본 제한 시간 (초)
+DEFAULT_TIMEOUT = 60.0
+# 도구 인자로 지정할 수 있는 최대 제한 시간 (초)
+MAX_TIMEOUT = 600.0
+
+# 현재 도구 호출에서 완료된 항목 (asyncio.gather 등으로 만든 하위 태스크도 같은 목록을 본다)
+_completed: ContextVar[list[Any] | None] = ContextVar("completed", default=None)
+
+
+def report(*items: Any) -> None:
+    """완료한 항목 기록 (부분 결과용). 추적 중이 아니면 아무것도 하지 않는다."""
+    completed = _completed.get()
+    if completed is not None:
+        completed.extend(items)
+
+
+@contextmanager
+def track_completed() -> Iterator[list[Any]]:
+    """이 블록 안에서 report()한 항목을 모을 목록."""
+    completed: list[Any] = []
+    token = _completed.set(completed)
+    try:
+        yield completed
+    finally:
+        _completed.reset(token)
+
+
+class ToolTimeouts:
+    """도구별 제한 시간 설정."""
+
+    def __init__(self, default: float | None = DEFAULT_TIMEOUT, per_tool: dict[str, float] | None = None) -> None:
+        """초기화.
+
+        Args:
+            default: 기본 제한 시간 (초). None 또는 0이면 제한 없음.
+            per_tool: 도구 이름 → 제한 시간 (0이면 그 도구는 제한 없음).
+        """
+        self.default = default or None
+        self.per_tool = per_tool or {}
+
+    @classmethod
+    def from_env(cls) -> "ToolTimeouts":
+        """환경변수(NOTION_TASK_TIMEOUT, NOTION_TASK_TIMEOUTS)로 생성.
+
+        Raises:
+            ValueError: NOTION_TASK_TIMEOUTS 형식이 잘못됨.
+        """
+        per_tool = json.loads(os.environ.get("NOTION_TASK_TIMEOUTS") or "{}")
+        if not isinstance(per_tool, dict):
+            raise ValueError("NOTION_TASK_TIMEOUTS는 {도구 이름: 초} 형식이어야 합니다.")
+        return cls(
+            float(os.environ.get("NOTION_TASK_TIMEOUT", DEFAULT_TIMEOUT)),
+            {name: float(seconds) for name, seconds in per_tool.items()},
+        )
+
+    def for_tool(self, name: str, requested: float | None = None) -> float | None:
+        """도구 호출의 제한 시간 (초). 인자로 지정한 값이 설정보다 우선하며 MAX_TIMEOUT을 넘지 않는다.
+
+        Raises:
+            ValueError: 지정한 값이 0 이하.
+        """
+        if requested is not None:
+            if float(requested) <= 0:
+                raise ValueError("timeout은 0보다 커야 합니다.")
+            return min(float(requested), MAX_TIMEOUT)
+        return self.per_tool.get(name, self.default) or None
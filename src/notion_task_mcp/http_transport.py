@@ -0,0 +1,104 @@
+"""Streamable HTTP 전송.
+
+하나의 서버 프로세스가 여러 MCP 세션(에디터, 데스크톱 앱 등)을 동시에 처리한다.
+모든 세션이 같은 Server 인스턴스를 쓰므로 Notion 클라이언트, 캐시, 연결 풀, 속도 제한기가 공유된다.
+외부 서비스 없이 로컬에서만 동작하며, 기본으로 루프백 주소에만 바인드한다.
+"""
+
+import ipaddress
+import logging
+import socket
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import uvicorn
+from mcp.server import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.transport_security import TransportSecuritySettings
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# 기본 바인드 주소/포트 (NOTION_TASK_HOST, NOTION_TASK_PORT)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# MCP 엔드포인트 경로
+MCP_PATH = "/mcp"
+# 동시 HTTP 연결 수 상한 기본값 (NOTION_TASK_HTTP_MAX_CONNECTIONS). 넘으면 503 응답
+DEFAULT_MAX_CONNECTIONS = 64
+
+
+def is_loopback(host: str) -> bool:
+    """루프백 주소(또는 localhost)인지 여부."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def security_settings(host: str, port: int) -> TransportSecuritySettings:
+    """DNS 리바인딩 방지 설정. 루프백에 바인드하면 로컬 Host/Origin만 허용한다."""
+    if not is_loopback(host):
+        logger.warning("루프백이 아닌 주소(%s)에 바인드합니다. Host 헤더 검사를 하지 않습니다.", host)
+        return TransportSecuritySettings(enable_dns_rebinding_protection=False)
+    hosts = [f"{name}:{port}" for name in ("127.0.0.1", "localhost", "[::1]")]
+    return TransportSecuritySettings(
+        enable_dns_rebinding_protection=True,
+        allowed_hosts=hosts,
+        allowed_origins=[f"http://{host}" for host in hosts],
+    )
+
+
+def create_http_app(server: Server, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> Starlette:
+    """MCP 서버를 Streamable HTTP(MCP_PATH)로 노출하는 ASGI 앱 생성.
+
+    Args:
+        server: 모든 세션이 공유할 MCP 서버.
+        host: 바인드 주소 (허용할 Host 헤더 결정).
+        port: 포트 (허용할 Host 헤더 결정).
+    """
+    manager = StreamableHTTPSessionManager(app=server, security_settings=security_settings(host, port))
+
+    async def handle(scope: Scope, receive: Receive, send: Send) -> None:
+        await manager.handle_request(scope, receive, send)
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with manager.run():
+            yield
+
+    return Starlette(routes=[Mount(MCP_PATH, app=handle)], lifespan=lifespan)
+
+
+async def serve_http(
+    server: Server,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    sock: socket.socket | None = None,
+) -> None:
+    """Streamable HTTP로 서버 실행 (종료될 때까지 대기).
+
+    Args:
+        server: MCP 서버.
+        host: 바인드 주소.
+        port: 포트.
+        max_connections: 동시 HTTP 연결 수 상한 (SSE 스트림 포함). 넘는 요청은 503.
+        sock: 이미 바인드한 소켓 (테스트에서 임의 포트 사용 시). 있으면 host/port 대신 사용.
+    """
+    if sock is not None:
+        host, port = sock.getsockname()[:2]
+    config = uvicorn.Config(
+        create_http_app(server, host, port),
+        host=host,
+        port=port,
+        limit_concurrency=max_connections,
+        log_level="warning",
+        lifespan="on",
+    )
+    logger.info("MCP Streamable HTTP: http://%s:%d%s", host, port, MCP_PATH)
+    await uvicorn.Server(config).serve(sockets=[sock] if sock is not None else None)
@@ -0,0 +1,234 @@
+"""서버 내장 메트릭.
+
+도구별/Notion 엔드포인트별 지연 시간 히스토그램과 요청 바이트, 재시도, 캐시 적중 카운터를 모은다.
+`server_stats` 도구로 조회하거나 Prometheus 텍스트 형식 파일로 내보낼 수 있다.
+"""
+
+import os
+import tempfile
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# 지연 시간 버킷 (초). 페이지 하나 파싱(수십 µs)부터 느린 API 응답(수 초)까지 한 벌로 사용
+DEFAULT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+
+PROMETHEUS_PREFIX = "notion_task_mcp"
+
+
+class Histogram:
+    """누적 버킷 없이 구간별 개수를 세는 고정 버킷 히스토그램."""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf 구간
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """값 하나 기록."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float | None:
+        """버킷 안에서 선형 보간한 분위수 추정값 (Prometheus histogram_quantile과 같은 방식)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                if i == len(self.buckets):
+                    return self.max
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = min(self.buckets[i], self.max)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        """요약 통계 (밀리초)."""
+
+        def ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "count": self.count,
+            "avg_ms": ms(self.sum / self.count if self.count else None),
+            "p50_ms": ms(self.quantile(0.5)),
+            "p95_ms": ms(self.quantile(0.95)),
+            "p99_ms": ms(self.quantile(0.99)),
+            "max_ms": ms(self.max if self.count else None),
+        }
+
+
+class Metrics:
+    """프로세스 단위 메트릭 저장소.
+
+    NotionTaskClient 하나가 인스턴스 하나를 갖고, 도구 디스패치와 API 호출 경로가 함께 기록한다.
+    이벤트 루프 스레드에서만 갱신하므로 잠금은 두지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.tool_seconds: dict[str, Histogram] = {}
+        self.tool_errors: Counter[str] = Counter()
+        self.stage_seconds: dict[str, Histogram] = {}
+        self.notion_seconds: dict[str, Histogram] = {}
+        self.notion_errors: Counter[str] = Counter()
+        self.request_bytes: Counter[str] = Counter()
+        self.response_bytes: Counter[str] = Counter()
+        self.retries: Counter[str] = Counter()
+        self.rate_limited: Counter[str] = Counter()
+        self.cache_hits: Counter[str] = Counter()
+        self.cache_misses: Counter[str] = Counter()
+
+    @staticmethod
+    def _histogram(family: dict[str, Histogram], label: str) -> Histogram:
+        histogram = family.get(label)
+        if histogram is None:
+            histogram = family[label] = Histogram()
+        return histogram
+
+    def observe_tool(self, tool: str, seconds: float, error: bool = False) -> None:
+        """도구 호출 하나의 전체 처리 시간 기록."""
+        self._histogram(self.tool_seconds, tool).observe(seconds)
+        if error:
+            self.tool_errors[tool] += 1
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """파싱/직렬화/속도 제한 대기 등 처리 단계별 시간 기록."""
+        self._histogram(self.stage_seconds, stage).observe(seconds)
+
+    def observe_notion(self, endpoint: str, seconds: float, error: bool = False) -> None:
+        """Notion API 요청 하나의 응답 시간 기록 (속도 제한 대기 제외)."""
+        self._histogram(self.notion_seconds, endpoint).observe(seconds)
+        if error:
+            self.notion_errors[endpoint] += 1
+
+    def record_bytes(self, endpoint: str, sent: int, received: int) -> None:
+        """요청/응답 본문 크기 기록."""
+        self.request_bytes[endpoint] += sent
+        self.response_bytes[endpoint] += received
+
+    def record_rate_limited(self, endpoint: str, retried: bool) -> None:
+        """429 응답 기록. retried가 True면 재시도 횟수도 함께 센다."""
+        self.rate_limited[endpoint] += 1
+        if retried:
+            self.retries[endpoint] += 1
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """캐시 조회 결과 기록."""
+        if hit:
+            self.cache_hits[cache] += 1
+        else:
+            self.cache_misses[cache] += 1
+
+    # ============== 내보내기 ==============
+
+    def snapshot(self) -> dict[str, Any]:
+        """server_stats 도구 응답용 요약."""
+        caches = {}
+        for name in sorted(self.cache_hits.keys() | self.cache_misses.keys()):
+            hits, misses = self.cache_hits[name], self.cache_misses[name]
+            caches[name] = {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 4)}
+
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "tools": {
+                name: {**h.summary(), "errors": self.tool_errors[name]}
+                for name, h in sorted(self.tool_seconds.items())
+            },
+            "stages": {name: h.summary() for name, h in sorted(self.stage_seconds.items())},
+            "notion": {
+                name: {
+                    **h.summary(),
+                    "errors": self.notion_errors[name],
+                    "request_bytes": self.request_bytes[name],
+                    "response_bytes": self.response_bytes[name],
+                    "rate_limited": self.rate_limited[name],
+                    "retries": self.retries[name],
+                }
+                for name, h in sorted(self.notion_seconds.items())
+            },
+            "caches": caches,
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 직렬화."""
+        lines: list[str] = []
+        _histograms(lines, "tool_duration_seconds", "도구 호출 처리 시간", "tool", self.tool_seconds)
+        _counters(lines, "tool_errors_total", "도구 호출 오류 수", "tool", self.tool_errors)
+        _histograms(lines, "stage_duration_seconds", "처리 단계별 시간", "stage", self.stage_seconds)
+        _histograms(
+            lines, "notion_request_duration_seconds", "Notion API 응답 시간", "endpoint", self.notion_seconds
+        )
+        _counters(lines, "notion_errors_total", "Notion API 오류 수", "endpoint", self.notion_errors)
+        _counters(lines, "notion_request_bytes_total", "Notion API 요청 본문 바이트", "endpoint", self.request_bytes)
+        _counters(
+            lines, "notion_response_bytes_total", "Notion API 응답 본문 바이트", "endpoint", self.response_bytes
+        )
+        _counters(lines, "notion_rate_limited_total", "Notion API 429 응답 수", "endpoint", self.rate_limited)
+        _counters(lines, "notion_retries_total", "Notion API 재시도 수", "endpoint", self.retries)
+
+        name = f"{PROMETHEUS_PREFIX}_cache_requests_total"
+        lines += [f"# HELP {name} 캐시 조회 수", f"# TYPE {name} counter"]
+        for result, counter in (("hit", self.cache_hits), ("miss", self.cache_misses)):
+            for cache, value in sorted(counter.items()):
+                lines.append(f'{name}{{cache="{_escape(cache)}",result="{result}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path, text: str | None = None) -> None:
+        """Prometheus 텍스트 파일로 원자적 기록 (node_exporter textfile collector 등에서 읽음).
+
+        Args:
+            path: 파일 경로.
+            text: 이벤트 루프에서 미리 직렬화한 내용. 없으면 현재 상태로 생성.
+        """
+        data = (self.to_prometheus() if text is None else text).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _counters(lines: list[str], metric: str, help_text: str, label: str, counter: Counter[str]) -> None:
+    name = f"{PROMETHEUS_PREFIX}_{metric}"
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for key, value in sorted(counter.items()):
+        lines.append(f'{name}{{{label}="{_escape(key)}"}} {value}')
+
+
+def _histograms(lines: list[str], metric: str, help_text: str, label: str, family: dict[str, Histogram]) -> None:
+    name = f"{PROMETHEUS_PREFIX}_{metric}"
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for key, histogram in sorted(family.items()):
+        key = _escape(key)
+        cumulative = 0
+        bounds: Iterable[str] = [*(repr(b) for b in histogram.buckets), "+Inf"]
+        for bound, count in zip(bounds, histogram.counts, strict=True):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{label}="{key}",le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{{label}="{key}"}} {histogram.sum!r}')
+        lines.append(f'{name}_count{{{label}="{key}"}} {histogram.count}')
@@ -1,9 +1,15 @@
 """Task 데이터 모델 정의."""
 
 from datetime import date
-from enum import Enum
+from enum import Enum, StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DeferredModel(BaseModel):
+    """검증기/스키마 생성을 첫 사용 시점으로 미루는 기본 모델 (서버 기동 시간 단축)."""
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class TaskType(str, Enum):
@@ -56,7 +62,15 @@ class Priority(str, Enum):
     HIGH = "높음"
 
 
-class Task(BaseModel):
+class SortField(StrEnum):
+    """목록 정렬 기준."""
+
+    START_DATE = "start_date"
+    END_DATE = "end_date"
+    LAST_EDITED_TIME = "last_edited_time"
+
+
+class Task(DeferredModel):
     """Task 모델."""
 
     id: str = Field(description="Notion 페이지 ID")
@@ -67,6 +81,7 @@ class Task(BaseModel):
     priority: Priority | None = Field(default=None, description="우선순위")
     assignee: str | None = Field(default=None, description="담당자 ID")
     assignee_name: str | None = Field(default=None, description="담당자 이름")
+    assignee_ids: list[str] = Field(default_factory=list, description="전체 담당자 ID 목록")
     creator: str | None = Field(default=None, description="생성자 이름")
     start_date: date | None = Field(default=None, description="시작일")
     end_date: date | None = Field(default=None, description="종료일")
@@ -74,6 +89,8 @@ class Task(BaseModel):
     services: list[str] = Field(default_factory=list, description="서비스 목록")
     parent_id: str | None = Field(default=None, description="상위 항목 ID")
     children_ids: list[str] = Field(default_factory=list, description="하위 항목 ID 목록")
+    last_edited_time: str | None = Field(default=None, description="마지막 수정 시각 (ISO 8601)")
+    database: str | None = Field(default=None, description="원본 DB 이름 (여러 DB를 함께 조회할 때)")
 
     @property
     def status_group(self) -> StatusGroup:
@@ -81,7 +98,7 @@ class Task(BaseModel):
         return STATUS_GROUP_MAP[self.status]
 
 
-class TaskCreate(BaseModel):
+class TaskCreate(DeferredModel):
     """Task 생성 요청."""
 
     title: str = Field(description="제목")
@@ -96,7 +113,7 @@ class TaskCreate(BaseModel):
     parent_id: str | None = Field(default=None, description="상위 항목 ID")
 
 
-class TaskUpdate(BaseModel):
+class TaskUpdate(DeferredModel):
     """Task 수정 요청."""
 
     title: str | None = Field(default=None, description="제목")
@@ -111,7 +128,13 @@ class TaskUpdate(BaseModel):
     parent_id: str | None = Field(default=None, description="상위 항목 ID")
 
 
-class TaskFilter(BaseModel):
+class TaskBatchUpdate(TaskUpdate):
+    """일괄 수정 요청 항목 (Task별로 다른 값 지정)."""
+
+    task_id: str = Field(description="Notion 페이지 ID")
+
+
+class TaskFilter(DeferredModel):
     """Task 필터 조건."""
 
     task_type: TaskType | None = Field(default=None, description="타입 필터")
@@ -126,3 +149,22 @@ class TaskFilter(BaseModel):
     end_date_from: date | None = Field(default=None, description="종료일 시작 범위")
     end_date_to: date | None = Field(default=None, description="종료일 종료 범위")
     parent_id: str | None = Field(default=None, description="상위 항목 ID 필터")
+
+
+class BatchItemResult(DeferredModel):
+    """일괄 처리 항목별 결과."""
+
+    task_id: str = Field(description="Notion 페이지 ID")
+    success: bool = Field(description="성공 여부")
+    task: Task | None = Field(default=None, description="처리 후 Task")
+    error: str | None = Field(default=None, description="실패 사유")
+
+
+class TaskContent(DeferredModel):
+    """Task 페이지 본문."""
+
+    task_id: str = Field(description="Notion 페이지 ID")
+    markdown: str = Field(description="본문 (Markdown)")
+    truncated: bool = Field(default=False, description="크기 제한으로 잘렸는지 여부")
+    block_count: int = Field(default=0, description="받아 온 블록 수")
+    last_edited_time: str | None = Field(default=None, description="페이지 마지막 수정 시각 (캐시 기준)")
@@ -1,21 +1,70 @@
 """Notion API 클라이언트 래퍼."""
 
+import asyncio
 import os
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextvars import ContextVar
 from datetime import date
-from typing import Any
-
-from notion_client import AsyncClient
+from enum import Enum
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
+from .content import plain_text_length, render_blocks
+from .deadline import report
+from .metrics import Metrics
 from .models import (
     STATUS_GROUP_MAP,
+    BatchItemResult,
     Priority,
+    SortField,
     Task,
+    TaskBatchUpdate,
+    TaskContent,
     TaskCreate,
     TaskFilter,
     TaskStatus,
     TaskType,
     TaskUpdate,
 )
+from .rate_limit import RateLimiter
+from .schema import DatabaseSchema, SchemaError, normalize
+from .store import TaskStore, sort_tasks
+
+if TYPE_CHECKING:
+    import httpx
+    from notion_client import AsyncClient
+
+# 현재 진행 중인 Notion API 요청의 엔드포인트 이름 (HTTP 이벤트 훅에서 바이트 수 집계에 사용)
+_current_endpoint: ContextVar[str] = ContextVar("notion_endpoint", default="unknown")
+
+
+@cache
+def _endpoint_label(owner: str, method: str) -> str:
+    resource = owner.removesuffix("Endpoint")
+    return ".".join([*(word.lower() for word in re.findall(r"[A-Z][a-z0-9]*", resource)), method])
+
+
+class DatabasesEndpoint:
+    """databases.query 호환 엔드포인트.
+
+    notion-client 2.5부터 databases.query가 data_sources.query로 옮겨져 제거되었다.
+    이 프로젝트는 Notion-Version 2022-06-28의 POST /v1/databases/{id}/query를 그대로 사용한다.
+    """
+
+    def __init__(self, sdk: "AsyncClient") -> None:
+        self.sdk = sdk
+
+    async def query(self, database_id: str, **body: Any) -> Any:
+        return await self.sdk.request(path=f"databases/{database_id}/query", method="POST", body=body)
+
+
+def endpoint_name(method: Callable[..., Any]) -> str:
+    """SDK 메서드의 엔드포인트 이름 (예: PagesEndpoint.retrieve → "pages.retrieve")."""
+    owner = type(getattr(method, "__self__", None)).__name__
+    return _endpoint_label(owner, getattr(method, "__name__", "request"))
 
 
 class NotionTaskClient:
@@ -34,17 +83,80 @@ class NotionTaskClient:
     PROP_SERVICES = "서비스"
     PROP_PARENT = "상위항목"
     PROP_CHILDREN = "하위항목"
+    PROP_NO = "No"
+
+    # DB 스키마로 실제 이름을 찾을 속성. 타입이 지정된 속성은 DB에 그 타입 속성이 하나뿐이면 이름이 달라도 찾는다.
+    SCHEMA_PROPERTIES: dict[str, str | None] = {
+        "PROP_TITLE": "title",
+        "PROP_TYPE": None,
+        "PROP_STATUS": "status",
+        "PROP_PRIORITY": None,
+        "PROP_ASSIGNEE": None,
+        "PROP_CREATOR": "created_by",
+        "PROP_START_DATE": None,
+        "PROP_END_DATE": None,
+        "PROP_LABELS": None,
+        "PROP_SERVICES": None,
+        "PROP_PARENT": None,
+        "PROP_CHILDREN": None,
+        "PROP_NO": "unique_id",
+    }
+    # select/status 속성 → 값 enum
+    SCHEMA_ENUMS: dict[str, type[Enum]] = {"PROP_TYPE": TaskType, "PROP_STATUS": TaskStatus, "PROP_PRIORITY": Priority}
+
+    # 429 응답 재시도 설정
+    MAX_RETRIES = 3
+    DEFAULT_RETRY_AFTER = 1.0
+
+    # Notion API 버전 (CLI와 같은 버전, databases/{id}/query 사용)
+    NOTION_VERSION = "2022-06-28"
+
+    # 로컬 복제본으로 목록 조회 시, 이보다 오래되면 먼저 증분 동기화 (초)
+    STORE_MAX_AGE = 10.0
+
+    # DB 스키마 캐시 유지 시간 (초, 환경변수 NOTION_SCHEMA_TTL). 0이면 스키마를 조회하지 않는다.
+    SCHEMA_TTL = 300.0
+
+    # 페이지 객체는 relation/title 항목을 이 개수까지만 담는다. 넘으면 페이지 속성 엔드포인트로 전체를 받는다.
+    INLINE_ITEM_LIMIT = 25
+    # 전체 값을 받아 올 수 있는 (잘릴 수 있는) 속성
+    TRUNCATABLE_PROPERTIES = ("PROP_TITLE", "PROP_PARENT", "PROP_CHILDREN")
+    # 받아 온 전체 속성 값 캐시 항목 수 ((페이지 ID, 속성) 단위, last_edited_time이 같을 때만 재사용)
+    PROPERTY_CACHE_SIZE = 1024
+
+    # 페이지 본문 조회 기본값: 하위 블록 깊이, 최대 글자 수, 캐시 항목 수 (last_edited_time이 같을 때만 재사용)
+    CONTENT_MAX_DEPTH = 3
+    CONTENT_MAX_CHARS = 20_000
+    CONTENT_CACHE_SIZE = 128
+    # 하위 블록을 따라가지 않는 블록 (별도 페이지/DB)
+    _OPAQUE_BLOCKS = ("child_page", "child_database")
 
     def __init__(
         self,
         api_key: str | None = None,
         database_id: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        metrics: Metrics | None = None,
+        base_url: str | None = None,
+        database_name: str | None = None,
+        property_names: dict[str, str] | None = None,
     ) -> None:
         """초기화.
 
         Args:
             api_key: Notion API 키. 없으면 환경변수에서 읽음.
             database_id: Notion 데이터베이스 ID. 없으면 환경변수에서 읽음.
+            rate_limiter: 공용 속도 제한기. 없으면 환경변수
+                (NOTION_RATE_LIMIT, NOTION_MAX_CONCURRENCY) 기준으로 생성.
+            metrics: 메트릭 저장소. 없으면 새로 생성.
+            base_url: Notion API 주소 (/v1 제외). 없으면 환경변수 NOTION_BASE_URL, 그것도 없으면 공식 API.
+                로컬 가짜 서버(tests/fake_notion.py)로 테스트할 때 사용.
+            database_name: DB 이름. 지정하면 조회한 Task의 database 필드에 붙는다 (여러 DB를 함께 조회할 때).
+            property_names: 이 DB의 속성 이름 ({"status": "State"}처럼 PROP_* 이름의 소문자 → 실제 이름).
+                스키마를 받으면 이 이름을 기준으로 찾는다.
+
+        Raises:
+            ValueError: API 키/DB ID가 없거나 알 수 없는 속성 키.
         """
         self.api_key = api_key or os.environ.get("NOTION_API_KEY")
         self.database_id = database_id or os.environ.get("NOTION_DATABASE_ID")
@@ -54,7 +166,185 @@ class NotionTaskClient:
         if not self.database_id:
             raise ValueError("NOTION_DATABASE_ID가 필요합니다.")
 
-        self.client = AsyncClient(auth=self.api_key)
+        self.rate_limiter = rate_limiter or RateLimiter(
+            requests_per_second=float(os.environ.get("NOTION_RATE_LIMIT", "3")),
+            max_concurrency=int(os.environ.get("NOTION_MAX_CONCURRENCY", "3")),
+        )
+        self.metrics = metrics or Metrics()
+        self.database_name = database_name
+        # PROP_* → 설정된 속성 이름
+        self._property_names: dict[str, str] = {}
+        for key, name in (property_names or {}).items():
+            attr = f"PROP_{key.upper()}"
+            if attr not in self.SCHEMA_PROPERTIES:
+                raise ValueError(f"알 수 없는 속성 키입니다: {key}")
+            self._property_names[attr] = name
+            setattr(self, attr, name)
+        self.base_url = (base_url or os.environ.get("NOTION_BASE_URL") or "https://api.notion.com").rstrip("/")
+        self._client: AsyncClient | None = None
+        self.store: TaskStore | None = None
+        self._sync_lock: asyncio.Lock | None = None
+        self.schema_ttl = float(os.environ.get("NOTION_SCHEMA_TTL", self.SCHEMA_TTL))
+        self.schema: DatabaseSchema | None = None
+        self._schema_lock: asyncio.Lock | None = None
+        # 옵션 이름 → enum 값 (스키마를 받으면 띄어쓰기만 다른 DB 옵션 이름도 추가)
+        self._enum_values: dict[type[Enum], dict[str, Any]] = {
+            enum: {member.value: member for member in enum} for enum in self.SCHEMA_ENUMS.values()
+        }
+        # (페이지 ID, 속성 이름) → (last_edited_time, 전체 항목 목록)
+        self._property_cache: OrderedDict[tuple[str, str], tuple[str | None, list[Any]]] = OrderedDict()
+        # (페이지 ID, 깊이, 글자 수) → 본문
+        self._content_cache: OrderedDict[tuple[str, int, int], TaskContent] = OrderedDict()
+
+    @property
+    def client(self) -> "AsyncClient":
+        """Notion SDK 클라이언트.
+
+        SDK import와 HTTP 클라이언트(SSL 컨텍스트) 생성은 비용이 커서 첫 사용 시점으로 미룬다.
+        """
+        if self._client is None:
+            self._client = self._create_sdk_client()
+        return self._client
+
+    @client.setter
+    def client(self, value: "AsyncClient") -> None:
+        self._client = value
+
+    def _create_sdk_client(self) -> "AsyncClient":
+        """Notion SDK 클라이언트 생성.
+
+        요청/응답 바이트 수를 집계하도록 HTTP 이벤트 훅을 건 httpx 클라이언트를 넘긴다.
+        """
+        import httpx
+        from notion_client import AsyncClient
+
+        http_client = httpx.AsyncClient(
+            event_hooks={"request": [self._on_http_request], "response": [self._on_http_response]}
+        )
+        return AsyncClient(
+            client=http_client,
+            auth=self.api_key,
+            base_url=self.base_url,
+            notion_version=self.NOTION_VERSION,
+        )
+
+    @property
+    def _databases_query(self) -> Callable[..., Awaitable[Any]]:
+        """SDK의 databases.query. 없는 SDK 버전이면 호환 엔드포인트."""
+        query = getattr(self.client.databases, "query", None)
+        return query if query is not None else DatabasesEndpoint(self.client).query
+
+    async def _on_http_request(self, request: "httpx.Request") -> None:
+        self.metrics.record_bytes(_current_endpoint.get(), len(request.content), 0)
+
+    async def _on_http_response(self, response: "httpx.Response") -> None:
+        # SDK가 곧바로 본문을 읽으므로 미리 읽어도 추가 비용은 없다
+        await response.aread()
+        self.metrics.record_bytes(_current_endpoint.get(), 0, len(response.content))
+
+    async def warm_up(self) -> None:
+        """SDK 클라이언트를 백그라운드 스레드에서 미리 생성.
+
+        MCP initialize 핸드셰이크를 막지 않으면서 첫 도구 호출의 지연을 줄이기 위해 사용한다.
+        """
+        if self._client is None:
+            client = await asyncio.to_thread(self._create_sdk_client)
+            if self._client is None:
+                self._client = client
+
+    async def aclose(self) -> None:
+        """HTTP 연결을 닫고 캐시를 비운다. 이후 요청이 오면 SDK 클라이언트를 다시 만든다."""
+        client, self._client = self._client, None
+        self._property_cache.clear()
+        self._content_cache.clear()
+        if client is not None:
+            await client.aclose()
+
+    async def _request(self, method: Callable[..., Awaitable[Any]], **kwargs: Any) -> Any:
+        """속도 제한을 적용하여 Notion API 호출.
+
+        429(rate_limited) 응답은 Retry-After 만큼 기다린 뒤 재시도한다.
+        엔드포인트별 응답 시간, 429/재시도 횟수, 속도 제한 대기 시간을 메트릭에 기록한다.
+
+        Args:
+            method: 호출할 SDK 메서드 (예: self.client.pages.update).
+            **kwargs: SDK 메서드 인자.
+
+        Returns:
+            Notion API 응답.
+        """
+        from notion_client import APIErrorCode, APIResponseError
+
+        endpoint = endpoint_name(method)
+        token = _current_endpoint.set(endpoint)
+        try:
+            attempt = 0
+            while True:
+                waiting = time.perf_counter()
+                async with self.rate_limiter:
+                    started = time.perf_counter()
+                    self.metrics.observe_stage("rate_limit_wait", started - waiting)
+                    failed = True
+                    try:
+                        response = await method(**kwargs)
+                        failed = False
+                        return response
+                    except APIResponseError as e:
+                        if e.code != APIErrorCode.RateLimited:
+                            raise
+                        retry = attempt < self.MAX_RETRIES
+                        self.metrics.record_rate_limited(endpoint, retried=retry)
+                        if not retry:
+                            raise
+                        retry_after = float(e.headers.get("retry-after", self.DEFAULT_RETRY_AFTER))
+                    finally:
+                        self.metrics.observe_notion(endpoint, time.perf_counter() - started, error=failed)
+                attempt += 1
+                await asyncio.sleep(retry_after)
+        finally:
+            _current_endpoint.reset(token)
+
+    async def ensure_schema(self) -> DatabaseSchema | None:
+        """DB 스키마를 조회해 캐시 (schema_ttl 동안 재사용). schema_ttl이 0 이하면 None.
+
+        동시에 여러 요청이 들어와도 databases.retrieve는 한 번만 보낸다.
+        """
+        if self.schema_ttl <= 0:
+            return None
+        if self.schema is not None and not self.schema.is_expired(self.schema_ttl):
+            return self.schema
+        if self._schema_lock is None:
+            self._schema_lock = asyncio.Lock()
+        async with self._schema_lock:
+            if self.schema is None or self.schema.is_expired(self.schema_ttl):
+                response = await self._request(self.client.databases.retrieve, database_id=self.database_id)
+                self.apply_schema(DatabaseSchema.from_response(response))
+        return self.schema
+
+    def apply_schema(self, schema: DatabaseSchema) -> None:
+        """스키마 적용: 속성 이름(PROP_*)과 enum 옵션 이름을 실제 DB 이름에 맞춘다."""
+        for attr, prop_type in self.SCHEMA_PROPERTIES.items():
+            if found := schema.find(self._property_names.get(attr, getattr(type(self), attr)), prop_type):
+                setattr(self, attr, found)
+        for attr, enum in self.SCHEMA_ENUMS.items():
+            members = {normalize(member.value): member for member in enum}
+            values = {member.value: member for member in enum}
+            for option in schema.options(getattr(self, attr)):
+                if member := members.get(normalize(option)):
+                    values[option] = member
+            self._enum_values[enum] = values
+        self.schema = schema
+
+    def _enum(self, enum: type[Enum], name: str) -> Any:
+        """DB 옵션 이름을 enum 값으로 변환."""
+        return self._enum_values[enum].get(name) or enum(name)
+
+    def _parse_page(self, page: dict[str, Any]) -> Task:
+        """_parse_task와 같으며 파싱 시간을 메트릭에 기록."""
+        started = time.perf_counter()
+        task = self._parse_task(page)
+        self.metrics.observe_stage("parse", time.perf_counter() - started)
+        return task
 
     def _parse_task(self, page: dict[str, Any]) -> Task:
         """Notion 페이지를 Task 모델로 변환."""
@@ -71,30 +361,32 @@ class NotionTaskClient:
         task_type = TaskType.TASK
         if type_prop.get("select"):
             type_name = type_prop["select"]["name"]
-            task_type = TaskType(type_name)
+            task_type = self._enum(TaskType, type_name)
 
         # 상태 추출
         status_prop = props.get(self.PROP_STATUS, {})
         status = TaskStatus.NOT_STARTED
         if status_prop.get("status"):
             status_name = status_prop["status"]["name"]
-            status = TaskStatus(status_name)
+            status = self._enum(TaskStatus, status_name)
 
         # 우선순위 추출
         priority_prop = props.get(self.PROP_PRIORITY, {})
         priority = None
         if priority_prop.get("select"):
             priority_name = priority_prop["select"]["name"]
-            priority = Priority(priority_name)
+            priority = self._enum(Priority, priority_name)
 
         # 담당자 추출
         assignee_prop = props.get(self.PROP_ASSIGNEE, {})
         assignee = None
         assignee_name = None
+        assignee_ids = []
         if assignee_prop.get("people") and len(assignee_prop["people"]) > 0:
             person = assignee_prop["people"][0]
             assignee = person.get("id")
             assignee_name = person.get("name")
+            assignee_ids = [p["id"] for p in assignee_prop["people"] if p.get("id")]
 
         # 생성자 추출
         creator_prop = props.get(self.PROP_CREATOR, {})
@@ -142,8 +434,8 @@ class NotionTaskClient:
 
         # No (unique_id) 추출
         no = None
-        if "No" in props and props["No"].get("unique_id"):
-            unique_id = props["No"]["unique_id"]
+        if props.get(self.PROP_NO, {}).get("unique_id"):
+            unique_id = props[self.PROP_NO]["unique_id"]
             prefix = unique_id.get("prefix", "")
             number = unique_id.get("number", "")
             no = f"{prefix}-{number}" if prefix else str(number)
@@ -157,6 +449,7 @@ class NotionTaskClient:
             priority=priority,
             assignee=assignee,
             assignee_name=assignee_name,
+            assignee_ids=assignee_ids,
             creator=creator,
             start_date=start_date,
             end_date=end_date,
@@ -164,6 +457,8 @@ class NotionTaskClient:
             services=services,
             parent_id=parent_id,
             children_ids=children_ids,
+            last_edited_time=page.get("last_edited_time"),
+            database=self.database_name,
         )
 
     def _build_properties(
@@ -221,10 +516,16 @@ class NotionTaskClient:
         if data.parent_id is not None:
             props[self.PROP_PARENT] = {"relation": [{"id": data.parent_id}]}
 
+        if self.schema is not None:
+            self.schema.conform_properties(props)
         return props
 
     def _build_filter(self, filter_: TaskFilter) -> dict[str, Any] | None:
-        """필터 조건을 Notion 필터 형식으로 변환."""
+        """필터 조건을 Notion 필터 형식으로 변환.
+
+        Raises:
+            SchemaError: 상태 그룹의 상태가 하나도 DB에 없음 (조건을 빼면 전체가 조회되므로).
+        """
         conditions: list[dict[str, Any]] = []
 
         if filter_.task_type:
@@ -244,6 +545,11 @@ class NotionTaskClient:
             group_statuses = [
                 s for s, g in STATUS_GROUP_MAP.items() if g == filter_.status_group
             ]
+            if self.schema is not None:
+                # DB에 없는 상태는 조건에서 뺀다 (그룹 필터가 실패하지 않도록)
+                group_statuses = [s for s in group_statuses if self.schema.has_option(self.PROP_STATUS, s.value)]
+                if not group_statuses:
+                    raise SchemaError(f"'{filter_.status_group.value}' 그룹에 해당하는 상태가 DB에 없습니다.")
             status_conditions = [
                 {"property": self.PROP_STATUS, "status": {"equals": s.value}}
                 for s in group_statuses
@@ -317,9 +623,92 @@ class NotionTaskClient:
 
         if not conditions:
             return None
-        if len(conditions) == 1:
-            return conditions[0]
-        return {"and": conditions}
+        notion_filter = conditions[0] if len(conditions) == 1 else {"and": conditions}
+        if self.schema is not None:
+            self.schema.conform_filter(notion_filter)
+        return notion_filter
+
+    def _build_sorts(self, sort_by: SortField, descending: bool = False) -> list[dict[str, Any]]:
+        """정렬 기준을 Notion sorts로 변환 (store.sort_tasks와 같은 순서)."""
+        direction = "descending" if descending else "ascending"
+        if sort_by == SortField.LAST_EDITED_TIME:
+            return [{"timestamp": "last_edited_time", "direction": direction}]
+        prop = self.PROP_START_DATE if sort_by == SortField.START_DATE else self.PROP_END_DATE
+        return [{"property": prop, "direction": direction}]
+
+    def _is_truncated(self, prop: dict[str, Any]) -> bool:
+        """페이지 객체의 속성 값이 잘렸는지 여부.
+
+        relation은 has_more로 알려 주고, title은 표시가 없으므로 상한만큼 찼으면 잘렸을 수 있다고 본다.
+        """
+        if prop.get("type") == "relation" or "relation" in prop:
+            return bool(prop.get("has_more"))
+        return len(prop.get("title") or []) >= self.INLINE_ITEM_LIMIT
+
+    async def _fetch_property_items(self, page_id: str, property_id: str) -> list[Any]:
+        """페이지 속성 엔드포인트에서 속성 항목 전체를 커서를 따라가며 받는다."""
+        items: list[Any] = []
+        params: dict[str, Any] = {"page_id": page_id, "property_id": property_id, "page_size": 100}
+        while True:
+            response = await self._request(self.client.pages.properties.retrieve, **params)
+            items.extend(item[item["type"]] for item in response["results"])
+            if not response.get("has_more"):
+                return items
+            params["start_cursor"] = response["next_cursor"]
+
+    async def _complete_properties(self, pages: list[dict[str, Any]]) -> None:
+        """잘린 relation/title 속성을 전체 값으로 채운다 (제자리 수정).
+
+        잘린 속성이 있는 페이지만 요청하며, 여러 페이지/속성은 공용 속도 제한 아래 동시에 받는다.
+        받은 값은 (페이지, 속성)별로 last_edited_time과 함께 캐시해 페이지가 바뀌지 않았으면 다시 받지 않는다.
+        """
+        missing: list[tuple[dict[str, Any], str]] = []
+        for page in pages:
+            props = page.get("properties", {})
+            for attr in self.TRUNCATABLE_PROPERTIES:
+                name = getattr(self, attr)
+                prop = props.get(name)
+                if not prop or not self._is_truncated(prop):
+                    continue
+                cached = self._property_cache.get((page["id"], name))
+                hit = cached is not None and cached[0] == page.get("last_edited_time")
+                self.metrics.record_cache("property", hit)
+                if cached is not None and hit:
+                    self._property_cache.move_to_end((page["id"], name))
+                    self._fill_property(prop, cached[1])
+                else:
+                    missing.append((page, name))
+        if not missing:
+            return
+
+        async def fetch(page: dict[str, Any], name: str) -> None:
+            prop = page["properties"][name]
+            property_id = prop.get("id") or (self.schema.property_id(name) if self.schema else name)
+            items = await self._fetch_property_items(page["id"], property_id)
+            self._fill_property(prop, items)
+            self._property_cache[(page["id"], name)] = (page.get("last_edited_time"), items)
+            self._property_cache.move_to_end((page["id"], name))
+            while len(self._property_cache) > self.PROPERTY_CACHE_SIZE:
+                self._property_cache.popitem(last=False)
+
+        await asyncio.gather(*(fetch(page, name) for page, name in missing))
+
+    def _forget_properties(self, *page_ids: str | None) -> None:
+        """직접 수정한 페이지의 전체 속성 캐시를 버린다.
+
+        last_edited_time은 분 단위라 같은 분 안의 수정은 구분되지 않기 때문이다.
+        """
+        for key in [key for key in self._property_cache if key[0] in page_ids]:
+            del self._property_cache[key]
+
+    @staticmethod
+    def _fill_property(prop: dict[str, Any], items: list[Any]) -> None:
+        """속성 값을 받아 온 전체 항목으로 교체."""
+        if "relation" in prop:
+            prop["relation"] = list(items)
+            prop["has_more"] = False
+        else:
+            prop["title"] = list(items)
 
     async def get_task(self, task_id: str) -> Task:
         """Task 단건 조회.
@@ -333,34 +722,174 @@ class NotionTaskClient:
         Raises:
             APIResponseError: Notion API 오류.
         """
-        page = await self.client.pages.retrieve(page_id=task_id)
-        return self._parse_task(page)
+        await self.ensure_schema()
+        page = await self._request(self.client.pages.retrieve, page_id=task_id)
+        await self._complete_properties([page])
+        return self._track(page)
 
-    async def list_tasks(
+    async def get_tasks(self, task_ids: Iterable[str]) -> dict[str, Task]:
+        """여러 Task를 한 번에 조회.
+
+        중복 ID는 한 번만 조회하고, 로컬 복제본에 있는 Task는 요청 없이 쓰며, 나머지는 동시에 조회한다.
+
+        Args:
+            task_ids: Notion 페이지 ID 목록.
+
+        Returns:
+            {ID: Task}. 조회에 실패한 ID는 빠진다.
+        """
+        unique_ids = list(dict.fromkeys(task_ids))
+        found: dict[str, Task] = {}
+        if self.store is not None and self.store.warm:
+            for task_id in unique_ids:
+                if task := self.store.get(task_id):
+                    found[task_id] = task
+        missing = [task_id for task_id in unique_ids if task_id not in found]
+
+        async def fetch(task_id: str) -> Task | None:
+            try:
+                return await self.get_task(task_id)
+            except Exception:
+                return None
+
+        for task_id, task in zip(missing, await asyncio.gather(*(fetch(i) for i in missing)), strict=True):
+            if task is not None:
+                found[task_id] = task
+        return found
+
+    async def get_task_content(
+        self,
+        task_id: str,
+        max_depth: int | None = None,
+        max_chars: int | None = None,
+    ) -> TaskContent:
+        """Task 페이지 본문을 Markdown으로 조회.
+
+        블록 트리는 깊이별로 하위 블록을 동시에 받으며(공용 속도 제한), 받은 글자 수가 max_chars를 넘으면
+        더 받지 않는다. 결과는 페이지의 last_edited_time이 같은 동안 재사용한다. 로컬 복제본이 최신이면
+        수정 시각 확인 요청도 보내지 않는다.
+
+        Args:
+            task_id: Notion 페이지 ID.
+            max_depth: 따라갈 블록 깊이 (1이면 최상위 블록만). 없으면 CONTENT_MAX_DEPTH.
+            max_chars: 최대 글자 수. 없으면 CONTENT_MAX_CHARS.
+
+        Returns:
+            본문.
+        """
+        depth = max_depth or self.CONTENT_MAX_DEPTH
+        budget = max_chars or self.CONTENT_MAX_CHARS
+
+        last_edited_time = None
+        if self.store is not None and self.store.warm and not self.store.is_stale(self.STORE_MAX_AGE):
+            if task := self.store.get(task_id):
+                last_edited_time = task.last_edited_time
+        if last_edited_time is None:
+            page = await self._request(self.client.pages.retrieve, page_id=task_id)
+            last_edited_time = page.get("last_edited_time")
+
+        key = (task_id, depth, budget)
+        cached = self._content_cache.get(key)
+        hit = cached is not None and cached.last_edited_time == last_edited_time
+        self.metrics.record_cache("content", hit)
+        if cached is not None and hit:
+            self._content_cache.move_to_end(key)
+            return cached
+
+        blocks, count, clipped = await self._fetch_block_tree(task_id, depth, budget)
+        markdown, truncated = render_blocks(blocks, budget)
+        content = TaskContent(
+            task_id=task_id,
+            markdown=markdown,
+            truncated=truncated or clipped,
+            block_count=count,
+            last_edited_time=last_edited_time,
+        )
+        self._content_cache[key] = content
+        self._content_cache.move_to_end(key)
+        while len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+        return content
+
+    async def _fetch_block_tree(
+        self, block_id: str, max_depth: int, max_chars: int
+    ) -> tuple[list[dict[str, Any]], int, bool]:
+        """블록 트리를 깊이 단위로 받는다 (같은 깊이의 하위 블록 목록은 동시에 요청).
+
+        하위 블록은 각 블록의 "children" 키에 붙인다.
+
+        Returns:
+            (최상위 블록 목록, 받은 블록 수, 글자 수 제한으로 조회를 멈췄는지 여부)
+        """
+        used = 0
+        count = 0
+        clipped = False
+
+        async def children(parent_id: str) -> list[dict[str, Any]]:
+            nonlocal used, count, clipped
+            blocks: list[dict[str, Any]] = []
+            params: dict[str, Any] = {"block_id": parent_id, "page_size": 100}
+            while used <= max_chars:
+                response = await self._request(self.client.blocks.children.list, **params)
+                for block in response["results"]:
+                    used += plain_text_length(block)
+                    blocks.append(block)
+                count += len(response["results"])
+                if not response.get("has_more"):
+                    return blocks
+                params["start_cursor"] = response["next_cursor"]
+            clipped = True
+            return blocks
+
+        top = await children(block_id)
+        frontier = top
+        for _ in range(max_depth - 1):
+            parents = [
+                block
+                for block in frontier
+                if block.get("has_children") and block.get("type") not in self._OPAQUE_BLOCKS
+            ]
+            if not parents or used > max_chars:
+                break
+            results = await asyncio.gather(*(children(block["id"]) for block in parents))
+            for block, kids in zip(parents, results, strict=True):
+                block["children"] = kids
+            frontier = [kid for kids in results for kid in kids]
+        return top, count, clipped
+
+    async def _iter_pages(
         self,
         filter_: TaskFilter | None = None,
         page_size: int = 100,
-    ) -> list[Task]:
-        """Task 목록 조회.
+        notion_filter: dict[str, Any] | None = None,
+        complete: bool = True,
+        sorts: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """DB 쿼리 결과 페이지를 순서대로 스트리밍.
 
         Args:
             filter_: 필터 조건.
             page_size: 페이지 크기.
+            notion_filter: Notion 형식 필터. 지정하면 filter_ 대신 그대로 사용.
+            complete: 잘린 relation/title 속성을 전체 값으로 채울지 여부 (ID만 쓰는 경우 False).
+            sorts: Notion 형식 정렬.
 
-        Returns:
-            Task 목록.
+        Yields:
+            Notion 페이지 객체.
         """
+        await self.ensure_schema()
         query_params: dict[str, Any] = {
             "database_id": self.database_id,
             "page_size": page_size,
         }
 
-        if filter_:
+        if filter_ and notion_filter is None:
             notion_filter = self._build_filter(filter_)
-            if notion_filter:
-                query_params["filter"] = notion_filter
+        if notion_filter:
+            query_params["filter"] = notion_filter
+        if sorts:
+            query_params["sorts"] = sorts
 
-        tasks = []
         has_more = True
         start_cursor = None
 
@@ -368,15 +897,137 @@ class NotionTaskClient:
             if start_cursor:
                 query_params["start_cursor"] = start_cursor
 
-            response = await self.client.databases.query(**query_params)  # type: ignore[attr-defined]
+            response = await self._request(self._databases_query, **query_params)
+            if complete:
+                await self._complete_properties(response["results"])
             for page in response["results"]:
-                tasks.append(self._parse_task(page))
+                yield page
 
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
 
+    async def _query_tasks(
+        self,
+        filter_: TaskFilter | None = None,
+        page_size: int = 100,
+        sort_by: SortField | None = None,
+        descending: bool = False,
+    ) -> AsyncIterator[Task]:
+        """이 DB의 쿼리 결과를 Task로 스트리밍."""
+        sorts = self._build_sorts(sort_by, descending) if sort_by else None
+        async for page in self._iter_pages(filter_, page_size, sorts=sorts):
+            yield self._parse_page(page)
+
+    async def iter_tasks(
+        self,
+        filter_: TaskFilter | None = None,
+        page_size: int = 100,
+        sort_by: SortField | None = None,
+        descending: bool = False,
+    ) -> AsyncIterator[Task]:
+        """Task 목록을 페이지 단위로 받아오며 스트리밍.
+
+        Args:
+            filter_: 필터 조건.
+            page_size: 페이지 크기.
+            sort_by: 정렬 기준. 없으면 Notion 기본 순서.
+            descending: 내림차순 여부.
+
+        Yields:
+            Task 모델.
+        """
+        async for task in self._query_tasks(filter_, page_size, sort_by, descending):
+            yield task
+
+    async def list_tasks(
+        self,
+        filter_: TaskFilter | None = None,
+        page_size: int = 100,
+        sort_by: SortField | None = None,
+        descending: bool = False,
+    ) -> list[Task]:
+        """Task 목록 조회.
+
+        로컬 복제본이 웜 상태면 증분 동기화 후 로컬에서 필터링하여 전체 페이지네이션을 피한다.
+        받은 Task는 도착하는 대로 report()하므로, 중간에 취소되면 그때까지의 목록을 부분 결과로 쓸 수 있다.
+
+        Args:
+            filter_: 필터 조건.
+            page_size: 페이지 크기.
+            sort_by: 정렬 기준. 없으면 Notion 기본 순서.
+            descending: 내림차순 여부.
+
+        Returns:
+            Task 목록.
+        """
+        if self.store is not None:
+            self.metrics.record_cache("store", self.store.warm)
+            if self.store.warm:
+                if self.store.is_stale(self.STORE_MAX_AGE):
+                    await self.sync_store()
+                tasks = self.store.query(filter_)
+                report(*tasks)
+                return sort_tasks(tasks, sort_by, descending) if sort_by else tasks
+        tasks = []
+        async for task in self._query_tasks(filter_, page_size, sort_by, descending):
+            tasks.append(task)
+            report(task)
         return tasks
 
+    @property
+    def database_clients(self) -> list["NotionTaskClient"]:
+        """DB별 클라이언트 (로컬 복제본 등 DB 단위로 관리하는 자원용). 단일 DB면 자기 자신."""
+        return [self]
+
+    def attach_store(self, store: TaskStore) -> None:
+        """로컬 복제본 연결. 이후 조회/수정 결과가 복제본에 반영된다."""
+        self.store = store
+
+    def _track(self, page: dict[str, Any]) -> Task:
+        """페이지를 파싱하고 로컬 복제본에 반영."""
+        task = self._parse_page(page)
+        if self.store is not None:
+            if page.get("archived") or page.get("in_trash"):
+                self.store.discard(task.id)
+            else:
+                self.store.upsert(task)
+        return task
+
+    async def sync_store(self, full: bool = False) -> int:
+        """로컬 복제본 동기화.
+
+        watermark가 있으면 그 이후 수정된 페이지만 last_edited_time 필터로 받아온다.
+        증분 쿼리는 다른 곳에서 아카이브된 페이지를 알려주지 않으므로 주기적으로 full 동기화가 필요하다.
+
+        Args:
+            full: True면 DB 전체를 다시 받아 교체.
+
+        Returns:
+            받아온 Task 수.
+        """
+        store = self.store
+        if store is None:
+            return 0
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+
+        async with self._sync_lock:
+            # 대기하는 동안 다른 호출이 이미 동기화했으면 생략
+            if not full and store.warm and not store.is_stale(self.STORE_MAX_AGE):
+                return 0
+            if full or not store.watermark:
+                tasks = [task async for task in self._query_tasks()]
+                store.replace_all(tasks)
+            else:
+                notion_filter = {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": store.watermark},
+                }
+                pages = self._iter_pages(notion_filter=notion_filter)
+                tasks = [self._parse_page(page) async for page in pages]
+                store.apply_changes(tasks)
+            return len(tasks)
+
     async def create_task(self, data: TaskCreate) -> Task:
         """Task 생성.
 
@@ -386,12 +1037,16 @@ class NotionTaskClient:
         Returns:
             생성된 Task.
         """
+        await self.ensure_schema()
         properties = self._build_properties(data)
-        page = await self.client.pages.create(
+        page = await self._request(
+            self.client.pages.create,
             parent={"database_id": self.database_id},
             properties=properties,
         )
-        return self._parse_task(page)
+        self._forget_properties(data.parent_id)
+        await self._complete_properties([page])
+        return self._track(page)
 
     async def update_task(self, task_id: str, data: TaskUpdate) -> Task:
         """Task 수정.
@@ -403,12 +1058,16 @@ class NotionTaskClient:
         Returns:
             수정된 Task.
         """
+        await self.ensure_schema()
         properties = self._build_properties(data, is_update=True)
-        page = await self.client.pages.update(
+        page = await self._request(
+            self.client.pages.update,
             page_id=task_id,
             properties=properties,
         )
-        return self._parse_task(page)
+        self._forget_properties(task_id, data.parent_id)
+        await self._complete_properties([page])
+        return self._track(page)
 
     async def delete_task(self, task_id: str) -> bool:
         """Task 삭제 (아카이브).
@@ -419,12 +1078,142 @@ class NotionTaskClient:
         Returns:
             성공 여부.
         """
-        await self.client.pages.update(
+        await self._request(
+            self.client.pages.update,
             page_id=task_id,
             archived=True,
         )
+        self._forget_properties(task_id)
+        if self.store is not None:
+            self.store.discard(task_id)
         return True
 
+    async def _set_archived(self, task_id: str, archived: bool) -> BatchItemResult:
+        """단일 페이지 아카이브 상태 변경. 실패는 예외 대신 결과로 반환."""
+        try:
+            await self.ensure_schema()
+            page = await self._request(
+                self.client.pages.update,
+                page_id=task_id,
+                archived=archived,
+            )
+            self._forget_properties(task_id)
+            if not archived:
+                await self._complete_properties([page])
+        except Exception as e:
+            return BatchItemResult(task_id=task_id, success=False, error=str(e))
+        return BatchItemResult(task_id=task_id, success=True, task=self._track(page))
+
+    async def _run_batch(
+        self,
+        task_ids: Iterable[str],
+        action: Callable[[str], Awaitable[BatchItemResult]],
+    ) -> list[BatchItemResult]:
+        """여러 Task에 같은 작업을 동시에 실행.
+
+        동시성/속도는 공용 속도 제한기가 제어한다. 중복 ID는 한 번만 처리한다.
+        끝난 항목은 바로 report()한다 (취소되면 나머지 요청은 보내지 않음).
+
+        Returns:
+            입력 순서를 따르는 항목별 결과 목록.
+        """
+
+        async def run(task_id: str) -> BatchItemResult:
+            result = await action(task_id)
+            report(result)
+            return result
+
+        unique_ids = list(dict.fromkeys(task_ids))
+        return list(await asyncio.gather(*(run(task_id) for task_id in unique_ids)))
+
+    async def delete_tasks(self, task_ids: list[str]) -> list[BatchItemResult]:
+        """여러 Task 일괄 삭제 (아카이브).
+
+        Args:
+            task_ids: Notion 페이지 ID 목록.
+
+        Returns:
+            항목별 결과 목록.
+        """
+        return await self._run_batch(task_ids, lambda task_id: self._set_archived(task_id, True))
+
+    async def restore_tasks(self, task_ids: list[str]) -> list[BatchItemResult]:
+        """아카이브된 여러 Task 일괄 복원.
+
+        Args:
+            task_ids: Notion 페이지 ID 목록.
+
+        Returns:
+            항목별 결과 목록.
+        """
+        return await self._run_batch(task_ids, lambda task_id: self._set_archived(task_id, False))
+
+    async def delete_tasks_by_filter(
+        self,
+        filter_: TaskFilter,
+        page_size: int = 100,
+    ) -> list[BatchItemResult]:
+        """필터 조건에 맞는 모든 Task 일괄 삭제 (아카이브).
+
+        아카이브할 때마다 같은 쿼리의 결과 집합이 줄어 커서가 항목을 건너뛰므로,
+        조건에 맞는 ID를 끝까지 모두 받은 뒤에 아카이브한다.
+
+        Args:
+            filter_: 필터 조건. 조건이 하나도 없으면 거부한다 (DB 전체 아카이브 방지).
+            page_size: 쿼리 페이지 크기.
+
+        Returns:
+            항목별 결과 목록 (Task 본문은 포함하지 않음).
+
+        Raises:
+            ValueError: 필터 조건이 없음.
+        """
+        results = await self.delete_tasks(await self._matching_task_ids(filter_, page_size))
+        return [result.model_copy(update={"task": None}) for result in results]
+
+    async def _matching_task_ids(self, filter_: TaskFilter, page_size: int = 100) -> list[str]:
+        """필터 조건에 맞는 Task ID를 모든 페이지에서 모은다 (속성 보충 없이 ID만).
+
+        Raises:
+            ValueError: 필터 조건이 없음.
+        """
+        await self.ensure_schema()
+        notion_filter = self._build_filter(filter_)
+        if notion_filter is None:
+            raise ValueError("필터 조건이 없습니다. 전체 Task를 아카이브하지 않도록 조건을 하나 이상 지정하세요.")
+        return [
+            page["id"]
+            async for page in self._iter_pages(page_size=page_size, notion_filter=notion_filter, complete=False)
+        ]
+
+    async def _update_item(self, task_id: str, data: TaskUpdate) -> BatchItemResult:
+        """단일 Task 수정. 실패는 예외 대신 결과로 반환."""
+        try:
+            task = await self.update_task(task_id, data)
+        except Exception as e:
+            return BatchItemResult(task_id=task_id, success=False, error=str(e))
+        return BatchItemResult(task_id=task_id, success=True, task=task)
+
+    async def batch_update(self, updates: list[TaskBatchUpdate]) -> list[BatchItemResult]:
+        """여러 Task를 각기 다른 값으로 일괄 수정.
+
+        같은 Task를 대상으로 하는 항목은 먼저 하나로 병합한다.
+        명시적으로 지정한 필드만 병합하며, 뒤에 오는 항목의 값이 우선한다.
+
+        Args:
+            updates: Task별 수정 요청 목록.
+
+        Returns:
+            Task별 결과 목록 (처음 등장한 순서).
+        """
+        merged: dict[str, TaskUpdate] = {}
+        for item in updates:
+            fields = item.model_dump(exclude={"task_id"}, exclude_unset=True)
+            current = merged.get(item.task_id)
+            merged[item.task_id] = current.model_copy(update=fields) if current else TaskUpdate(**fields)
+
+        return await self._run_batch(merged, lambda task_id: self._update_item(task_id, merged[task_id]))
+
     async def batch_update_status(
         self,
         task_ids: list[str],
@@ -443,6 +1232,7 @@ class NotionTaskClient:
         for task_id in task_ids:
             task = await self.update_task(task_id, TaskUpdate(status=status))
             updated_tasks.append(task)
+            report(task)
         return updated_tasks
 
     async def batch_update_assignee(
@@ -463,4 +1253,5 @@ class NotionTaskClient:
         for task_id in task_ids:
             task = await self.update_task(task_id, TaskUpdate(assignee=assignee))
             updated_tasks.append(task)
+            report(task)
         return updated_tasks
@@ -0,0 +1,174 @@
+"""도구 호출 단위 프로파일링 (환경변수로 켜는 선택 기능).
+
+실제 세션에서 `_parse_task`, `task_to_dict` 같은 핫패스 데이터를 얻기 위해
+선택한 도구 호출을 cProfile / tracemalloc으로 감싸고 결과를 파일로 남긴다.
+
+환경변수:
+    NOTION_TASK_PROFILE        : 대상 도구 이름 (쉼표 구분, `*`는 전체). 없으면 비활성
+    NOTION_TASK_PROFILE_MODE   : `cprofile`, `tracemalloc` 또는 둘 다 (쉼표 구분, 기본 cprofile)
+    NOTION_TASK_PROFILE_EVERY  : N번째 호출마다 하나씩 프로파일링 (도구별, 기본 1)
+    NOTION_TASK_PROFILE_DIR    : 결과 디렉터리 (기본 캐시 디렉터리 아래 profiles/)
+    NOTION_TASK_PROFILE_TOP    : 보고서에 남길 상위 함수/할당 위치 수 (기본 25)
+
+cProfile/tracemalloc 모듈은 서버 기동 시간을 늘리지 않도록 실제로 프로파일링할 때 불러온다.
+"""
+
+import asyncio
+import io
+import logging
+import os
+import re
+import time
+from collections import Counter
+from collections.abc import Awaitable
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from .store import default_cache_dir
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PROFILE_MODES = ("cprofile", "tracemalloc")
+
+
+class ToolProfiler:
+    """선택한 도구 호출을 표본 추출하여 프로파일링.
+
+    cProfile은 스레드 단위로 동작하므로, 프로파일링 중 같은 이벤트 루프에서 함께 실행된
+    다른 작업도 결과에 섞일 수 있다. 동시에 하나의 호출만 프로파일링하며,
+    이미 진행 중이면 그 호출은 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        tools: set[str] | None,
+        output_dir: Path,
+        every: int = 1,
+        modes: tuple[str, ...] = ("cprofile",),
+        top: int = 25,
+    ) -> None:
+        """초기화.
+
+        Args:
+            tools: 대상 도구 이름 집합. None이면 전체.
+            output_dir: 결과 파일 디렉터리.
+            every: N번째 호출마다 프로파일링.
+            modes: 사용할 프로파일러 (PROFILE_MODES 중).
+            top: 보고서에 남길 상위 항목 수.
+        """
+        unknown = set(modes) - set(PROFILE_MODES)
+        if unknown:
+            raise ValueError(f"알 수 없는 프로파일링 모드: {', '.join(sorted(unknown))}")
+        if every < 1:
+            raise ValueError("every는 1 이상이어야 합니다.")
+        self.tools = tools
+        self.output_dir = output_dir
+        self.every = every
+        self.modes = modes
+        self.top = top
+        self.calls: Counter[str] = Counter()
+        self._active = False
+
+    @classmethod
+    def from_env(cls) -> "ToolProfiler | None":
+        """환경변수로 생성. NOTION_TASK_PROFILE이 없으면 None."""
+        selected = os.environ.get("NOTION_TASK_PROFILE", "").strip()
+        if not selected:
+            return None
+        names = {name.strip() for name in selected.split(",") if name.strip()}
+        modes = os.environ.get("NOTION_TASK_PROFILE_MODE", "cprofile")
+        output_dir = os.environ.get("NOTION_TASK_PROFILE_DIR")
+        return cls(
+            tools=None if "*" in names else names,
+            output_dir=Path(output_dir) if output_dir else default_cache_dir() / "profiles",
+            every=int(os.environ.get("NOTION_TASK_PROFILE_EVERY", "1")),
+            modes=tuple(mode.strip() for mode in modes.split(",") if mode.strip()),
+            top=int(os.environ.get("NOTION_TASK_PROFILE_TOP", "25")),
+        )
+
+    def should_profile(self, tool: str) -> bool:
+        """이번 호출을 프로파일링할지 여부 (호출 횟수도 함께 센다)."""
+        if self.tools is not None and tool not in self.tools:
+            return False
+        self.calls[tool] += 1
+        return not self._active and self.calls[tool] % self.every == 0
+
+    async def run(self, tool: str, call: Awaitable[T]) -> T:
+        """call을 프로파일링하며 실행하고 결과 파일 기록."""
+        import cProfile
+        import tracemalloc
+
+        self._active = True
+        call_no = self.calls[tool]
+        profiler = cProfile.Profile() if "cprofile" in self.modes else None
+        trace = "tracemalloc" in self.modes
+        started_tracing = trace and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        baseline = tracemalloc.take_snapshot() if trace else None
+        if trace:
+            tracemalloc.reset_peak()
+
+        started = time.perf_counter()
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:  # 다른 프로파일러가 이미 동작 중
+                profiler = None
+        try:
+            return await call
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            elapsed = time.perf_counter() - started
+            snapshot = tracemalloc.take_snapshot() if trace else None
+            peak = tracemalloc.get_traced_memory()[1] if trace else 0
+            if started_tracing:
+                tracemalloc.stop()
+            self._active = False
+
+            stem = f"{time.strftime('%Y%m%d-%H%M%S')}-{_safe_name(tool)}-{call_no}"
+            try:
+                await asyncio.to_thread(self._write, stem, tool, call_no, elapsed, profiler, baseline, snapshot, peak)
+            except OSError as e:
+                logger.warning("프로파일 저장 실패: %s", e)
+
+    def _write(
+        self,
+        stem: str,
+        tool: str,
+        call_no: int,
+        elapsed: float,
+        profiler: "cProfile.Profile | None",
+        baseline: "tracemalloc.Snapshot | None",
+        snapshot: "tracemalloc.Snapshot | None",
+        peak: int,
+    ) -> None:
+        """프로파일 결과 기록 (.prof: pstats 덤프, .txt: 요약 보고서)."""
+        import pstats
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        report = io.StringIO()
+        report.write(f"tool: {tool}\ncall: {call_no}\nelapsed_ms: {elapsed * 1000:.3f}\n")
+
+        if profiler is not None:
+            profiler.dump_stats(self.output_dir / f"{stem}.prof")
+            report.write("\n== cProfile (cumulative) ==\n")
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(self.top)
+
+        if baseline is not None and snapshot is not None:
+            report.write(f"\n== tracemalloc (peak {peak / 1024:.1f} KiB, top {self.top} by size diff) ==\n")
+            for stat in snapshot.compare_to(baseline, "lineno")[: self.top]:
+                report.write(f"{stat}\n")
+
+        (self.output_dir / f"{stem}.txt").write_text(report.getvalue(), encoding="utf-8")
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]", "_", name)
@@ -0,0 +1,64 @@
+"""Notion API 요청 속도 제한."""
+
+import asyncio
+import time
+from types import TracebackType
+
+
+class RateLimiter:
+    """Notion API 공용 속도 제한기.
+
+    동시 요청 수와 초당 요청 수를 함께 제한한다.
+    하나의 클라이언트가 보내는 모든 요청이 같은 인스턴스를 공유해야 한다.
+    """
+
+    def __init__(self, requests_per_second: float = 3.0, max_concurrency: int = 3) -> None:
+        """초기화.
+
+        Args:
+            requests_per_second: 초당 최대 요청 수. 0 이하면 간격 제한 없음.
+            max_concurrency: 동시에 진행 가능한 최대 요청 수.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency는 1 이상이어야 합니다.")
+        self.requests_per_second = requests_per_second
+        self.max_concurrency = max_concurrency
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """요청 슬롯 획득. 필요하면 다음 슬롯까지 대기.
+
+        대기 중에 취소되면 예약한 슬롯이 마지막 슬롯일 때 되돌려, 보내지 않은 요청이 속도 예산을 쓰지 않게 한다.
+        """
+        await self._semaphore.acquire()
+        if not self._interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        try:
+            if slot > now:
+                await asyncio.sleep(slot - now)
+        except BaseException:
+            if self._next_slot == slot + self._interval:
+                self._next_slot = slot
+            self._semaphore.release()
+            raise
+
+    def release(self) -> None:
+        """요청 슬롯 반환."""
+        self._semaphore.release()
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.release()
@@ -0,0 +1,143 @@
+"""Notion DB 스키마 (databases.retrieve) 해석과 로컬 검증.
+
+DB마다 속성/옵션 이름의 띄어쓰기가 다를 수 있다 (예: "상위항목"과 "상위 항목", "진행중"과 "진행 중").
+코드에서 쓰는 이름을 실제 DB 이름으로 바꾸고, select/status 옵션은 요청을 보내기 전에 검증한다.
+"""
+
+import time
+from typing import Any
+
+# 옵션 값을 검증/변환하는 속성 타입
+OPTION_TYPES = ("select", "status", "multi_select")
+# 없는 옵션을 거부하는 타입 (multi_select는 Notion이 새 옵션을 만들어 주므로 그대로 보낸다)
+STRICT_OPTION_TYPES = ("select", "status")
+# 옵션 값을 비교하는 필터 조건
+_OPTION_CONDITIONS = ("equals", "does_not_equal", "contains", "does_not_contain")
+
+
+def normalize(name: str) -> str:
+    """공백과 대소문자 차이를 무시한 비교용 이름."""
+    return "".join(name.split()).casefold()
+
+
+class SchemaError(ValueError):
+    """요청 값이 DB 스키마와 맞지 않음 (Notion에 요청을 보내기 전에 발생)."""
+
+
+class DatabaseSchema:
+    """databases.retrieve 응답의 속성 스키마."""
+
+    def __init__(self, properties: dict[str, dict[str, Any]], fetched_at: float | None = None) -> None:
+        """초기화.
+
+        Args:
+            properties: 속성 이름 → databases.retrieve의 속성 객체 ({"id", "type", 타입별 설정}).
+            fetched_at: 조회 시각 (time.monotonic 기준). 없으면 지금.
+        """
+        self.properties = properties
+        self.fetched_at = time.monotonic() if fetched_at is None else fetched_at
+        self._names = {normalize(name): name for name in properties}
+        self._options: dict[str, dict[str, str]] = {
+            name: {normalize(option["name"]): option["name"] for option in prop[prop["type"]].get("options", [])}
+            for name, prop in properties.items()
+            if prop.get("type") in OPTION_TYPES
+        }
+
+    @classmethod
+    def from_response(cls, response: dict[str, Any]) -> "DatabaseSchema":
+        """databases.retrieve 응답으로 생성."""
+        return cls(response.get("properties", {}))
+
+    def is_expired(self, ttl: float) -> bool:
+        """조회 후 ttl초가 지났는지 여부."""
+        return time.monotonic() - self.fetched_at >= ttl
+
+    def find(self, name: str, prop_type: str | None = None) -> str | None:
+        """속성 이름을 실제 DB 속성 이름으로 변환. 없으면 None.
+
+        이름이 같거나 띄어쓰기만 다른 속성을 먼저 찾고, 없으면 prop_type 타입의 속성이
+        DB에 하나뿐일 때 그 속성을 쓴다 (제목, unique_id, status처럼 DB당 하나인 속성).
+        """
+        if name in self.properties:
+            return name
+        if found := self._names.get(normalize(name)):
+            return found
+        if prop_type is not None:
+            candidates = [key for key, prop in self.properties.items() if prop.get("type") == prop_type]
+            if len(candidates) == 1:
+                return candidates[0]
+        return None
+
+    def property_id(self, name: str) -> str:
+        """속성 ID (pages/{id}/properties/{property_id} 등에 사용)."""
+        prop = self.properties.get(name)
+        if prop is None:
+            raise SchemaError(f"'{name}' 속성이 DB에 없습니다.")
+        return str(prop["id"])
+
+    def property_type(self, name: str) -> str | None:
+        """속성 타입. 없는 속성이면 None."""
+        prop = self.properties.get(name)
+        return prop.get("type") if prop else None
+
+    def options(self, name: str) -> list[str]:
+        """select/status/multi_select 속성의 옵션 이름 목록."""
+        return list(self._options.get(name, {}).values())
+
+    def has_option(self, name: str, value: str) -> bool:
+        """옵션이 있는지 여부 (띄어쓰기 차이 무시)."""
+        return normalize(value) in self._options.get(name, {})
+
+    def option(self, name: str, value: str) -> str:
+        """옵션 값을 실제 DB 옵션 이름으로 변환.
+
+        Raises:
+            SchemaError: select/status 속성에 없는 옵션.
+        """
+        options = self._options.get(name)
+        if options is None:
+            return value
+        if found := options.get(normalize(value)):
+            return found
+        if self.property_type(name) in STRICT_OPTION_TYPES:
+            raise SchemaError(f"'{value}'은(는) '{name}'에 없는 값입니다. 가능한 값: {', '.join(options.values())}")
+        return value
+
+    def conform_properties(self, properties: dict[str, Any]) -> dict[str, Any]:
+        """pages.create/update용 속성 값을 검증하고 옵션 이름을 DB 이름으로 바꾼다 (제자리 수정).
+
+        Raises:
+            SchemaError: 없는 속성이거나 select/status에 없는 옵션.
+        """
+        for name, value in properties.items():
+            prop_type = self.property_type(name)
+            if prop_type is None:
+                raise SchemaError(f"'{name}' 속성이 DB에 없습니다.")
+            if prop_type in STRICT_OPTION_TYPES and value.get(prop_type):
+                value[prop_type]["name"] = self.option(name, value[prop_type]["name"])
+            elif prop_type == "multi_select":
+                for item in value["multi_select"]:
+                    item["name"] = self.option(name, item["name"])
+        return properties
+
+    def conform_filter(self, filter_: dict[str, Any]) -> dict[str, Any]:
+        """databases.query 필터의 옵션 값을 검증하고 DB 이름으로 바꾼다 (제자리 수정).
+
+        Raises:
+            SchemaError: 없는 속성이거나 select/status에 없는 옵션.
+        """
+        for compound in ("and", "or"):
+            for condition in filter_.get(compound, []):
+                self.conform_filter(condition)
+        name = filter_.get("property")
+        if name is None:
+            return filter_
+        prop_type = self.property_type(name)
+        if prop_type is None:
+            raise SchemaError(f"'{name}' 속성이 DB에 없습니다.")
+        condition = filter_.get(prop_type)
+        if prop_type in OPTION_TYPES and condition:
+            for op in _OPTION_CONDITIONS:
+                if isinstance(condition.get(op), str):
+                    condition[op] = self.option(name, condition[op])
+        return filter_
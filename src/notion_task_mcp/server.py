@@ -1,49 +1,208 @@
 """MCP 서버 엔트리포인트."""
 
+import argparse
 import asyncio
+import logging
 import os
+import time
+from pathlib import Path
 
-from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+from .client_pool import ClientPool
+from .database_group import DatabaseGroupClient, parse_database_configs
+from .deadline import ToolTimeouts
+from .http_transport import DEFAULT_HOST, DEFAULT_MAX_CONNECTIONS, DEFAULT_PORT, serve_http
+from .metrics import Metrics
 from .notion_client import NotionTaskClient
+from .profiling import ToolProfiler
+from .store import TaskStore
 from .tools import register_task_tools
 
+logger = logging.getLogger(__name__)
 
-def create_server() -> Server:
-    """MCP 서버 인스턴스 생성."""
-    load_dotenv()
+# 스냅샷 저장/증분 동기화 주기 (초, NOTION_TASK_SNAPSHOT_INTERVAL로 변경 가능)
+DEFAULT_SNAPSHOT_INTERVAL = 300.0
+# 다른 곳에서 아카이브된 Task를 정리하기 위한 전체 동기화 주기 (초)
+FULL_SYNC_INTERVAL = 1800.0
+# Prometheus 메트릭 파일 갱신 주기 (초, NOTION_TASK_METRICS_INTERVAL로 변경 가능)
+DEFAULT_METRICS_INTERVAL = 15.0
+# 프로세스 전체의 동시 도구 호출 수 (NOTION_TASK_MAX_CONCURRENT_CALLS, 0이면 제한 없음)
+DEFAULT_MAX_CONCURRENT_CALLS = 16
 
-    server = Server("notion-task-mcp")
 
-    # Notion 클라이언트 초기화
-    notion_client = NotionTaskClient(
+def create_notion_client(pool: ClientPool | None = None) -> NotionTaskClient:
+    """환경변수로 Notion 클라이언트 생성.
+
+    MCP 클라이언트 설정(env)에 값이 없을 때만 .env 파일을 읽는다.
+    NOTION_DATABASES가 있으면 여러 DB를 함께 조회하는 클라이언트를 만든다 (형식은 parse_database_configs).
+    pool이 있고 NOTION_API_KEY가 없으면 풀의 기본 프로필 클라이언트를 쓴다.
+    """
+    if not (
+        os.environ.get("NOTION_API_KEY")
+        and (os.environ.get("NOTION_DATABASE_ID") or os.environ.get("NOTION_DATABASES"))
+    ):
+        if pool is not None and not os.environ.get("NOTION_API_KEY"):
+            return pool.client(pool.default)
+
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+    metrics = pool.metrics if pool is not None else None
+    if databases := os.environ.get("NOTION_DATABASES"):
+        return DatabaseGroupClient(
+            parse_database_configs(databases), api_key=os.environ.get("NOTION_API_KEY"), metrics=metrics
+        )
+    return NotionTaskClient(
         api_key=os.environ.get("NOTION_API_KEY"),
         database_id=os.environ.get("NOTION_DATABASE_ID"),
+        metrics=metrics,
     )
 
-    # Task 도구 등록
-    register_task_tools(server, notion_client)
 
-    return server
+def open_task_store(notion_client: NotionTaskClient) -> TaskStore | None:
+    """웜 스타트 스냅샷을 불러와 클라이언트에 연결.
+
+    NOTION_TASK_SNAPSHOT=0 이면 사용하지 않는다.
+    """
+    if os.environ.get("NOTION_TASK_SNAPSHOT", "1").lower() in ("0", "false", "no", "off"):
+        return None
+    assert notion_client.database_id
+    store = TaskStore(notion_client.database_id)
+    store.load()
+    notion_client.attach_store(store)
+    return store
+
+
+async def maintain_store(notion_client: NotionTaskClient, store: TaskStore, interval: float) -> None:
+    """백그라운드 동기화 및 주기적 스냅샷 저장.
+
+    기동 직후 스냅샷 이후 변경분을 따라잡고(스냅샷이 없으면 전체 동기화),
+    이후 interval마다 증분 동기화와 스냅샷 저장을 반복한다.
+    """
+    while True:
+        full = store.full_synced_at is None or time.time() - store.full_synced_at > FULL_SYNC_INTERVAL
+        try:
+            await notion_client.sync_store(full=full)
+        except Exception as e:
+            logger.warning("Task 복제본 동기화 실패: %s", e)
+
+        if store.dirty:
+            store.dirty = False
+            data = store.encode_snapshot()
+            try:
+                await asyncio.to_thread(store.write_snapshot, data)
+            except OSError as e:
+                logger.warning("스냅샷 저장 실패: %s", e)
+
+        await asyncio.sleep(interval)
+
+
+async def export_metrics(metrics: Metrics, path: Path, interval: float) -> None:
+    """interval마다 메트릭을 Prometheus 텍스트 파일로 기록."""
+    while True:
+        await asyncio.sleep(interval)
+        text = metrics.to_prometheus()
+        try:
+            await asyncio.to_thread(metrics.write_prometheus, path, text)
+        except OSError as e:
+            logger.warning("메트릭 파일 저장 실패: %s", e)
+
+
+def create_server(notion_client: NotionTaskClient | None = None, pool: ClientPool | None = None) -> Server:
+    """MCP 서버 인스턴스 생성.
+
+    pool이 있으면 도구 호출의 profile 인자로 워크스페이스별 클라이언트를 고른다.
+    동시 도구 호출 수는 NOTION_TASK_MAX_CONCURRENT_CALLS로 제한한다 (HTTP 전송에서 모든 세션 합계).
+    도구별 제한 시간은 NOTION_TASK_TIMEOUT / NOTION_TASK_TIMEOUTS로 정한다 (deadline.py).
+    """
+    server = Server("notion-task-mcp")
 
+    # Notion 클라이언트 초기화 (SDK 클라이언트는 첫 사용 시 생성)
+    if notion_client is None:
+        notion_client = create_notion_client(pool)
 
-async def run_server() -> None:
-    """서버 실행."""
-    server = create_server()
+    # Task 도구 등록 (NOTION_TASK_PROFILE 지정 시 도구 호출 프로파일링)
+    max_calls = int(os.environ.get("NOTION_TASK_MAX_CONCURRENT_CALLS", DEFAULT_MAX_CONCURRENT_CALLS))
+    register_task_tools(server, notion_client, ToolProfiler.from_env(), pool, max_calls, ToolTimeouts.from_env())
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    return server
+
+
+async def run_server(transport: str = "stdio", host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """서버 실행.
+
+    Args:
+        transport: "stdio"(클라이언트가 띄우는 단일 세션) 또는 "http"(여러 세션이 붙는 상주 프로세스).
+        host: HTTP 바인드 주소.
+        port: HTTP 포트.
+    """
+    # NOTION_PROFILES가 있으면 워크스페이스별 클라이언트 풀 (메트릭은 프로세스 전체가 공유)
+    pool = ClientPool.from_env()
+    notion_client = create_notion_client(pool)
+    # 로컬 복제본은 기본 클라이언트의 DB마다 따로 둔다
+    stores = [
+        (database_client, store)
+        for database_client in notion_client.database_clients
+        if (store := open_task_store(database_client)) is not None
+    ]
+    server = create_server(notion_client, pool)
+
+    # initialize 핸드셰이크와 병행하여 SDK 클라이언트 미리 생성
+    background = [asyncio.create_task(notion_client.warm_up())]
+    interval = float(os.environ.get("NOTION_TASK_SNAPSHOT_INTERVAL", DEFAULT_SNAPSHOT_INTERVAL))
+    for database_client, store in stores:
+        background.append(asyncio.create_task(maintain_store(database_client, store, interval)))
+    metrics_file = os.environ.get("NOTION_TASK_METRICS_FILE")
+    if metrics_file:
+        interval = float(os.environ.get("NOTION_TASK_METRICS_INTERVAL", DEFAULT_METRICS_INTERVAL))
+        background.append(asyncio.create_task(export_metrics(notion_client.metrics, Path(metrics_file), interval)))
+
+    try:
+        if transport == "http":
+            max_connections = int(os.environ.get("NOTION_TASK_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS))
+            await serve_http(server, host, port, max_connections)
+        else:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options(),
+                )
+    finally:
+        for task in background:
+            task.cancel()
+        for _, store in stores:
+            if store.dirty:
+                store.save()
+        if pool is not None:
+            await pool.aclose()
+        if metrics_file:
+            notion_client.metrics.write_prometheus(Path(metrics_file))
 
 
 def main() -> None:
     """메인 엔트리포인트."""
-    asyncio.run(run_server())
+    parser = argparse.ArgumentParser(prog="notion-task-mcp", description="Notion Task MCP 서버")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http"],
+        default=os.environ.get("NOTION_TASK_TRANSPORT", "stdio"),
+        help="전송 방식 (기본: stdio, NOTION_TASK_TRANSPORT)",
+    )
+    parser.add_argument(
+        "--host", default=os.environ.get("NOTION_TASK_HOST", DEFAULT_HOST), help="HTTP 바인드 주소 (NOTION_TASK_HOST)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get("NOTION_TASK_PORT", DEFAULT_PORT)),
+        help="HTTP 포트 (NOTION_TASK_PORT)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run_server(args.transport, args.host, args.port))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,293 @@
+"""Task 로컬 복제본과 웜 스타트 스냅샷.
+
+stdio 세션마다 새 프로세스가 뜨므로, 파싱된 Task와 동기화 기준 시각(watermark)을
+로컬 캐시 디렉터리에 바이너리 스냅샷으로 저장해 두고 다음 기동 때 바로 불러온다.
+
+스냅샷 형식 (리틀 엔디언)::
+
+    header  : magic(4s) version(H) reserved(H) count(I) meta_len(I) payload_len(Q)
+    meta    : JSON {"database_id", "watermark", "full_synced_at", "saved_at"}
+    payload : JSON 배열. 각 행은 SNAPSHOT_FIELDS 순서의 값 배열
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from .models import STATUS_GROUP_MAP, Priority, SortField, Task, TaskFilter, TaskStatus, TaskType
+
+SNAPSHOT_MAGIC = b"NTSS"
+SNAPSHOT_VERSION = 2
+_HEADER = struct.Struct("<4sHHIIQ")
+
+# 스냅샷 행의 필드 순서 (변경 시 SNAPSHOT_VERSION 증가)
+SNAPSHOT_FIELDS = (
+    "id",
+    "no",
+    "title",
+    "task_type",
+    "status",
+    "priority",
+    "assignee",
+    "assignee_name",
+    "assignee_ids",
+    "creator",
+    "start_date",
+    "end_date",
+    "labels",
+    "services",
+    "parent_id",
+    "children_ids",
+    "last_edited_time",
+    "database",
+)
+
+
+def default_cache_dir() -> Path:
+    """캐시 디렉터리 (NOTION_TASK_CACHE_DIR > XDG_CACHE_HOME > ~/.cache)."""
+    if path := os.environ.get("NOTION_TASK_CACHE_DIR"):
+        return Path(path)
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "notion-task-mcp"
+
+
+def _encode(task: Task) -> list[Any]:
+    """Task를 스냅샷 행으로 변환."""
+    return [
+        task.id,
+        task.no,
+        task.title,
+        task.task_type.value,
+        task.status.value,
+        task.priority.value if task.priority else None,
+        task.assignee,
+        task.assignee_name,
+        task.assignee_ids,
+        task.creator,
+        task.start_date.isoformat() if task.start_date else None,
+        task.end_date.isoformat() if task.end_date else None,
+        task.labels,
+        task.services,
+        task.parent_id,
+        task.children_ids,
+        task.last_edited_time,
+        task.database,
+    ]
+
+
+def _decode(row: list[Any]) -> Task:
+    """스냅샷 행을 Task로 변환. 저장 시 이미 검증된 값이므로 검증은 생략."""
+    values = dict(zip(SNAPSHOT_FIELDS, row, strict=True))
+    values["task_type"] = TaskType(values["task_type"])
+    values["status"] = TaskStatus(values["status"])
+    values["priority"] = Priority(values["priority"]) if values["priority"] else None
+    values["start_date"] = date.fromisoformat(values["start_date"]) if values["start_date"] else None
+    values["end_date"] = date.fromisoformat(values["end_date"]) if values["end_date"] else None
+    return Task.model_construct(**values)
+
+
+def matches(task: Task, filter_: TaskFilter) -> bool:
+    """Task가 필터 조건을 만족하는지 로컬에서 판정 (NotionTaskClient._build_filter와 같은 의미)."""
+    if filter_.task_type and task.task_type != filter_.task_type:
+        return False
+    if filter_.status and task.status != filter_.status:
+        return False
+    if filter_.status_group and STATUS_GROUP_MAP[task.status] != filter_.status_group:
+        return False
+    if filter_.priority and task.priority != filter_.priority:
+        return False
+    if filter_.assignee and filter_.assignee not in task.assignee_ids:
+        return False
+    if filter_.labels and not set(filter_.labels) & set(task.labels):
+        return False
+    if filter_.services and not set(filter_.services) & set(task.services):
+        return False
+    if filter_.start_date_from and not (task.start_date and task.start_date >= filter_.start_date_from):
+        return False
+    if filter_.start_date_to and not (task.start_date and task.start_date <= filter_.start_date_to):
+        return False
+    if filter_.end_date_from and not (task.end_date and task.end_date >= filter_.end_date_from):
+        return False
+    if filter_.end_date_to and not (task.end_date and task.end_date <= filter_.end_date_to):
+        return False
+    if filter_.parent_id and task.parent_id != filter_.parent_id:
+        return False
+    return True
+
+
+def sort_key(sort_by: SortField, descending: bool = False) -> Callable[[Task], tuple[bool, Any]]:
+    """정렬 키 함수. reverse=descending과 함께 쓰며, 빈 값은 방향과 관계없이 맨 뒤 (Notion sorts와 같은 순서)."""
+
+    def key(task: Task) -> tuple[bool, Any]:
+        value = getattr(task, sort_by.value)
+        return ((value is None) != descending, "" if value is None else value)
+
+    return key
+
+
+def sort_tasks(tasks: Iterable[Task], sort_by: SortField, descending: bool = False) -> list[Task]:
+    """Task 목록을 로컬에서 정렬 (NotionTaskClient._build_sorts와 같은 순서)."""
+    return sorted(tasks, key=sort_key(sort_by, descending), reverse=descending)
+
+
+class TaskStore:
+    """Task DB의 로컬 복제본.
+
+    watermark는 동기화 쿼리로 받은 페이지의 최대 last_edited_time이다.
+    직접 수정한 결과(upsert)는 watermark를 올리지 않는다. 올리면 그 사이 다른 사람이 수정한
+    페이지를 증분 동기화에서 놓칠 수 있기 때문이다.
+    """
+
+    def __init__(self, database_id: str, path: Path | None = None) -> None:
+        """초기화.
+
+        Args:
+            database_id: Notion 데이터베이스 ID.
+            path: 스냅샷 파일 경로. 없으면 캐시 디렉터리 아래 DB별 파일 사용.
+        """
+        self.database_id = database_id
+        safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", database_id)
+        self.path = path or default_cache_dir() / f"snapshot-{safe_id}.bin"
+        self.tasks: dict[str, Task] = {}
+        self.watermark: str | None = None
+        self.dirty = False
+        self.last_sync: float | None = None
+        self.full_synced_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def warm(self) -> bool:
+        """스냅샷 또는 동기화로 DB 전체를 한 번 이상 받아 둔 상태인지 여부."""
+        return self.watermark is not None
+
+    def is_stale(self, max_age: float) -> bool:
+        """이번 세션의 마지막 동기화 후 max_age초가 지났는지 여부."""
+        return self.last_sync is None or time.monotonic() - self.last_sync > max_age
+
+    def get(self, task_id: str) -> Task | None:
+        """ID로 Task 조회."""
+        return self.tasks.get(task_id)
+
+    def upsert(self, task: Task) -> None:
+        """직접 수정/생성한 Task 반영."""
+        self.tasks[task.id] = task
+        self.dirty = True
+
+    def discard(self, task_id: str) -> None:
+        """아카이브된 Task 제거."""
+        if self.tasks.pop(task_id, None) is not None:
+            self.dirty = True
+
+    def _advance(self, tasks: Iterable[Task]) -> None:
+        for task in tasks:
+            if task.last_edited_time and (self.watermark is None or task.last_edited_time > self.watermark):
+                self.watermark = task.last_edited_time
+        self.last_sync = time.monotonic()
+
+    def apply_changes(self, tasks: list[Task]) -> None:
+        """증분 동기화 결과 반영."""
+        for task in tasks:
+            self.tasks[task.id] = task
+        if tasks:
+            self.dirty = True
+        self._advance(tasks)
+
+    def replace_all(self, tasks: list[Task]) -> None:
+        """전체 동기화 결과로 교체 (다른 곳에서 아카이브된 페이지도 정리됨)."""
+        self.tasks = {task.id: task for task in tasks}
+        self.watermark = None
+        self.dirty = True
+        self.full_synced_at = time.time()
+        self._advance(tasks)
+        if self.watermark is None:
+            # 빈 DB도 웜 상태로 취급
+            self.watermark = ""
+
+    def query(self, filter_: TaskFilter | None = None) -> list[Task]:
+        """필터 조건에 맞는 Task 목록."""
+        if filter_ is None:
+            return list(self.tasks.values())
+        return [task for task in self.tasks.values() if matches(task, filter_)]
+
+    # ============== 스냅샷 ==============
+
+    def encode_snapshot(self) -> bytes:
+        """현재 상태를 스냅샷 바이트로 직렬화."""
+        meta = json.dumps(
+            {
+                "database_id": self.database_id,
+                "watermark": self.watermark,
+                "full_synced_at": self.full_synced_at,
+                "saved_at": time.time(),
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        payload = json.dumps(
+            [_encode(task) for task in self.tasks.values()],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(self.tasks), len(meta), len(payload))
+        return header + meta + payload
+
+    def save(self) -> None:
+        """스냅샷 저장."""
+        self.dirty = False
+        self.write_snapshot(self.encode_snapshot())
+
+    def write_snapshot(self, data: bytes) -> None:
+        """스냅샷 바이트를 원자적으로 기록 (임시 파일에 쓴 뒤 교체).
+
+        이벤트 루프에서 encode_snapshot()으로 직렬화하고 파일 쓰기만 다른 스레드에서 할 때 사용한다.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".snapshot-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def load(self) -> bool:
+        """스냅샷을 메모리 맵으로 읽어 복원.
+
+        Returns:
+            복원 성공 여부. 파일이 없거나 형식/DB가 다르면 False.
+        """
+        try:
+            with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, _, count, meta_len, payload_len = _HEADER.unpack_from(mm, 0)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                    return False
+                offset = _HEADER.size
+                meta = json.loads(mm[offset:offset + meta_len])
+                if meta.get("database_id") != self.database_id:
+                    return False
+                offset += meta_len
+                rows = json.loads(mm[offset:offset + payload_len])
+        except (OSError, ValueError, struct.error):
+            return False
+
+        if len(rows) != count:
+            return False
+        try:
+            tasks = [_decode(row) for row in rows]
+        except (TypeError, ValueError):
+            return False
+        self.tasks = {task.id: task for task in tasks}
+        self.watermark = meta.get("watermark")
+        self.full_synced_at = meta.get("full_synced_at")
+        self.dirty = False
+        return True
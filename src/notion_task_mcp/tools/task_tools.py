@@ -1,399 +1,580 @@
-"""Task 관련 MCP Tools."""
+"""Task 관련 MCP Tools.
 
-from datetime import date
-from typing import Any
+도구 스키마는 인자 모델(Pydantic)에서 한 번만 생성하여 재사용하고,
+도구 호출은 이름 → 핸들러 디스패치 테이블로 처리한다.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Literal
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from ..client_pool import ClientPool
+from ..deadline import MAX_TIMEOUT, ToolTimeouts, track_completed
 from ..models import (
-    Priority,
-    StatusGroup,
+    BatchItemResult,
+    DeferredModel,
+    SortField,
+    Task,
+    TaskBatchUpdate,
     TaskCreate,
     TaskFilter,
     TaskStatus,
-    TaskType,
-    TaskUpdate,
 )
 from ..notion_client import NotionTaskClient
+from ..profiling import ToolProfiler
+from ..store import sort_tasks
+
+# ============== 도구 인자 모델 ==============
+
+
+class NoArgs(DeferredModel):
+    """인자가 없는 도구."""
+
+
+class TaskIdArgs(DeferredModel):
+    """Task ID 하나를 받는 도구 인자."""
+
+    task_id: str = Field(description="Notion 페이지 ID")
+
+
+# 관련 항목을 요약으로 펼칠 필드
+Expand = Literal["parent", "children"]
+
+
+class GetTaskArgs(TaskIdArgs):
+    """get_task 인자."""
+
+    expand: list[Expand] = Field(
+        default_factory=list,
+        description='상위/하위 항목을 {id, no, title, status} 요약으로 펼침 (["parent", "children"])',
+    )
+
+
+class TaskContentArgs(TaskIdArgs):
+    """get_task_content 인자."""
+
+    max_depth: int = Field(
+        default=NotionTaskClient.CONTENT_MAX_DEPTH, ge=1, le=10, description="하위 블록 깊이 (1이면 최상위 블록만)"
+    )
+    max_chars: int = Field(
+        default=NotionTaskClient.CONTENT_MAX_CHARS, ge=100, le=200_000, description="최대 글자 수 (넘으면 잘림)"
+    )
+
+
+class TaskIdsArgs(DeferredModel):
+    """Task ID 목록을 받는 도구 인자."""
+
+    task_ids: list[str] = Field(description="Notion 페이지 ID 목록")
+
+
+class ListTasksArgs(TaskFilter):
+    """list_tasks 인자."""
+
+    page_size: int = Field(default=100, description="페이지 크기 (기본값: 100)")
+    expand: list[Expand] = Field(
+        default_factory=list,
+        description='상위/하위 항목을 {id, no, title, status} 요약으로 펼침 (["parent", "children"]). '
+        "결과 전체의 관련 ID를 모아 한 번에 조회",
+    )
+    sort_by: SortField | None = Field(default=None, description="정렬 기준 (빈 값은 맨 뒤)")
+    descending: bool = Field(default=False, description="내림차순 정렬")
+
+
+class ArchiveFilter(TaskFilter):
+    """delete_tasks의 필터 조건.
+
+    모르는 키는 무시하지 않고 거부하며, 조건이 하나도 없으면 DB 전체가 대상이 되므로 거부한다.
+    """
+
+    model_config = ConfigDict(defer_build=True, extra="forbid")
+
+    @model_validator(mode="after")
+    def _require_condition(self) -> "ArchiveFilter":
+        if not any(self.model_dump().values()):
+            raise ValueError("filter에 조건이 하나 이상 필요합니다.")
+        return self
+
+
+class DeleteTasksArgs(DeferredModel):
+    """delete_tasks 인자."""
+
+    task_ids: list[str] = Field(default_factory=list, description="Notion 페이지 ID 목록")
+    filter: ArchiveFilter | None = Field(
+        default=None, description="아카이브할 Task 필터 조건 (list_tasks와 동일, 조건 하나 이상 필수)"
+    )
+
+
+class BatchUpdateArgs(DeferredModel):
+    """batch_update 인자."""
+
+    updates: list[TaskBatchUpdate] = Field(description="Task별 수정 내용 목록")
+
+
+class BatchUpdateStatusArgs(TaskIdsArgs):
+    """batch_update_status 인자."""
+
+    status: TaskStatus = Field(description="변경할 상태")
+
+
+class BatchUpdateAssigneeArgs(TaskIdsArgs):
+    """batch_update_assignee 인자."""
+
+    assignee: str = Field(description="담당자 ID")
+
+
+# ============== 응답 변환 ==============
+
+
+def task_to_dict(task: Task) -> dict[str, Any]:
+    """Task를 딕셔너리로 변환. 여러 DB를 함께 조회하면 원본 DB 이름(database)도 포함."""
+    result = {
+        "id": task.id,
+        "no": task.no,
+        "title": task.title,
+        "type": task.task_type.value,
+        "status": task.status.value,
+        "status_group": task.status_group.value,
+        "priority": task.priority.value if task.priority else None,
+        "assignee": task.assignee,
+        "assignee_name": task.assignee_name,
+        "creator": task.creator,
+        "start_date": task.start_date.isoformat() if task.start_date else None,
+        "end_date": task.end_date.isoformat() if task.end_date else None,
+        "labels": task.labels,
+        "services": task.services,
+        "parent_id": task.parent_id,
+        "children_ids": task.children_ids,
+    }
+    if task.database is not None:
+        result["database"] = task.database
+    return result
+
+
+def tasks_result(tasks: list[Task]) -> dict[str, Any]:
+    """Task 목록 응답."""
+    return {"count": len(tasks), "tasks": [task_to_dict(t) for t in tasks]}
+
+
+def task_summary(task: Task) -> dict[str, Any]:
+    """관련 항목 요약."""
+    return {"id": task.id, "no": task.no, "title": task.title, "status": task.status.value}
+
+
+async def expand_tasks(client: NotionTaskClient, tasks: list[Task], expand: list[Expand]) -> list[dict[str, Any]]:
+    """Task 목록을 딕셔너리로 바꾸고 상위/하위 항목을 요약으로 펼친다.
+
+    결과 전체에서 참조하는 ID를 모아 중복 없이 한 번에 조회한다 (결과에 이미 있는 Task는 조회하지 않음).
+    조회하지 못한 항목은 {"id", "error"}로 남긴다.
+    """
+    items = [task_to_dict(task) for task in tasks]
+    if not expand:
+        return items
+
+    known = {task.id: task for task in tasks}
+    referenced: list[str] = []
+    for task in tasks:
+        if "parent" in expand and task.parent_id:
+            referenced.append(task.parent_id)
+        if "children" in expand:
+            referenced.extend(task.children_ids)
+    known.update(await client.get_tasks(task_id for task_id in referenced if task_id not in known))
+
+    def summary(task_id: str) -> dict[str, Any]:
+        task = known.get(task_id)
+        return task_summary(task) if task else {"id": task_id, "error": "조회하지 못했습니다."}
+
+    for task, item in zip(tasks, items, strict=True):
+        if "parent" in expand:
+            item["parent"] = summary(task.parent_id) if task.parent_id else None
+        if "children" in expand:
+            item["children"] = [summary(child_id) for child_id in task.children_ids]
+    return items
+
+
+def batch_result(results: list[BatchItemResult], include_task: bool) -> dict[str, Any]:
+    """일괄 처리 결과를 딕셔너리로 변환."""
+    items = []
+    for r in results:
+        item: dict[str, Any] = {"task_id": r.task_id, "success": r.success}
+        if r.error:
+            item["error"] = r.error
+        if include_task and r.task:
+            item["task"] = task_to_dict(r.task)
+        items.append(item)
+    succeeded = sum(1 for r in results if r.success)
+    return {
+        "count": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": items,
+    }
+
+
+# ============== 도구 핸들러 ==============
+
+
+async def _get_task(client: NotionTaskClient, args: GetTaskArgs) -> Any:
+    [item] = await expand_tasks(client, [await client.get_task(args.task_id)], args.expand)
+    return item
+
+
+async def _get_task_content(client: NotionTaskClient, args: TaskContentArgs) -> Any:
+    content = await client.get_task_content(args.task_id, args.max_depth, args.max_chars)
+    return content.model_dump()
+
+
+async def _list_tasks(client: NotionTaskClient, args: ListTasksArgs) -> Any:
+    tasks = await client.list_tasks(
+        filter_=args, page_size=args.page_size, sort_by=args.sort_by, descending=args.descending
+    )
+    return {"count": len(tasks), "tasks": await expand_tasks(client, tasks, args.expand)}
 
 
-def register_task_tools(server: Server, client: NotionTaskClient) -> None:
-    """Task 관련 MCP 도구들을 서버에 등록."""
+async def _create_task(client: NotionTaskClient, args: TaskCreate) -> Any:
+    return task_to_dict(await client.create_task(args))
+
+
+async def _update_task(client: NotionTaskClient, args: TaskBatchUpdate) -> Any:
+    return task_to_dict(await client.update_task(args.task_id, args))
+
+
+async def _delete_task(client: NotionTaskClient, args: TaskIdArgs) -> Any:
+    success = await client.delete_task(args.task_id)
+    return {"success": success, "task_id": args.task_id}
+
+
+async def _delete_tasks(client: NotionTaskClient, args: DeleteTasksArgs) -> Any:
+    if not args.task_ids and args.filter is None:
+        raise ValueError("task_ids 또는 filter 중 하나는 필요합니다.")
+    results = await client.delete_tasks(args.task_ids) if args.task_ids else []
+    if args.filter is not None:
+        done_ids = {r.task_id for r in results}
+        filtered = await client.delete_tasks_by_filter(args.filter)
+        results += [r for r in filtered if r.task_id not in done_ids]
+    return batch_result(results, include_task=False)
+
+
+async def _restore_tasks(client: NotionTaskClient, args: TaskIdsArgs) -> Any:
+    return batch_result(await client.restore_tasks(args.task_ids), include_task=True)
+
+
+async def _batch_update(client: NotionTaskClient, args: BatchUpdateArgs) -> Any:
+    return batch_result(await client.batch_update(args.updates), include_task=True)
+
+
+async def _batch_update_status(client: NotionTaskClient, args: BatchUpdateStatusArgs) -> Any:
+    return tasks_result(await client.batch_update_status(args.task_ids, args.status))
+
+
+async def _batch_update_assignee(client: NotionTaskClient, args: BatchUpdateAssigneeArgs) -> Any:
+    return tasks_result(await client.batch_update_assignee(args.task_ids, args.assignee))
+
+
+async def _server_stats(client: NotionTaskClient, args: NoArgs) -> Any:
+    stats = client.metrics.snapshot()
+    if client.store is not None:
+        stats["store"] = {
+            "tasks": len(client.store),
+            "warm": client.store.warm,
+            "watermark": client.store.watermark,
+            "dirty": client.store.dirty,
+        }
+    return stats
+
+
+# ============== 부분 결과 (제한 시간 초과) ==============
+
+
+def _list_tasks_partial(args: ListTasksArgs, done: list[Task]) -> Any:
+    return tasks_result(sort_tasks(done, args.sort_by, args.descending) if args.sort_by else done)
+
+
+def _archive_partial(args: DeleteTasksArgs, done: list[BatchItemResult]) -> Any:
+    # ID 목록과 필터에 함께 걸린 Task는 한 번만
+    return batch_result(list({r.task_id: r for r in done}.values()), include_task=False)
+
+
+def _batch_partial(args: Any, done: list[BatchItemResult]) -> Any:
+    return batch_result(done, include_task=True)
+
+
+def _tasks_partial(args: Any, done: list[Task]) -> Any:
+    return tasks_result(done)
+
+
+# ============== 도구 레지스트리 ==============
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """MCP 도구 정의 (인자 모델 + 핸들러).
+
+    partial이 있으면 제한 시간을 넘겼을 때 그때까지 완료된 항목(인자, 항목 목록)으로 부분 결과를 만든다.
+    """
+
+    name: str
+    description: str
+    args_model: type[BaseModel]
+    handler: Callable[[NotionTaskClient, Any], Awaitable[Any]]
+    partial: Callable[[Any, list[Any]], Any] | None = None
+
+
+TOOL_SPECS: list[ToolSpec] = [
+    ToolSpec(
+        "get_task",
+        "Task 단건 조회. Notion 페이지 ID로 특정 Task의 상세 정보를 가져옵니다. "
+        "expand로 상위/하위 항목의 제목과 상태를 함께 받을 수 있습니다.",
+        GetTaskArgs,
+        _get_task,
+    ),
+    ToolSpec(
+        "get_task_content",
+        "Task 페이지 본문(설명, 체크리스트 등)을 Markdown으로 조회합니다. "
+        "하위 블록은 max_depth까지 따라가고, max_chars를 넘으면 잘라서 truncated=true로 표시합니다.",
+        TaskContentArgs,
+        _get_task_content,
+    ),
+    ToolSpec(
+        "list_tasks",
+        "Task 목록 조회. 다양한 필터 조건으로 Task들을 검색합니다. "
+        "expand로 상위/하위 항목 요약을 함께 받으면 get_task를 따로 호출하지 않아도 됩니다.",
+        ListTasksArgs,
+        _list_tasks,
+        _list_tasks_partial,
+    ),
+    ToolSpec("create_task", "새 Task 생성.", TaskCreate, _create_task),
+    ToolSpec("update_task", "기존 Task 수정.", TaskBatchUpdate, _update_task),
+    ToolSpec("delete_task", "Task 삭제 (아카이브).", TaskIdArgs, _delete_task),
+    ToolSpec(
+        "delete_tasks",
+        "여러 Task 일괄 삭제 (아카이브). task_ids 또는 filter 중 하나 이상을 지정합니다. "
+        "filter를 지정하면 조건에 맞는 모든 Task를 조회한 뒤 아카이브합니다 (조건이 없는 filter는 거부).",
+        DeleteTasksArgs,
+        _delete_tasks,
+        _archive_partial,
+    ),
+    ToolSpec("restore_tasks", "아카이브된 여러 Task를 일괄 복원합니다.", TaskIdsArgs, _restore_tasks, _batch_partial),
+    ToolSpec(
+        "batch_update",
+        "여러 Task를 각기 다른 값으로 일괄 수정합니다. "
+        "같은 Task를 대상으로 하는 항목은 병합되며, 뒤에 오는 항목의 값이 우선합니다.",
+        BatchUpdateArgs,
+        _batch_update,
+        _batch_partial,
+    ),
+    ToolSpec(
+        "batch_update_status",
+        "여러 Task의 상태를 일괄 변경합니다.",
+        BatchUpdateStatusArgs,
+        _batch_update_status,
+        _tasks_partial,
+    ),
+    ToolSpec(
+        "batch_update_assignee",
+        "여러 Task의 담당자를 일괄 변경합니다.",
+        BatchUpdateAssigneeArgs,
+        _batch_update_assignee,
+        _tasks_partial,
+    ),
+    ToolSpec(
+        "server_stats",
+        "서버 성능 통계. 도구별/Notion 엔드포인트별 응답 시간 분위수, 요청/응답 바이트, "
+        "429·재시도 횟수, 캐시 적중률을 반환합니다.",
+        NoArgs,
+        _server_stats,
+    ),
+]
+
+TOOL_HANDLERS: dict[str, ToolSpec] = {spec.name: spec for spec in TOOL_SPECS}
+
+# 클라이언트 풀 사용 시 모든 도구에 추가되는 프로필 선택 인자
+PROFILE_ARG = "profile"
+# 모든 도구에 추가되는 제한 시간 인자 (초)
+TIMEOUT_ARG = "timeout"
+
+
+def _inline_schema(node: Any, defs: dict[str, Any]) -> Any:
+    """Pydantic JSON 스키마를 MCP 클라이언트가 다루기 쉬운 형태로 정리.
+
+    $ref를 펼치고, `X | None`의 anyOf를 X로 접고, 자동 생성 title과 null 기본값을 제거한다.
+    """
+    if isinstance(node, list):
+        return [_inline_schema(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    if "$ref" in node:
+        target = defs[node["$ref"].rsplit("/", 1)[-1]]
+        merged = {**target, **{k: v for k, v in node.items() if k != "$ref"}}
+        return _inline_schema(merged, defs)
+
+    if "anyOf" in node:
+        options = [opt for opt in node["anyOf"] if opt.get("type") != "null"]
+        if len(options) == 1:
+            rest = {k: v for k, v in node.items() if k != "anyOf"}
+            return _inline_schema({**options[0], **rest}, defs)
+
+    result: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("$defs", "title"):
+            continue
+        if key == "default" and value is None:
+            continue
+        if key == "properties":
+            result[key] = {name: _inline_schema(prop, defs) for name, prop in value.items()}
+        else:
+            result[key] = _inline_schema(value, defs)
+    return result
+
+
+def build_input_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """인자 모델로부터 도구 inputSchema 생성."""
+    schema = model.model_json_schema()
+    schema.pop("description", None)  # 모델 docstring은 도구 description과 중복
+    return _inline_schema(schema, schema.get("$defs", {}))  # type: ignore[no-any-return]
+
+
+def build_tools(profiles: list[str] | None = None) -> list[Tool]:
+    """레지스트리의 모든 도구 정의 생성.
+
+    모든 도구에 선택 인자 timeout(초)을 추가한다.
+
+    Args:
+        profiles: 클라이언트 풀의 프로필 이름. 있으면 모든 도구에 선택 인자 profile을 추가한다.
+    """
+    tools = [
+        Tool(name=spec.name, description=spec.description, inputSchema=build_input_schema(spec.args_model))
+        for spec in TOOL_SPECS
+    ]
+    for tool, spec in zip(tools, TOOL_SPECS, strict=True):
+        properties = tool.inputSchema.setdefault("properties", {})
+        properties[TIMEOUT_ARG] = {
+            "type": "number",
+            "exclusiveMinimum": 0,
+            "maximum": MAX_TIMEOUT,
+            "description": "제한 시간(초). 넘으면 남은 Notion 요청을 중단"
+            + (" (지금까지 완료된 항목을 partial=true로 반환)" if spec.partial else ""),
+        }
+        if profiles:
+            properties[PROFILE_ARG] = {
+                "type": "string",
+                "enum": profiles,
+                "description": "사용할 워크스페이스 프로필 (기본값: 기본 프로필)",
+            }
+    return tools
+
+
+async def dispatch_tool(
+    client: NotionTaskClient,
+    name: str,
+    arguments: dict[str, Any],
+    pool: ClientPool | None = None,
+    timeouts: ToolTimeouts | None = None,
+) -> list[TextContent]:
+    """도구 호출을 디스패치 테이블로 처리하고 JSON 응답 생성.
+
+    pool이 있고 인자에 profile이 있으면 그 프로필의 클라이언트로 처리한다.
+    제한 시간(timeout 인자 또는 timeouts 설정)을 넘기면 처리를 취소하고, 부분 결과를 지원하는 도구는
+    그때까지 완료된 항목을 partial=true로 반환한다. 취소(MCP 취소 알림)는 그대로 전파한다.
+    도구별 전체 처리 시간과 JSON 직렬화 시간을 메트릭에 기록한다.
+    """
+    spec = TOOL_HANDLERS.get(name)
+    if spec is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+    metrics = client.metrics
+    started = time.perf_counter()
+    try:
+        args = spec.args_model.model_validate(arguments)
+        timeout = (timeouts or ToolTimeouts(None)).for_tool(name, arguments.get(TIMEOUT_ARG))
+        deadline = asyncio.timeout(timeout)
+        with track_completed() as completed:
+            try:
+                async with deadline:
+                    profile = arguments.get(PROFILE_ARG)
+                    if pool is not None and profile:
+                        async with pool.acquire(profile) as target:
+                            result = await spec.handler(target, args)
+                    else:
+                        result = await spec.handler(client, args)
+            except TimeoutError:
+                if not deadline.expired():
+                    raise
+                message = f"제한 시간({timeout:g}초)을 넘어 중단했습니다."
+                if spec.partial is None:
+                    raise TimeoutError(message) from None
+                result = {
+                    **spec.partial(args, completed),
+                    "partial": True,
+                    "reason": f"{message} 그때까지 완료된 항목만 포함합니다.",
+                }
+        serializing = time.perf_counter()
+        text = json.dumps(result, ensure_ascii=False, indent=2)
+        metrics.observe_stage("serialize", time.perf_counter() - serializing)
+
+    except asyncio.CancelledError:
+        metrics.observe_tool(name, time.perf_counter() - started, error=True)
+        raise
+    except Exception as e:
+        metrics.observe_tool(name, time.perf_counter() - started, error=True)
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+    metrics.observe_tool(name, time.perf_counter() - started)
+    return [TextContent(type="text", text=text)]
+
+
+def register_task_tools(
+    server: Server,
+    client: NotionTaskClient,
+    profiler: ToolProfiler | None = None,
+    pool: ClientPool | None = None,
+    max_concurrent_calls: int | None = None,
+    timeouts: ToolTimeouts | None = None,
+) -> None:
+    """Task 관련 MCP 도구들을 서버에 등록.
+
+    스키마 생성은 서버 기동(initialize 응답)을 늦추지 않도록 첫 tools/list 요청 때 한 번만 수행한다.
+    HTTP 전송에서는 모든 세션이 같은 서버를 쓰므로, max_concurrent_calls로 프로세스 전체의 동시 도구 호출 수를
+    제한할 수 있다 (대기 시간은 call_queue 단계로 기록).
+
+    Args:
+        server: MCP 서버.
+        client: Notion Task 클라이언트 (profile 인자가 없을 때 사용).
+        profiler: 지정하면 선택된 도구 호출을 표본 추출하여 프로파일링.
+        pool: 프로필별 클라이언트 풀. 지정하면 도구 호출의 profile 인자로 클라이언트를 고른다.
+        max_concurrent_calls: 동시에 처리할 도구 호출 수. 없으면 제한하지 않음.
+        timeouts: 도구별 제한 시간. 없으면 timeout 인자로 지정한 호출만 제한.
+    """
+    tools: list[Tool] = []
+    slots = asyncio.Semaphore(max_concurrent_calls) if max_concurrent_calls else None
 
     @server.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
     async def list_tools() -> list[Tool]:
         """사용 가능한 도구 목록 반환."""
-        return [
-            Tool(
-                name="get_task",
-                description="Task 단건 조회. Notion 페이지 ID로 특정 Task의 상세 정보를 가져옵니다.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "task_id": {
-                            "type": "string",
-                            "description": "Notion 페이지 ID",
-                        },
-                    },
-                    "required": ["task_id"],
-                },
-            ),
-            Tool(
-                name="list_tasks",
-                description="Task 목록 조회. 다양한 필터 조건으로 Task들을 검색합니다.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "task_type": {
-                            "type": "string",
-                            "enum": ["Task", "Epic", "Issue", "Project"],
-                            "description": "타입 필터",
-                        },
-                        "status": {
-                            "type": "string",
-                            "enum": ["보류", "시작전", "진행중", "완료", "배포됨", "보관"],
-                            "description": "상태 필터",
-                        },
-                        "status_group": {
-                            "type": "string",
-                            "enum": ["할일", "진행 중", "완료"],
-                            "description": "상태 그룹 필터",
-                        },
-                        "priority": {
-                            "type": "string",
-                            "enum": ["낮음", "중간", "높음"],
-                            "description": "우선순위 필터",
-                        },
-                        "assignee": {
-                            "type": "string",
-                            "description": "담당자 ID 필터",
-                        },
-                        "labels": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "라벨 필터 (OR 조건)",
-                        },
-                        "services": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "서비스 필터 (OR 조건)",
-                        },
-                        "start_date_from": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "시작일 시작 범위 (YYYY-MM-DD)",
-                        },
-                        "start_date_to": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "시작일 종료 범위 (YYYY-MM-DD)",
-                        },
-                        "end_date_from": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "종료일 시작 범위 (YYYY-MM-DD)",
-                        },
-                        "end_date_to": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "종료일 종료 범위 (YYYY-MM-DD)",
-                        },
-                        "parent_id": {
-                            "type": "string",
-                            "description": "상위 항목 ID 필터",
-                        },
-                        "page_size": {
-                            "type": "integer",
-                            "description": "페이지 크기 (기본값: 100)",
-                            "default": 100,
-                        },
-                    },
-                },
-            ),
-            Tool(
-                name="create_task",
-                description="새 Task 생성.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "제목 (필수)",
-                        },
-                        "task_type": {
-                            "type": "string",
-                            "enum": ["Task", "Epic", "Issue", "Project"],
-                            "description": "타입 (기본값: Task)",
-                        },
-                        "status": {
-                            "type": "string",
-                            "enum": ["보류", "시작전", "진행중", "완료", "배포됨", "보관"],
-                            "description": "상태 (기본값: 시작전)",
-                        },
-                        "priority": {
-                            "type": "string",
-                            "enum": ["낮음", "중간", "높음"],
-                            "description": "우선순위",
-                        },
-                        "assignee": {
-                            "type": "string",
-                            "description": "담당자 ID",
-                        },
-                        "start_date": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "시작일 (YYYY-MM-DD)",
-                        },
-                        "end_date": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "종료일 (YYYY-MM-DD)",
-                        },
-                        "labels": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "라벨 목록",
-                        },
-                        "services": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "서비스 목록",
-                        },
-                        "parent_id": {
-                            "type": "string",
-                            "description": "상위 항목 ID",
-                        },
-                    },
-                    "required": ["title"],
-                },
-            ),
-            Tool(
-                name="update_task",
-                description="기존 Task 수정.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "task_id": {
-                            "type": "string",
-                            "description": "Notion 페이지 ID (필수)",
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "제목",
-                        },
-                        "task_type": {
-                            "type": "string",
-                            "enum": ["Task", "Epic", "Issue", "Project"],
-                            "description": "타입",
-                        },
-                        "status": {
-                            "type": "string",
-                            "enum": ["보류", "시작전", "진행중", "완료", "배포됨", "보관"],
-                            "description": "상태",
-                        },
-                        "priority": {
-                            "type": "string",
-                            "enum": ["낮음", "중간", "높음"],
-                            "description": "우선순위",
-                        },
-                        "assignee": {
-                            "type": "string",
-                            "description": "담당자 ID",
-                        },
-                        "start_date": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "시작일 (YYYY-MM-DD)",
-                        },
-                        "end_date": {
-                            "type": "string",
-                            "format": "date",
-                            "description": "종료일 (YYYY-MM-DD)",
-                        },
-                        "labels": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "라벨 목록",
-                        },
-                        "services": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "서비스 목록",
-                        },
-                        "parent_id": {
-                            "type": "string",
-                            "description": "상위 항목 ID",
-                        },
-                    },
-                    "required": ["task_id"],
-                },
-            ),
-            Tool(
-                name="delete_task",
-                description="Task 삭제 (아카이브).",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "task_id": {
-                            "type": "string",
-                            "description": "Notion 페이지 ID",
-                        },
-                    },
-                    "required": ["task_id"],
-                },
-            ),
-            Tool(
-                name="batch_update_status",
-                description="여러 Task의 상태를 일괄 변경합니다.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "task_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Notion 페이지 ID 목록",
-                        },
-                        "status": {
-                            "type": "string",
-                            "enum": ["보류", "시작전", "진행중", "완료", "배포됨", "보관"],
-                            "description": "변경할 상태",
-                        },
-                    },
-                    "required": ["task_ids", "status"],
-                },
-            ),
-            Tool(
-                name="batch_update_assignee",
-                description="여러 Task의 담당자를 일괄 변경합니다.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "task_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Notion 페이지 ID 목록",
-                        },
-                        "assignee": {
-                            "type": "string",
-                            "description": "담당자 ID",
-                        },
-                    },
-                    "required": ["task_ids", "assignee"],
-                },
-            ),
-        ]
-
-    @server.call_tool()  # type: ignore[untyped-decorator]
+        if not tools:
+            tools.extend(build_tools(pool.names if pool is not None else None))
+        return tools
+
+    # 인자 검증은 인자 모델이 담당하므로 SDK의 jsonschema 검증(호출당 수 ms)은 끈다
+    @server.call_tool(validate_input=False)  # type: ignore[untyped-decorator]
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """도구 호출 처리."""
+        if slots is None:
+            return await run(name, arguments)
+        waiting = time.perf_counter()
+        async with slots:
+            client.metrics.observe_stage("call_queue", time.perf_counter() - waiting)
+            return await run(name, arguments)
 
-        def task_to_dict(task: Any) -> dict[str, Any]:
-            """Task를 딕셔너리로 변환."""
-            return {
-                "id": task.id,
-                "no": task.no,
-                "title": task.title,
-                "type": task.task_type.value,
-                "status": task.status.value,
-                "status_group": task.status_group.value,
-                "priority": task.priority.value if task.priority else None,
-                "assignee": task.assignee,
-                "assignee_name": task.assignee_name,
-                "creator": task.creator,
-                "start_date": task.start_date.isoformat() if task.start_date else None,
-                "end_date": task.end_date.isoformat() if task.end_date else None,
-                "labels": task.labels,
-                "services": task.services,
-                "parent_id": task.parent_id,
-                "children_ids": task.children_ids,
-            }
-
-        def parse_date(value: str | None) -> date | None:
-            """날짜 문자열을 date 객체로 변환."""
-            if value:
-                return date.fromisoformat(value)
-            return None
-
-        import json
-
-        try:
-            if name == "get_task":
-                task = await client.get_task(arguments["task_id"])
-                result = task_to_dict(task)
-
-            elif name == "list_tasks":
-                filter_ = TaskFilter(
-                    task_type=TaskType(arguments["task_type"]) if arguments.get("task_type") else None,
-                    status=TaskStatus(arguments["status"]) if arguments.get("status") else None,
-                    status_group=StatusGroup(arguments["status_group"]) if arguments.get("status_group") else None,
-                    priority=Priority(arguments["priority"]) if arguments.get("priority") else None,
-                    assignee=arguments.get("assignee"),
-                    labels=arguments.get("labels"),
-                    services=arguments.get("services"),
-                    start_date_from=parse_date(arguments.get("start_date_from")),
-                    start_date_to=parse_date(arguments.get("start_date_to")),
-                    end_date_from=parse_date(arguments.get("end_date_from")),
-                    end_date_to=parse_date(arguments.get("end_date_to")),
-                    parent_id=arguments.get("parent_id"),
-                )
-                page_size = arguments.get("page_size", 100)
-                tasks = await client.list_tasks(filter_=filter_, page_size=page_size)
-                result = {"count": len(tasks), "tasks": [task_to_dict(t) for t in tasks]}
-
-            elif name == "create_task":
-                data = TaskCreate(
-                    title=arguments["title"],
-                    task_type=TaskType(arguments["task_type"]) if arguments.get("task_type") else TaskType.TASK,
-                    status=TaskStatus(arguments["status"]) if arguments.get("status") else TaskStatus.NOT_STARTED,
-                    priority=Priority(arguments["priority"]) if arguments.get("priority") else None,
-                    assignee=arguments.get("assignee"),
-                    start_date=parse_date(arguments.get("start_date")),
-                    end_date=parse_date(arguments.get("end_date")),
-                    labels=arguments.get("labels", []),
-                    services=arguments.get("services", []),
-                    parent_id=arguments.get("parent_id"),
-                )
-                task = await client.create_task(data)
-                result = task_to_dict(task)
-
-            elif name == "update_task":
-                task_id = arguments.pop("task_id")
-                update_data = TaskUpdate(
-                    title=arguments.get("title"),
-                    task_type=TaskType(arguments["task_type"]) if arguments.get("task_type") else None,
-                    status=TaskStatus(arguments["status"]) if arguments.get("status") else None,
-                    priority=Priority(arguments["priority"]) if arguments.get("priority") else None,
-                    assignee=arguments.get("assignee"),
-                    start_date=parse_date(arguments.get("start_date")),
-                    end_date=parse_date(arguments.get("end_date")),
-                    labels=arguments.get("labels"),
-                    services=arguments.get("services"),
-                    parent_id=arguments.get("parent_id"),
-                )
-                task = await client.update_task(task_id, update_data)
-                result = task_to_dict(task)
-
-            elif name == "delete_task":
-                success = await client.delete_task(arguments["task_id"])
-                result = {"success": success, "task_id": arguments["task_id"]}
-
-            elif name == "batch_update_status":
-                status = TaskStatus(arguments["status"])
-                tasks = await client.batch_update_status(arguments["task_ids"], status)
-                result = {"count": len(tasks), "tasks": [task_to_dict(t) for t in tasks]}
-
-            elif name == "batch_update_assignee":
-                tasks = await client.batch_update_assignee(
-                    arguments["task_ids"],
-                    arguments["assignee"],
-                )
-                result = {"count": len(tasks), "tasks": [task_to_dict(t) for t in tasks]}
-
-            else:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-            return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
-
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
+    async def run(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        """디스패치 (프로파일링 대상이면 프로파일러 경유)."""
+        if profiler is not None and profiler.should_profile(name):
+            return await profiler.run(name, dispatch_tool(client, name, arguments, pool, timeouts))
+        return await dispatch_tool(client, name, arguments, pool, timeouts)
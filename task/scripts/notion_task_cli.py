@@ -2,54 +2,421 @@
 """Notion Task CLI - Claude Skills용 CLI 스크립트.
 
 사용법:
-    python3 notion_task_cli.py list [--status STATUS] [--priority PRIORITY]
+    python3 notion_task_cli.py list [--status STATUS] [--priority PRIORITY] [--limit N] [--ndjson]
     python3 notion_task_cli.py get <task_id>
     python3 notion_task_cli.py create --title TITLE [--type TYPE] [--priority PRIORITY]
-    python3 notion_task_cli.py update <task_id> [--status STATUS] [--priority PRIORITY]
-    python3 notion_task_cli.py done <task_id>
+    python3 notion_task_cli.py update <task_id|WIRB-N>... [--status STATUS] [--priority PRIORITY]
+    python3 notion_task_cli.py done <task_id|WIRB-N>... (- 이면 stdin에서 읽음)
+    python3 notion_task_cli.py projects | epics | tree [--assignee NOTION_ID]
+    python3 notion_task_cli.py daemon [--idle-timeout SEC] [--status] [--stop]
 
 환경변수:
     NOTION_API_KEY: Notion API 키
     NOTION_DATABASE_ID: Notion 데이터베이스 ID
+    NOTION_BASE_URL: Notion API 주소 (기본 https://api.notion.com, 로컬 가짜 서버 테스트용)
 """
 
 import argparse
+import copy
 import json
 import os
 import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from functools import cache
 from pathlib import Path
-from typing import Any
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
-import ssl
+from typing import TYPE_CHECKING, Any
+
+# http.client / ssl / certifi 등은 첫 요청 때 불러온다.
+# 데몬으로 전달만 하는 실행은 이 모듈들을 불러오지 않아 기동이 빠르다.
+if TYPE_CHECKING:
+    import http.client
+    import ssl
+    from concurrent.futures import ThreadPoolExecutor
 
 
 # ============== Config 로딩 ==============
 
+CONFIG_PATH = Path(__file__).parent.parent / "config.json"
+
+
 def load_config() -> dict[str, Any]:
     """config.json 파일 로드."""
-    config_path = Path(__file__).parent.parent / "config.json"
-    if config_path.exists():
-        with open(config_path, encoding="utf-8") as f:
+    if CONFIG_PATH.exists():
+        with open(CONFIG_PATH, encoding="utf-8") as f:
             return json.load(f)
     return {}
 
 
 CONFIG = load_config()
 
-# SSL 컨텍스트 설정 (macOS 인증서 문제 해결)
-try:
-    import certifi
-    SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
-except ImportError:
-    SSL_CONTEXT = ssl.create_default_context()
-    SSL_CONTEXT.check_hostname = False
-    SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+def notion_setting(key: str, env: str, default: str) -> str:
+    """config.json의 notion 설정 > 환경변수 > 기본값 순서로 값 획득 (0 같은 값도 그대로 사용)."""
+    value = CONFIG.get("notion", {}).get(key)
+    if value is None:
+        value = os.environ.get(env, default)
+    return str(value)
+
+
+@cache
+def ssl_context() -> "ssl.SSLContext":
+    """SSL 컨텍스트 (macOS 인증서 문제 해결). 첫 HTTPS 연결 때 한 번 생성."""
+    import ssl
+
+    try:
+        import certifi
+        return ssl.create_default_context(cafile=certifi.where())
+    except ImportError:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+
+
+# ============== HTTP 연결 ==============
+
+HTTP_TIMEOUT = 30
+MAX_IDLE_CONNECTIONS = 8
+
+
+class HTTPConnectionPool:
+    """한 호스트에 대한 지속(keep-alive) 연결 풀.
+
+    응답을 다 읽은 연결은 유휴 목록에 돌려 두고 다음 요청(다른 스레드 포함)에 재사용하므로
+    요청마다 TCP/TLS 핸드셰이크를 반복하지 않는다. 재사용한 연결이 서버 쪽에서 이미 닫혀 있으면
+    새 연결로 다시 보내고, gzip 응답은 풀어서 돌려준다.
+    """
+
+    def __init__(self, base_url: str, timeout: float = HTTP_TIMEOUT):
+        from urllib.parse import urlsplit
+
+        url = urlsplit(base_url)
+        self.https = url.scheme == "https"
+        self.host = url.hostname or ""
+        self.port = url.port
+        self.path_prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> tuple["http.client.HTTPConnection", bool]:
+        """(연결, 재사용 여부) 반환."""
+        import http.client
+
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.connections_opened += 1
+        if self.https:
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=ssl_context()), False
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout), False
+
+    def _release(self, conn: "http.client.HTTPConnection") -> None:
+        with self._lock:
+            if len(self._idle) < MAX_IDLE_CONNECTIONS:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self, method: str, path: str, body: bytes | None, headers: dict[str, str], idempotent: bool | None = None
+    ) -> tuple[int, bytes]:
+        """요청을 보내고 (상태 코드, 응답 본문) 반환.
+
+        재사용하던 연결이 이미 닫혀 있으면 새 연결로 다시 보낸다. 단 요청을 다 보낸 뒤에 끊긴 경우에는
+        서버가 처리했을 수 있으므로 idempotent 요청만 다시 보낸다 (없으면 GET/HEAD만).
+        """
+        import http.client
+
+        # 재사용하던 연결이 서버 쪽에서 이미 닫혀 있을 때 나는 오류
+        stale_errors = (
+            http.client.RemoteDisconnected,
+            http.client.CannotSendRequest,
+            ConnectionResetError,
+            ConnectionAbortedError,
+            BrokenPipeError,
+        )
+        if idempotent is None:
+            idempotent = method in ("GET", "HEAD")
+        headers = {**headers, "Accept-Encoding": "gzip"}
+        while True:
+            conn, reused = self._acquire()
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except stale_errors:
+                conn.close()
+                if not reused or (sent and not idempotent):
+                    raise
+                continue  # 이미 닫힌 keep-alive 연결: 처리되지 않았거나 다시 보내도 되는 요청이므로 재전송
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            if response.getheader("Content-Encoding") == "gzip":
+                import gzip
+
+                data = gzip.decompress(data)
+            return response.status, data
+
+    def close(self) -> None:
+        """유휴 연결 모두 종료."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class RateLimiter:
+    """스레드 간 공유하는 요청 간격 제한 (초당 최대 요청 수, Notion 평균 3회/초)."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """다음 요청 시각까지 대기."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# ============== 응답 캐시 ==============
+
+DEFAULT_CACHE_TTLS = {"list": 60.0, "get": 60.0, "schema": 300.0}
+
+
+def default_cache_dir() -> Path:
+    """CLI 캐시 디렉터리 (config cache.dir > NOTION_TASK_CACHE_DIR/cli > XDG_CACHE_HOME > ~/.cache)."""
+    if path := CONFIG.get("cache", {}).get("dir"):
+        return Path(path).expanduser()
+    if path := os.environ.get("NOTION_TASK_CACHE_DIR"):
+        return Path(path) / "cli"
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "notion-task-mcp" / "cli"
+
+
+class ResponseCache:
+    """CLI 프로세스 사이에서 공유하는 디스크 응답 캐시.
+
+    조회 응답(`list`: DB 쿼리, `get`: 페이지 조회)을 엔드포인트 + 요청 본문 해시를 키로 저장한다.
+    쓰기 요청이 있으면 세대(generation) 파일을 새 값으로 바꿔 이전 세대의 항목을 모두 무효화한다.
+    모든 파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 여러 프로세스가 동시에 써도
+    깨진 파일을 읽지 않으며, 읽을 수 없는 항목은 캐시 미스로 처리한다.
+    쓰기보다 먼저 시작한 조회가 무효화 뒤에 저장한 응답도 이전 세대로 남으므로 읽히지 않는다.
+    """
+
+    MEMORY_ENTRIES = 512
+    # 페이지 생성/수정으로 바뀌지 않는 응답 (DB 스키마): 세대와 관계없이 TTL까지 유지
+    STABLE_KINDS = ("schema",)
+
+    def __init__(self, directory: Path, ttls: dict[str, float] | None = None):
+        self.directory = directory
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        # 데몬처럼 오래 사는 프로세스에서만 켜는 메모리 계층: {키: (세대, 만료 시각, 응답)}
+        self.memory: dict[str, tuple[str, float, Any]] | None = None
+
+    @classmethod
+    def from_config(cls) -> "ResponseCache | None":
+        """config.json의 cache 설정으로 생성. cache.enabled가 false면 None.
+
+        예: {"cache": {"enabled": true, "ttl": {"list": 60, "get": 120}, "dir": "~/.cache/notion-task-cli"}}
+        """
+        settings = CONFIG.get("cache", {})
+        if settings.get("enabled", True) is False:
+            return None
+        ttls = {kind: float(ttl) for kind, ttl in settings.get("ttl", {}).items()}
+        return cls(default_cache_dir(), ttls)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """요청 구성 요소로 캐시 키 생성."""
+        import hashlib
+
+        raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _write(self, path: Path, text: str) -> None:
+        import tempfile
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def generation(self) -> str:
+        """현재 세대 값 (쓰기마다 바뀜)."""
+        try:
+            return (self.directory / "generation").read_text(encoding="utf-8")
+        except OSError:
+            return ""
+
+    def get(self, kind: str, key: str) -> Any | None:
+        """유효한 항목이 있으면 응답 반환."""
+        if self.ttls.get(kind, 0) <= 0:
+            return None
+        generation = "" if kind in self.STABLE_KINDS else self.generation()
+        if self.memory is not None and (cached := self.memory.get(key)):
+            if cached[0] == generation and cached[1] >= time.time():
+                return cached[2]
+        try:
+            entry = json.loads(self._path(kind, key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("generation") != generation or entry.get("expires", 0) < time.time():
+            return None
+        self._remember(key, generation, entry["expires"], entry.get("response"))
+        return entry.get("response")
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.directory / f"{kind}-{key}.json"
+
+    def _remember(self, key: str, generation: str, expires: float, response: Any) -> None:
+        if self.memory is None:
+            return
+        if len(self.memory) >= self.MEMORY_ENTRIES:
+            self.memory.pop(next(iter(self.memory)), None)
+        self.memory[key] = (generation, expires, response)
+
+    def put(self, kind: str, key: str, response: Any, generation: str) -> None:
+        """응답 저장. generation은 요청을 보내기 전에 읽은 세대 값."""
+        ttl = self.ttls.get(kind, 0)
+        if ttl <= 0:
+            return
+        if kind in self.STABLE_KINDS:
+            generation = ""
+        entry = {"generation": generation, "expires": time.time() + ttl, "response": response}
+        self._remember(key, generation, entry["expires"], response)
+        try:
+            self._write(self._path(kind, key), json.dumps(entry, ensure_ascii=False))
+        except OSError:
+            pass  # 캐시는 최선 노력: 저장 실패가 명령 실패로 이어지지 않게 한다
+
+    def invalidate(self) -> None:
+        """모든 항목 무효화 (세대 교체 후 이전 항목 파일은 최선 노력으로 삭제)."""
+        import uuid
+
+        if self.memory is not None:
+            for key in [key for key, entry in self.memory.items() if entry[0]]:
+                self.memory.pop(key, None)
+
+        try:
+            self._write(self.directory / "generation", uuid.uuid4().hex)
+        except OSError:
+            return
+        for path in self.directory.glob("*.json"):
+            if not path.name.startswith(self.STABLE_KINDS):
+                path.unlink(missing_ok=True)
+
+
+# ============== DB 스키마 ==============
+
+# 옵션 값을 검증/변환하는 속성 타입 (select/status는 없는 옵션을 거부, multi_select는 Notion이 새로 만든다)
+OPTION_TYPES = ("select", "status", "multi_select")
+STRICT_OPTION_TYPES = ("select", "status")
+
+
+def normalize(name: str) -> str:
+    """공백과 대소문자 차이를 무시한 비교용 이름."""
+    return "".join(name.split()).casefold()
+
+
+class SchemaError(ValueError):
+    """요청 값이 DB 스키마와 맞지 않음 (Notion에 요청을 보내기 전에 발생)."""
+
+
+class DatabaseSchema:
+    """databases/{id} 응답의 속성 스키마 (서버의 notion_task_mcp.schema와 같은 규칙)."""
+
+    def __init__(self, properties: dict[str, dict[str, Any]]):
+        self.properties = properties
+        self._names = {normalize(name): name for name in properties}
+        self._options: dict[str, dict[str, str]] = {
+            name: {normalize(option["name"]): option["name"] for option in prop[prop["type"]].get("options", [])}
+            for name, prop in properties.items()
+            if prop.get("type") in OPTION_TYPES
+        }
+
+    def find(self, name: str, prop_type: str | None = None) -> str | None:
+        """속성 이름을 실제 DB 속성 이름으로 변환. 없으면 None.
+
+        띄어쓰기만 다른 이름도 찾고, 없으면 prop_type 타입 속성이 하나뿐일 때 그 속성을 쓴다.
+        """
+        if name in self.properties:
+            return name
+        if found := self._names.get(normalize(name)):
+            return found
+        if prop_type is not None:
+            candidates = [key for key, prop in self.properties.items() if prop.get("type") == prop_type]
+            if len(candidates) == 1:
+                return candidates[0]
+        return None
+
+    def option(self, name: str, value: str) -> str:
+        """옵션 값을 실제 DB 옵션 이름으로 변환. select/status에 없는 값이면 SchemaError."""
+        options = self._options.get(name)
+        if options is None:
+            return value
+        if found := options.get(normalize(value)):
+            return found
+        if self.properties[name].get("type") in STRICT_OPTION_TYPES:
+            raise SchemaError(f"'{value}'은(는) '{name}'에 없는 값입니다. 가능한 값: {', '.join(options.values())}")
+        return value
+
+    def conform_properties(self, properties: dict[str, Any]) -> dict[str, Any]:
+        """pages 생성/수정용 속성의 옵션 이름을 DB 이름으로 바꾸고 검증 (제자리 수정)."""
+        for name, value in properties.items():
+            prop_type = self.properties.get(name, {}).get("type")
+            if prop_type is None:
+                raise SchemaError(f"'{name}' 속성이 DB에 없습니다.")
+            if prop_type in STRICT_OPTION_TYPES and value.get(prop_type):
+                value[prop_type]["name"] = self.option(name, value[prop_type]["name"])
+            elif prop_type == "multi_select":
+                for item in value["multi_select"]:
+                    item["name"] = self.option(name, item["name"])
+        return properties
+
+    def conform_filter(self, filter_: dict[str, Any]) -> dict[str, Any]:
+        """DB 쿼리 필터의 equals 옵션 값을 DB 이름으로 바꾸고 검증 (제자리 수정)."""
+        for compound in ("and", "or"):
+            for condition in filter_.get(compound, []):
+                self.conform_filter(condition)
+        name = filter_.get("property")
+        if name is None:
+            return filter_
+        prop_type = self.properties.get(name, {}).get("type")
+        if prop_type is None:
+            raise SchemaError(f"'{name}' 속성이 DB에 없습니다.")
+        condition = filter_.get(prop_type)
+        if prop_type in OPTION_TYPES and condition and isinstance(condition.get("equals"), str):
+            condition["equals"] = self.option(name, condition["equals"])
+        return filter_
 
 
 # ============== Notion API 클라이언트 ==============
 
-NOTION_API_BASE = "https://api.notion.com/v1"
+NOTION_API_BASE = "https://api.notion.com"
 NOTION_VERSION = "2022-06-28"
 
 
@@ -67,20 +434,112 @@ class NotionTaskClient:
     PROP_END_DATE = "종료일"
     PROP_PARENT = "상위 항목"
     PROP_CHILDREN = "하위 항목"
+    PROP_ID = "ID"
+
+    # DB 스키마로 실제 이름을 찾을 속성. 타입이 지정된 속성은 DB에 그 타입 속성이 하나뿐이면 이름이 달라도 찾는다.
+    SCHEMA_PROPERTIES: dict[str, str | None] = {
+        "PROP_TITLE": "title",
+        "PROP_TYPE": None,
+        "PROP_STATUS": "status",
+        "PROP_PRIORITY": None,
+        "PROP_ASSIGNEE": None,
+        "PROP_LABELS": None,
+        "PROP_SERVICES": None,
+        "PROP_START_DATE": None,
+        "PROP_END_DATE": None,
+        "PROP_PARENT": None,
+        "PROP_CHILDREN": None,
+        "PROP_ID": "unique_id",
+    }
+
+    PAGE_SIZE = 100  # databases.query 최대 page_size
+
+    # 페이지 객체는 relation/title 항목을 이 개수까지만 담는다. 넘으면 페이지 속성 엔드포인트로 전체를 받는다.
+    INLINE_ITEM_LIMIT = 25
+    TRUNCATABLE_PROPERTIES = ("PROP_TITLE", "PROP_PARENT", "PROP_CHILDREN")
+    PROPERTY_CACHE_SIZE = 1024  # (페이지 ID, 속성)별 전체 값 캐시 항목 수 (last_edited_time이 같을 때만 재사용)
+
+    def __init__(self, use_cache: bool = True):
+        """초기화.
 
-    def __init__(self):
+        Args:
+            use_cache: False면 디스크 캐시를 읽지 않는다 (새로 받은 응답은 저장).
+        """
         # config.json > 환경변수 순서로 값 획득
         self.api_key = CONFIG.get("notion", {}).get("api_key") or os.environ.get("NOTION_API_KEY")
         self.database_id = CONFIG.get("notion", {}).get("database_id") or os.environ.get("NOTION_DATABASE_ID")
+        self.base_url = (
+            CONFIG.get("notion", {}).get("base_url") or os.environ.get("NOTION_BASE_URL") or NOTION_API_BASE
+        ).rstrip("/")
 
         if not self.api_key:
             raise ValueError("Notion API Key가 필요합니다. (config.json 또는 NOTION_API_KEY 환경변수)")
         if not self.database_id:
             raise ValueError("Notion Database ID가 필요합니다. (config.json 또는 NOTION_DATABASE_ID 환경변수)")
 
+        self.http = HTTPConnectionPool(self.base_url)
+        self.rate_limiter = RateLimiter(float(notion_setting("rate_limit", "NOTION_RATE_LIMIT", "3")))
+        self.max_concurrency = max(1, int(notion_setting("max_concurrency", "NOTION_MAX_CONCURRENCY", "3")))
+        self._executor: ThreadPoolExecutor | None = None
+        self.cache = ResponseCache.from_config()
+        self.use_cache = use_cache
+        self.schema: DatabaseSchema | None = None
+        self._schema_lock = threading.Lock()
+        # (페이지 ID, 속성 이름) → (last_edited_time, 전체 항목). 데몬에서는 클라이언트 사본끼리 공유
+        self._property_cache: dict[tuple[str, str], tuple[str | None, list[Any]]] = {}
+
+    def ensure_schema(self) -> DatabaseSchema:
+        """DB 스키마를 조회해 속성 이름을 맞춘다 (클라이언트당 한 번, 응답은 디스크 캐시에서 재사용).
+
+        스키마 캐시(cache.ttl.schema, 기본 300초)는 페이지 생성/수정으로 무효화되지 않는다.
+        """
+        if self.schema is None:
+            with self._schema_lock:
+                if self.schema is None:
+                    response = self._request("GET", f"databases/{self.database_id}")
+                    self.apply_schema(DatabaseSchema(response["properties"]))
+        assert self.schema is not None
+        return self.schema
+
+    def apply_schema(self, schema: DatabaseSchema) -> None:
+        """스키마 적용: 속성 이름(PROP_*)을 실제 DB 이름에 맞춘다."""
+        for attr, prop_type in self.SCHEMA_PROPERTIES.items():
+            if found := schema.find(getattr(type(self), attr), prop_type):
+                setattr(self, attr, found)
+        self.schema = schema
+
     def _request(self, method: str, endpoint: str, body: dict | None = None) -> dict:
-        """Notion API 요청."""
-        url = f"{NOTION_API_BASE}/{endpoint}"
+        """Notion API 요청 (디스크 캐시 조회 → 지속 연결로 전송).
+
+        페이지 조회(GET)와 DB 쿼리는 캐시하고, 그 밖의 요청(생성/수정)은 캐시를 무효화한 뒤
+        응답으로 받은 페이지를 조회 캐시에 넣어 둔다.
+        """
+        cache = self.cache
+        if cache is None:
+            return self._send(method, endpoint, body)
+
+        if method == "GET":
+            kind = "schema" if endpoint.startswith("databases/") else "get"
+        else:
+            kind = "list" if endpoint.endswith("/query") else None
+        if kind is None:
+            response = self._send(method, endpoint, body)
+            cache.invalidate()
+            if response.get("object") == "page":
+                key = cache.key(self.base_url, self.database_id, "GET", f"pages/{response['id']}", None)
+                cache.put("get", key, response, cache.generation())
+            return response
+
+        key = cache.key(self.base_url, self.database_id, method, endpoint, body)
+        if self.use_cache and (hit := cache.get(kind, key)) is not None:
+            return hit
+        generation = cache.generation()
+        response = self._send(method, endpoint, body)
+        cache.put(kind, key, response, generation)
+        return response
+
+    def _send(self, method: str, endpoint: str, body: dict | None = None) -> dict:
+        """Notion API 요청 (지속 연결 재사용)."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Notion-Version": NOTION_VERSION,
@@ -88,14 +547,13 @@ class NotionTaskClient:
         }
 
         data = json.dumps(body).encode("utf-8") if body else None
-        req = Request(url, data=data, headers=headers, method=method)
-
-        try:
-            with urlopen(req, context=SSL_CONTEXT) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except HTTPError as e:
-            error_body = e.read().decode("utf-8")
-            raise Exception(f"Notion API Error: {e.code} - {error_body}")
+        self.rate_limiter.acquire()
+        # DB 쿼리는 POST지만 조회이므로 다시 보내도 된다
+        idempotent = method == "GET" or endpoint.endswith("/query")
+        status, raw = self.http.request(method, f"{self.http.path_prefix}/v1/{endpoint}", data, headers, idempotent)
+        if status >= 400:
+            raise Exception(f"Notion API Error: {status} - {raw.decode('utf-8', errors='replace')}")
+        return json.loads(raw.decode("utf-8"))
 
     def _parse_task(self, page: dict[str, Any]) -> dict[str, Any]:
         """Notion 페이지를 딕셔너리로 변환."""
@@ -140,8 +598,8 @@ class NotionTaskClient:
 
         # No (unique_id)
         no = None
-        if "ID" in props and props["ID"].get("unique_id"):
-            unique_id = props["ID"]["unique_id"]
+        if props.get(self.PROP_ID, {}).get("unique_id"):
+            unique_id = props[self.PROP_ID]["unique_id"]
             prefix = unique_id.get("prefix", "")
             number = unique_id.get("number", "")
             no = f"{prefix}-{number}" if prefix else str(number)
@@ -189,8 +647,24 @@ class NotionTaskClient:
         priority: str | None = None,
         assignee: str | None = None,
         task_type: str | None = None,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Task 목록 조회."""
+        return list(self.iter_tasks(status, priority, assignee, task_type, limit))
+
+    def iter_tasks(
+        self,
+        status: str | None = None,
+        priority: str | None = None,
+        assignee: str | None = None,
+        task_type: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Task 목록을 Notion 응답 페이지가 도착하는 대로 하나씩 반환.
+
+        다음 페이지는 앞 페이지를 다 소비한 뒤에 요청하며, limit개를 채우면 더 요청하지 않는다.
+        """
+        schema = self.ensure_schema()
         conditions = []
 
         if status:
@@ -223,29 +697,105 @@ class NotionTaskClient:
                 body["filter"] = conditions[0]
             else:
                 body["filter"] = {"and": conditions}
+            schema.conform_filter(body["filter"])
+
+        for page in self._query_pages(body, limit, complete=True):
+            yield self._parse_task(page)
 
-        tasks = []
+    def _query_pages(
+        self, body: dict[str, Any], limit: int | None = None, complete: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """DB 쿼리 결과 페이지를 커서를 따라가며 하나씩 반환 (limit개를 채우면 중단).
+
+        complete면 응답 페이지마다 잘린 relation/title 속성을 전체 값으로 채운 뒤 반환한다.
+        """
+        remaining = limit
         has_more = True
         start_cursor = None
 
-        while has_more:
+        while has_more and (remaining is None or remaining > 0):
             if start_cursor:
                 body["start_cursor"] = start_cursor
+            if remaining is not None:
+                body["page_size"] = min(self.PAGE_SIZE, remaining)
 
             response = self._request("POST", f"databases/{self.database_id}/query", body)
-            for page in response["results"]:
-                tasks.append(self._parse_task(page))
+            results = response["results"][:remaining]
+            if complete:
+                self._complete_properties(results)
+            yield from results
+            if remaining is not None:
+                remaining -= len(response["results"])
 
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
 
-        return tasks
-
     def get_task(self, task_id: str) -> dict[str, Any]:
         """Task 단건 조회."""
+        self.ensure_schema()
         response = self._request("GET", f"pages/{task_id}")
+        self._complete_properties([response])
         return self._parse_task(response)
 
+    def _is_truncated(self, prop: dict[str, Any]) -> bool:
+        """속성 값이 잘렸는지 여부 (relation은 has_more, title은 상한만큼 찼으면 잘렸을 수 있음)."""
+        if "relation" in prop:
+            return bool(prop.get("has_more"))
+        return len(prop.get("title") or []) >= self.INLINE_ITEM_LIMIT
+
+    def _fetch_property_items(self, page_id: str, property_id: str) -> list[Any]:
+        """페이지 속성 엔드포인트에서 속성 항목 전체를 커서를 따라가며 받는다."""
+        from urllib.parse import quote
+
+        items: list[Any] = []
+        cursor = None
+        while True:
+            query = f"page_size={self.PAGE_SIZE}" + (f"&start_cursor={quote(cursor)}" if cursor else "")
+            response = self._request("GET", f"pages/{page_id}/properties/{property_id}?{query}")
+            items.extend(item[item["type"]] for item in response["results"])
+            if not response.get("has_more"):
+                return items
+            cursor = response["next_cursor"]
+
+    def _complete_properties(self, pages: list[dict[str, Any]]) -> None:
+        """잘린 relation/title 속성을 전체 값으로 채운다 (제자리 수정).
+
+        잘린 속성이 있는 페이지만 작업자 스레드에서 동시에 요청하고(공용 속도 제한),
+        받은 값은 last_edited_time이 같은 동안 재사용한다.
+        """
+        missing: list[tuple[dict[str, Any], str]] = []
+        for page in pages:
+            for attr in self.TRUNCATABLE_PROPERTIES:
+                name = getattr(self, attr)
+                prop = page["properties"].get(name)
+                if not prop or not self._is_truncated(prop):
+                    continue
+                cached = self._property_cache.get((page["id"], name))
+                if cached is not None and cached[0] == page.get("last_edited_time"):
+                    self._fill_property(prop, cached[1])
+                else:
+                    missing.append((page, name))
+
+        def fetch(item: tuple[dict[str, Any], str]) -> list[Any]:
+            page, name = item
+            return self._fetch_property_items(page["id"], page["properties"][name]["id"])
+
+        for (page, name), items in zip(missing, self._map_concurrently(fetch, missing)):
+            self._fill_property(page["properties"][name], items)
+            self._property_cache.pop((page["id"], name), None)
+            self._property_cache[(page["id"], name)] = (page.get("last_edited_time"), items)
+            if len(self._property_cache) > self.PROPERTY_CACHE_SIZE:
+                self._property_cache.pop(next(iter(self._property_cache)))
+
+    @staticmethod
+    def _fill_property(prop: dict[str, Any], items: list[Any]) -> None:
+        """속성 값을 받아 온 전체 항목으로 교체."""
+        if "relation" in prop:
+            prop["relation"] = list(items)
+            prop["has_more"] = False
+        else:
+            prop["title"] = list(items)
+
     def create_task(
         self,
         title: str,
@@ -261,6 +811,7 @@ class NotionTaskClient:
         Args:
             assignee: Notion 사용자 ID (UUID 형식)
         """
+        schema = self.ensure_schema()
         properties: dict[str, Any] = {
             self.PROP_TITLE: {"title": [{"text": {"content": title}}]},
             self.PROP_TYPE: {"select": {"name": task_type}},
@@ -287,10 +838,11 @@ class NotionTaskClient:
 
         body = {
             "parent": {"database_id": self.database_id},
-            "properties": properties,
+            "properties": schema.conform_properties(properties),
         }
 
         response = self._request("POST", "pages", body)
+        self._complete_properties([response])
         return self._parse_task(response)
 
     def update_task(
@@ -308,6 +860,7 @@ class NotionTaskClient:
             start_date: 시작일 (YYYY-MM-DD 형식)
             end_date: 종료일 (YYYY-MM-DD 형식)
         """
+        schema = self.ensure_schema()
         properties: dict[str, Any] = {}
 
         if title:
@@ -325,79 +878,255 @@ class NotionTaskClient:
         if end_date:
             properties[self.PROP_END_DATE] = {"date": {"start": end_date}}
 
-        body = {"properties": properties}
+        body = {"properties": schema.conform_properties(properties)}
         response = self._request("PATCH", f"pages/{task_id}", body)
+        # last_edited_time은 분 단위라 같은 분 안의 수정과 구분되지 않으므로 직접 수정한 페이지는 다시 받는다
+        for key in [key for key in self._property_cache if key[0] == task_id]:
+            self._property_cache.pop(key, None)
+        self._complete_properties([response])
         return self._parse_task(response)
 
     def complete_task(self, task_id: str) -> dict[str, Any]:
         """Task 완료 처리."""
         return self.update_task(task_id, status="완료")
 
-    def get_related_items(self, task_ids: list[str]) -> list[dict[str, Any]]:
-        """여러 Task ID로 상세 정보 조회."""
-        items = []
-        for task_id in task_ids:
+    def resolve_task_refs(self, refs: list[str]) -> tuple[dict[str, str], list[dict[str, str]]]:
+        """Task ID 또는 티켓 번호(WIRB-12) 목록을 페이지 ID로 변환.
+
+        티켓 번호는 ID 속성(unique_id) 조건을 or로 묶어 한 번의 쿼리(100개 단위)로 찾는다.
+
+        Returns:
+            ({참조: 페이지 ID}, 찾지 못한 참조 목록 [{"id", "error"}])
+        """
+        self.ensure_schema()
+        resolved: dict[str, str] = {}
+        tickets: dict[int, list[str]] = {}
+        for ref in dict.fromkeys(refs):
+            prefix, _, number = ref.rpartition("-")
+            if number.isdigit() and (not prefix or prefix.isalpha()):
+                tickets.setdefault(int(number), []).append(ref)
+            else:
+                resolved[ref] = ref
+
+        numbers = list(tickets)
+        for start in range(0, len(numbers), self.PAGE_SIZE):
+            conditions = [
+                {"property": self.PROP_ID, "unique_id": {"equals": number}}
+                for number in numbers[start : start + self.PAGE_SIZE]
+            ]
+            body = {"filter": {"or": conditions}} if len(conditions) > 1 else {"filter": conditions[0]}
+            for page in self._query_pages(body):
+                unique_id = page["properties"][self.PROP_ID]["unique_id"]
+                no = f"{unique_id.get('prefix') or ''}-{unique_id['number']}".upper()
+                for ref in tickets.get(unique_id["number"], []):
+                    if ref.isdigit() or ref.upper() == no:
+                        resolved[ref] = page["id"]
+
+        failures = [
+            {"id": ref, "error": "해당 번호의 Task가 없습니다."}
+            for refs_ in tickets.values()
+            for ref in refs_
+            if ref not in resolved
+        ]
+        return {ref: resolved[ref] for ref in dict.fromkeys(refs) if ref in resolved}, failures
+
+    def bulk_update(self, refs: list[str], **changes: str | None) -> list[dict[str, Any]]:
+        """여러 Task를 같은 내용으로 동시에 수정 (공용 속도 제한 적용).
+
+        Args:
+            refs: Task ID 또는 티켓 번호 목록 (중복은 한 번만 수정)
+            changes: update_task()의 수정 인자 (title, status, priority, start_date, end_date)
+
+        Returns:
+            입력 순서대로 항목별 결과 [{"ref", "id", "ok", "task" 또는 "error"}]
+        """
+        resolved, failures = self.resolve_task_refs(refs)
+        errors = {failure["id"]: failure["error"] for failure in failures}
+
+        def apply(item: tuple[str, str]) -> dict[str, Any]:
+            ref, task_id = item
+            try:
+                return {"ref": ref, "id": task_id, "ok": True, "task": self.update_task(task_id, **changes)}
+            except Exception as e:
+                return {"ref": ref, "id": task_id, "ok": False, "error": str(e)}
+
+        updated = {result["ref"]: result for result in self._map_concurrently(apply, list(resolved.items()))}
+        return [
+            updated.get(ref) or {"ref": ref, "id": None, "ok": False, "error": errors.get(ref, "")}
+            for ref in dict.fromkeys(refs)
+        ]
+
+    def _map_concurrently(self, func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+        """func를 작업자 스레드(최대 max_concurrency개)에서 실행하고 입력 순서대로 결과 반환.
+
+        작업자 스레드는 프로세스 동안 재사용되므로 스레드별 keep-alive 연결도 다시 쓰인다.
+        요청 속도는 공용 RateLimiter가 제한한다.
+        작업자 스레드 안에서 다시 부르면 (동시 조회 중 잘린 속성 보충 등) 풀 교착을 피하려 순서대로 실행한다.
+        """
+        if len(items) <= 1 or threading.current_thread().name.startswith("notion"):
+            return [func(item) for item in items]
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="notion")
+        return list(self._executor.map(func, items))
+
+    def get_related_items(self, task_ids: list[str]) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+        """여러 Task ID로 상세 정보를 동시에 조회.
+
+        Returns:
+            (조회된 Task 목록, 실패 목록 [{"id", "error"}]). 둘 다 입력 순서를 따르며 중복 ID는 한 번만 조회한다.
+        """
+
+        def fetch(task_id: str) -> tuple[dict[str, Any] | None, str | None]:
             try:
-                item = self.get_task(task_id)
+                return self.get_task(task_id), None
+            except Exception as e:
+                return None, str(e)
+
+        ids = list(dict.fromkeys(task_ids))
+        items: list[dict[str, Any]] = []
+        failures: list[dict[str, str]] = []
+        for task_id, (item, error) in zip(ids, self._map_concurrently(fetch, ids)):
+            if item is not None:
                 items.append(item)
-            except Exception:
-                pass
-        return items
-
-    def get_my_projects(self, assignee_id: str | None = None) -> list[dict[str, Any]]:
-        """내가 담당자인 Project 목록 또는 내 Task의 상위 Project 목록."""
-        # 방법 1: 직접 담당자인 Project
-        projects = self.list_tasks(task_type="Project", assignee=assignee_id)
-
-        # 방법 2: 내 Task들의 상위 Project 찾기
-        my_tasks = self.list_tasks(task_type="Task", assignee=assignee_id)
-        parent_ids = set()
-        for task in my_tasks:
-            parent_ids.update(task.get("parent_ids", []))
-
-        if parent_ids:
-            parent_items = self.get_related_items(list(parent_ids))
-            # Project 타입만 필터링
-            for item in parent_items:
-                if item.get("type") == "Project" and item["id"] not in [p["id"] for p in projects]:
-                    projects.append(item)
-
-        return projects
-
-    def get_my_epics(self, assignee_id: str | None = None) -> list[dict[str, Any]]:
-        """내가 담당자인 Epic 목록 또는 내 Task의 상위 Epic 목록."""
-        # 방법 1: 직접 담당자인 Epic
-        epics = self.list_tasks(task_type="Epic", assignee=assignee_id)
-
-        # 방법 2: 내 Task들의 상위 Epic 찾기
-        my_tasks = self.list_tasks(task_type="Task", assignee=assignee_id)
-        parent_ids = set()
-        for task in my_tasks:
-            parent_ids.update(task.get("parent_ids", []))
-
-        if parent_ids:
-            parent_items = self.get_related_items(list(parent_ids))
-            # Epic 타입만 필터링
-            for item in parent_items:
-                if item.get("type") == "Epic" and item["id"] not in [e["id"] for e in epics]:
-                    epics.append(item)
-
-        return epics
+            else:
+                failures.append({"id": task_id, "error": error or ""})
+        return items, failures
+
+    def resolve_hierarchy(self, assignee_id: str | None = None, depth: int = 1) -> dict[str, Any]:
+        """내 Task / Epic / Project 계층을 한 번에 해석 (projects, epics, tree 명령 공용).
+
+        내 Task, Epic, Project 조회를 동시에 실행한 뒤, 아직 모르는 상위 항목만 모아 중복 없이 한 번에 조회한다.
+        depth=2면 상위 Epic의 상위 Project까지 같은 방식으로 한 단계 더 해석한다.
+
+        Returns:
+            {"tasks", "epics", "projects": 목록, "items": {ID: 항목}, "failures": 조회 실패 목록}.
+            projects / epics는 내가 담당자인 항목 다음에 내 Task의 상위 항목을 처음 나온 순서대로 붙인 것이다.
+        """
+        tasks, epics, projects = self._map_concurrently(
+            lambda task_type: self.list_tasks(task_type=task_type, assignee=assignee_id),
+            ["Task", "Epic", "Project"],
+        )
+        items = {item["id"]: item for item in (*projects, *epics, *tasks)}
+        failures: list[dict[str, str]] = []
+        failed: set[str] = set()
+
+        children = tasks
+        for _ in range(depth):
+            missing = [
+                parent_id
+                for child in children
+                for parent_id in child["parent_ids"]
+                if parent_id not in items and parent_id not in failed
+            ]
+            if not missing:
+                break
+            parents, level_failures = self.get_related_items(missing)
+            items.update((parent["id"], parent) for parent in parents)
+            failures.extend(level_failures)
+            failed.update(failure["id"] for failure in level_failures)
+            children = [item for item in items.values() if item["type"] == "Epic"]
+
+        def merge(own: list[dict[str, Any]], task_type: str) -> list[dict[str, Any]]:
+            seen = {item["id"] for item in own}
+            merged = list(own)
+            for task in tasks:
+                for parent_id in task["parent_ids"]:
+                    parent = items.get(parent_id)
+                    if parent is not None and parent["type"] == task_type and parent_id not in seen:
+                        seen.add(parent_id)
+                        merged.append(parent)
+            return merged
+
+        return {
+            "tasks": tasks,
+            "epics": merge(epics, "Epic"),
+            "projects": merge(projects, "Project"),
+            "items": items,
+            "failures": failures,
+        }
+
+    def get_my_projects(
+        self, assignee_id: str | None = None
+    ) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+        """내가 담당자인 Project 목록 또는 내 Task의 상위 Project 목록 (+ 조회 실패한 상위 항목)."""
+        hierarchy = self.resolve_hierarchy(assignee_id)
+        return hierarchy["projects"], hierarchy["failures"]
+
+    def get_my_epics(
+        self, assignee_id: str | None = None
+    ) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+        """내가 담당자인 Epic 목록 또는 내 Task의 상위 Epic 목록 (+ 조회 실패한 상위 항목)."""
+        hierarchy = self.resolve_hierarchy(assignee_id)
+        return hierarchy["epics"], hierarchy["failures"]
+
+
+TYPE_RANK = {"Project": 0, "Epic": 1}
+
+
+def build_tree(hierarchy: dict[str, Any]) -> list[dict[str, Any]]:
+    """resolve_hierarchy 결과를 Project → Epic → Task 트리로 구성.
+
+    각 항목은 계층상 더 위(Project < Epic < Task/Issue)인 첫 번째 상위 항목 아래에 놓이며,
+    그런 상위 항목이 없으면 루트가 된다. 자식은 "children" 키에 담긴다.
+    """
+    items = hierarchy["items"]
+    ordered = list(dict.fromkeys(
+        item["id"] for item in (*hierarchy["projects"], *hierarchy["epics"], *hierarchy["tasks"], *items.values())
+    ))
+    nodes = {item_id: {**items[item_id], "children": []} for item_id in ordered}
+    roots = []
+    for item_id in ordered:
+        node = nodes[item_id]
+        rank = TYPE_RANK.get(node["type"], 2)
+        parent = next(
+            (
+                nodes[parent_id]
+                for parent_id in node["parent_ids"]
+                if parent_id in nodes and TYPE_RANK.get(nodes[parent_id]["type"], 2) < rank
+            ),
+            None,
+        )
+        (parent["children"] if parent else roots).append(node)
+    return roots
 
 
 # ============== CLI 함수 ==============
 
+def create_client(args: argparse.Namespace) -> NotionTaskClient:
+    """전역 옵션(--no-cache)을 반영해 클라이언트 생성.
+
+    데몬 안에서는 연결 풀, 속도 제한, 작업자 스레드, 캐시를 공유하는 사본을 돌려준다.
+    """
+    if DAEMON.client is not None:
+        client = copy.copy(DAEMON.client)
+        client.use_cache = not args.no_cache
+        return client
+    return NotionTaskClient(use_cache=not args.no_cache)
+
+
+def report_failures(failures: list[dict[str, str]]) -> None:
+    """관련 항목 조회 실패를 stderr로 알림 (stdout 출력 형식은 그대로 유지)."""
+    if not failures:
+        return
+    print(f"⚠️ 관련 항목 {len(failures)}개를 조회하지 못했습니다.", file=sys.stderr)
+    for failure in failures:
+        print(f"   {failure['id']}: {failure['error']}", file=sys.stderr)
+
+
 def format_task(task: dict[str, Any], verbose: bool = False) -> str:
     """Task를 문자열로 포맷."""
     priority_emoji = {"높음": "🔴", "중간": "🟡", "낮음": "🟢"}.get(task.get("priority") or "", "⚪")
+    # DB마다 상태 이름의 띄어쓰기가 다를 수 있어 ("진행중"/"진행 중") 정규화한 이름으로 찾는다
     status_emoji = {
-        "진행 중": "🔄",
+        "진행중": "🔄",
         "완료": "✅",
-        "시작 전": "📋",
+        "시작전": "📋",
         "보류": "⏸️",
         "배포됨": "🚀",
         "보관": "📦",
-    }.get(task.get("status") or "", "❓")
+    }.get(normalize(task.get("status") or ""), "❓")
 
     line = f"{status_emoji} [{task.get('no') or task['id'][:8]}] {task['title']}"
 
@@ -418,40 +1147,42 @@ def format_task(task: dict[str, Any], verbose: bool = False) -> str:
     return line
 
 
-def format_tasks_table(tasks: list[dict[str, Any]]) -> str:
-    """Task 목록을 테이블 형식으로 포맷."""
-    if not tasks:
-        return "조회된 Task가 없습니다."
-
-    lines = []
-    lines.append(f"총 {len(tasks)}개의 Task")
-    lines.append("-" * 60)
-
-    for task in tasks:
-        lines.append(format_task(task))
-
-    return "\n".join(lines)
-
-
 def cmd_list(args: argparse.Namespace) -> None:
-    """list 명령어 처리."""
-    client = NotionTaskClient()
-    tasks = client.list_tasks(
+    """list 명령어 처리.
+
+    --ndjson과 표 출력은 페이지가 도착하는 대로 줄 단위로 출력하고, --json은 전체를 모아 한 번에 출력한다.
+    """
+    client = create_client(args)
+    tasks = client.iter_tasks(
         status=args.status,
         priority=args.priority,
         assignee=args.assignee,
         task_type=args.type,
+        limit=args.limit,
     )
 
-    if args.json:
-        print(json.dumps(tasks, ensure_ascii=False, indent=2, default=str))
+    if args.ndjson:
+        for task in tasks:
+            print(json.dumps(task, ensure_ascii=False, separators=(",", ":"), default=str), flush=True)
+    elif args.json:
+        print(json.dumps(list(tasks), ensure_ascii=False, indent=2, default=str))
     else:
-        print(format_tasks_table(tasks))
+        count = 0
+        for task in tasks:
+            if count == 0:
+                print("-" * 60)
+            print(format_task(task), flush=True)
+            count += 1
+        if count:
+            print("-" * 60)
+            print(f"총 {count}개의 Task")
+        else:
+            print("조회된 Task가 없습니다.")
 
 
 def cmd_get(args: argparse.Namespace) -> None:
     """get 명령어 처리."""
-    client = NotionTaskClient()
+    client = create_client(args)
     task = client.get_task(args.task_id)
 
     if args.json:
@@ -462,7 +1193,7 @@ def cmd_get(args: argparse.Namespace) -> None:
 
 def cmd_create(args: argparse.Namespace) -> None:
     """create 명령어 처리."""
-    client = NotionTaskClient()
+    client = create_client(args)
 
     # 담당자 결정: CLI 인자 > config 자동 지정
     assignee = args.assignee
@@ -489,11 +1220,58 @@ def cmd_create(args: argparse.Namespace) -> None:
         print(f"✅ Task 생성 완료: {format_task(task)}")
 
 
+def read_task_refs(args: argparse.Namespace) -> list[str]:
+    """인자의 Task ID/티켓 번호 목록. `-`는 stdin에서 읽는다 (공백, 쉼표, 줄바꿈 구분)."""
+    refs: list[str] = []
+    for ref in args.task_ids:
+        if ref == "-":
+            refs.extend(token for token in args.stdin.read().replace(",", " ").split() if token)
+        else:
+            refs.append(ref)
+    if not refs:
+        raise ValueError("Task ID 또는 티켓 번호가 없습니다.")
+    return refs
+
+
+def print_bulk_results(results: list[dict[str, Any]], as_json: bool, action: str) -> None:
+    """일괄 처리 결과를 항목별로 출력. 실패가 있으면 예외로 종료 코드 1을 만든다."""
+    failed = [result for result in results if not result["ok"]]
+    if as_json:
+        print(json.dumps(results, ensure_ascii=False, indent=2, default=str))
+    else:
+        for result in results:
+            if result["ok"]:
+                print(f"✅ {format_task(result['task'])}")
+            else:
+                print(f"❌ [{result['ref']}] {result['error']}")
+        print("-" * 60)
+        print(f"{action}: 성공 {len(results) - len(failed)}개, 실패 {len(failed)}개")
+    if failed:
+        raise RuntimeError(f"{len(failed)}개 Task를 처리하지 못했습니다.")
+
+
+def run_bulk_update(args: argparse.Namespace, action: str, **changes: str | None) -> None:
+    """update / done 공용: 참조가 하나면 기존 단건 출력, 여러 개(또는 stdin)면 항목별 결과 출력."""
+    refs = read_task_refs(args)
+    client = create_client(args)
+    if len(refs) == 1 and args.task_ids != ["-"]:
+        task_id = next(iter(client.resolve_task_refs(refs)[0].values()), None)
+        if task_id is None:
+            raise ValueError(f"Task를 찾을 수 없습니다: {refs[0]}")
+        task = client.update_task(task_id, **changes)
+        if args.json:
+            print(json.dumps(task, ensure_ascii=False, indent=2, default=str))
+        else:
+            print(f"✅ Task {action}: {format_task(task)}")
+        return
+    print_bulk_results(client.bulk_update(refs, **changes), args.json, action)
+
+
 def cmd_update(args: argparse.Namespace) -> None:
     """update 명령어 처리."""
-    client = NotionTaskClient()
-    task = client.update_task(
-        task_id=args.task_id,
+    run_bulk_update(
+        args,
+        "수정 완료",
         title=args.title,
         status=args.status,
         priority=args.priority,
@@ -501,28 +1279,52 @@ def cmd_update(args: argparse.Namespace) -> None:
         end_date=args.end_date,
     )
 
-    if args.json:
-        print(json.dumps(task, ensure_ascii=False, indent=2, default=str))
-    else:
-        print(f"✅ Task 수정 완료: {format_task(task)}")
-
 
 def cmd_done(args: argparse.Namespace) -> None:
     """done 명령어 처리."""
-    client = NotionTaskClient()
-    task = client.complete_task(args.task_id)
+    run_bulk_update(args, "완료 처리", status="완료")
+
+
+def format_tree(roots: list[dict[str, Any]]) -> str:
+    """트리를 들여쓰기 텍스트로 포맷."""
+    icons = {"Project": "📁 ", "Epic": "🎯 "}
+    lines: list[str] = []
+
+    def walk(node: dict[str, Any], depth: int) -> None:
+        lines.append("    " * depth + icons.get(node["type"], "") + format_task(node))
+        for child in node["children"]:
+            walk(child, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+    return "\n".join(lines)
+
+
+def cmd_tree(args: argparse.Namespace) -> None:
+    """tree 명령어 처리 - 내 Project → Epic → Task 계층."""
+    client = create_client(args)
+    assignee_id = args.assignee or CONFIG.get("user", {}).get("notion_id")
+    hierarchy = client.resolve_hierarchy(assignee_id, depth=2)
+    report_failures(hierarchy["failures"])
+    roots = build_tree(hierarchy)
 
     if args.json:
-        print(json.dumps(task, ensure_ascii=False, indent=2, default=str))
+        print(json.dumps(roots, ensure_ascii=False, indent=2, default=str))
+    elif not roots:
+        print("연관된 Task가 없습니다.")
     else:
-        print(f"✅ Task 완료 처리: {format_task(task)}")
+        print(f"🌳 내 Task 계층 (Project {len(hierarchy['projects'])}개, Epic {len(hierarchy['epics'])}개, "
+              f"Task {len(hierarchy['tasks'])}개)")
+        print("-" * 60)
+        print(format_tree(roots))
 
 
 def cmd_projects(args: argparse.Namespace) -> None:
     """projects 명령어 처리 - 내 Project 목록."""
-    client = NotionTaskClient()
+    client = create_client(args)
     assignee_id = args.assignee or CONFIG.get("user", {}).get("notion_id")
-    projects = client.get_my_projects(assignee_id)
+    projects, failures = client.get_my_projects(assignee_id)
+    report_failures(failures)
 
     if args.json:
         print(json.dumps(projects, ensure_ascii=False, indent=2, default=str))
@@ -538,9 +1340,10 @@ def cmd_projects(args: argparse.Namespace) -> None:
 
 def cmd_epics(args: argparse.Namespace) -> None:
     """epics 명령어 처리 - 내 Epic 목록."""
-    client = NotionTaskClient()
+    client = create_client(args)
     assignee_id = args.assignee or CONFIG.get("user", {}).get("notion_id")
-    epics = client.get_my_epics(assignee_id)
+    epics, failures = client.get_my_epics(assignee_id)
+    report_failures(failures)
 
     if args.json:
         print(json.dumps(epics, ensure_ascii=False, indent=2, default=str))
@@ -554,14 +1357,380 @@ def cmd_epics(args: argparse.Namespace) -> None:
                 print(format_task(e))
 
 
+# ============== 데몬 ==============
+
+DEFAULT_DAEMON_IDLE_TIMEOUT = 600.0
+# 데몬 응답 없이 연결이 끊겨도 다시 직접 실행해도 되는 (읽기 전용) 명령
+RETRY_SAFE_COMMANDS = frozenset({"list", "get", "projects", "epics", "tree"})
+
+
+def daemon_socket_path() -> Path:
+    """데몬 Unix 소켓 경로 (config daemon.socket > XDG_RUNTIME_DIR > 임시 디렉터리, 사용자별)."""
+    if path := CONFIG.get("daemon", {}).get("socket"):
+        return Path(path).expanduser()
+    import tempfile
+
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(base) / f"notion-task-cli-{os.getuid()}.sock"
+
+
+class _DaemonState:
+    """데몬 프로세스 상태 (일반 실행에서는 client가 None)."""
+
+    def __init__(self) -> None:
+        self.client: NotionTaskClient | None = None
+        self.started = time.time()
+        self.last_active = time.monotonic()
+        self.active = 0
+        self.served = 0
+        self.stopping = False
+        self.config_mtime = 0.0
+        self.lock = threading.Lock()
+        # active가 0이 되면 알림 (중지/유휴 종료 시 처리 중인 요청을 기다림)
+        self.drained = threading.Condition(self.lock)
+
+
+DAEMON = _DaemonState()
+
+
+class _ThreadOutput:
+    """스레드별로 출력 대상을 바꿀 수 있는 stdout/stderr 대역 (데몬 전용).
+
+    요청을 처리하는 스레드의 출력은 줄 단위로 모아 그 요청의 소켓으로 보내고,
+    그 밖의 스레드 출력은 원래 스트림으로 보낸다.
+    """
+
+    def __init__(self, default: Any, name: str) -> None:
+        self.default = default
+        self.name = name
+        self._local = threading.local()
+
+    def bind(self, send: Callable[[dict[str, Any]], None] | None) -> None:
+        self._local.send = send
+        self._local.buffer = ""
+
+    def write(self, text: str) -> int:
+        send = getattr(self._local, "send", None)
+        if send is None:
+            return int(self.default.write(text))
+        self._local.buffer += text
+        if "\n" in text:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        send = getattr(self._local, "send", None)
+        if send is None:
+            self.default.flush()
+        elif self._local.buffer:
+            send({self.name: self._local.buffer})
+            self._local.buffer = ""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.default, name)
+
+
+def daemon_env() -> dict[str, str]:
+    """데몬과 같아야 명령을 대신 실행할 수 있는 환경변수 (NOTION_* 전체: 토큰, DB, 주소, 속도 제한, 캐시 위치)."""
+    return {name: value for name, value in os.environ.items() if name.startswith("NOTION_")}
+
+
+def _connect_daemon(path: Path, timeout: float | None = None) -> Any:
+    """데몬 소켓 연결. 실행 중이 아니면 None."""
+    import socket
+
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _daemon_call(
+    request: dict[str, Any], on_frame: Callable[[dict[str, Any]], None], retry_safe: bool = True
+) -> int | None:
+    """데몬에 요청 하나를 보내고 출력 프레임을 on_frame으로 전달. 종료 코드 반환.
+
+    데몬이 없거나, 요청을 보내기 전에 실패했거나, 데몬이 실행하지 않고 거절(fallback 프레임)하면
+    None (호출한 쪽이 직접 실행으로 대체). 요청을 보낸 뒤 아무 응답 없이 끊기면 데몬이 이미 실행했을 수 있으므로
+    retry_safe(읽기 전용)일 때만 None, 아니면 중복 실행을 막기 위해 오류(1)로 끝낸다.
+    """
+    sock = _connect_daemon(daemon_socket_path())
+    if sock is None:
+        return None
+    sent = received = False
+    try:
+        sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        sent = True
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                frame = json.loads(line)
+                if "fallback" in frame:
+                    return None
+                received = True
+                if "exit" in frame:
+                    return int(frame["exit"])
+                on_frame(frame)
+    except OSError:
+        pass
+    finally:
+        sock.close()
+    if not sent or (not received and retry_safe):
+        return None
+    if received:
+        print("Error: 데몬과의 연결이 끊어졌습니다.", file=sys.stderr)
+    else:
+        print("Error: 데몬이 응답 없이 연결을 끊었습니다. 명령이 실행되었는지 확인하세요.", file=sys.stderr)
+    return 1
+
+
+def forward_to_daemon(argv: list[str], stdin: str | None, retry_safe: bool = True) -> int | None:
+    """명령을 실행 중인 데몬에 전달하고 출력을 그대로 중계. 데몬이 없으면 None.
+
+    retry_safe가 아니면(쓰기 명령) 요청을 보낸 뒤에는 직접 실행으로 대체하지 않는다 (_daemon_call).
+    NOTION_* 환경변수도 함께 보내며, 데몬이 시작될 때와 다르면 데몬은 실행하지 않고 직접 실행으로 돌려보낸다.
+    """
+
+    def relay(frame: dict[str, Any]) -> None:
+        for name, stream in (("stdout", sys.stdout), ("stderr", sys.stderr)):
+            if name in frame:
+                stream.write(frame[name])
+                stream.flush()
+
+    return _daemon_call({"argv": argv, "stdin": stdin, "env": daemon_env()}, relay, retry_safe)
+
+
+def _config_mtime() -> float:
+    try:
+        return CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _reload_config_if_changed() -> None:
+    """config.json이 바뀌었으면 다시 읽고 공유 클라이언트를 새로 만든다."""
+    mtime = _config_mtime()
+    if mtime == DAEMON.config_mtime and DAEMON.client is not None:
+        return
+    if mtime != DAEMON.config_mtime:
+        CONFIG.clear()
+        CONFIG.update(load_config())
+        DAEMON.config_mtime = mtime
+    if DAEMON.client is not None:
+        DAEMON.client.http.close()
+    DAEMON.client = NotionTaskClient()
+    if DAEMON.client.cache is not None:
+        DAEMON.client.cache.memory = {}
+
+
+def serve_daemon(idle_timeout: float) -> None:
+    """현재 프로세스에서 데몬 실행 (idle_timeout초 동안 요청이 없으면 종료)."""
+    import io
+    import socketserver
+
+    path = daemon_socket_path()
+    existing = _connect_daemon(path, timeout=1)
+    if existing is not None:
+        existing.close()
+        print(f"이미 데몬이 실행 중입니다: {path}", file=sys.stderr)
+        return
+    path.unlink(missing_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    parser = build_parser()
+    original = sys.stdout, sys.stderr
+    stdout, stderr = _ThreadOutput(sys.stdout, "stdout"), _ThreadOutput(sys.stderr, "stderr")
+    DAEMON.started, DAEMON.last_active, DAEMON.served = time.time(), time.monotonic(), 0
+    DAEMON.stopping = False
+    DAEMON.config_mtime = _config_mtime()
+    _reload_config_if_changed()
+    env = daemon_env()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            line = self.rfile.readline()
+            if not line:
+                return  # 실행 여부만 확인한 연결
+            try:
+                request = json.loads(line)
+            except ValueError:
+                return
+            # 토큰/DB/주소가 다른 셸의 명령을 데몬 설정으로 실행하지 않도록 직접 실행으로 돌려보낸다
+            client_env = request.get("env") or {}
+            if "argv" in request and client_env != env:
+                names = sorted(name for name in env.keys() | client_env.keys() if env.get(name) != client_env.get(name))
+                self._send({"fallback": f"환경변수가 데몬과 다릅니다: {', '.join(names)}"})
+                return
+            # 중지/유휴 종료 판단과 같은 잠금 안에서 받는다. 종료 중이면 실행하지 않고 직접 실행하도록 돌려보낸다
+            with DAEMON.lock:
+                accepted = not DAEMON.stopping
+                if accepted:
+                    DAEMON.active += 1
+            if not accepted:
+                self._send({"fallback": "데몬이 종료 중입니다."})
+                return
+            try:
+                self._handle(request)
+            finally:
+                with DAEMON.lock:
+                    DAEMON.active -= 1
+                    DAEMON.last_active = time.monotonic()
+                    DAEMON.drained.notify_all()
+
+        def _send(self, frame: dict[str, Any]) -> None:
+            self.wfile.write(json.dumps(frame, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+        def _handle(self, request: dict[str, Any]) -> None:
+            control = request.get("control")
+            if control == "status":
+                self._send({"stdout": json.dumps(daemon_status(), ensure_ascii=False) + "\n"})
+                self._send({"exit": 0})
+                return
+            if control == "stop":
+                with DAEMON.lock:
+                    DAEMON.stopping = True
+                self._send({"exit": 0})
+                threading.Thread(target=shutdown_when_drained, daemon=True).start()
+                return
+
+            stdout.bind(self._send)
+            stderr.bind(self._send)
+            try:
+                with DAEMON.lock:
+                    DAEMON.served += 1
+                    _reload_config_if_changed()
+                try:
+                    args = parser.parse_args(request.get("argv", []))
+                    args.stdin = io.StringIO(request.get("stdin") or "")
+                    code = run_command(args)
+                except SystemExit as e:  # argparse 오류
+                    code = e.code if isinstance(e.code, int) else 1
+                stdout.flush()
+                stderr.flush()
+            except OSError:
+                return  # 클라이언트가 먼저 끊음
+            finally:
+                stdout.bind(None)
+                stderr.bind(None)
+            self._send({"exit": code})
+
+    def daemon_status() -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "socket": str(path),
+            "uptime_seconds": round(time.time() - DAEMON.started, 1),
+            "requests": DAEMON.served,
+            "idle_timeout": idle_timeout,
+            "connections_opened": DAEMON.client.http.connections_opened if DAEMON.client else 0,
+        }
+
+    def shutdown_when_drained() -> None:
+        """처리 중인 요청이 모두 끝난 뒤 서버 종료 (DAEMON.stopping이 설정된 상태)."""
+        with DAEMON.lock:
+            DAEMON.drained.wait_for(lambda: DAEMON.active == 0)
+        server.shutdown()
+
+    def watch_idle() -> None:
+        while True:
+            time.sleep(min(idle_timeout, 1.0))
+            with DAEMON.lock:
+                if DAEMON.stopping:
+                    return
+                if DAEMON.active == 0 and time.monotonic() - DAEMON.last_active >= idle_timeout:
+                    DAEMON.stopping = True
+                    break
+        server.shutdown()
+
+    old_umask = os.umask(0o177)  # 소켓은 소유자만 접근 (0600)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(old_umask)
+    # 종료 시 server_close()가 요청 처리 스레드(거절 응답 포함)를 기다리도록 데몬 스레드로 두지 않는다
+    server.daemon_threads = False
+    if idle_timeout > 0:
+        threading.Thread(target=watch_idle, daemon=True).start()
+    sys.stdout, sys.stderr = stdout, stderr  # type: ignore[assignment]
+    try:
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        sys.stdout, sys.stderr = original
+        server.server_close()
+        path.unlink(missing_ok=True)
+        if DAEMON.client is not None:
+            DAEMON.client.http.close()
+            DAEMON.client = None
+
+
+def cmd_daemon(args: argparse.Namespace) -> None:
+    """daemon 명령어 처리 - 백그라운드 데몬 시작 / 상태 / 중지."""
+    if args.stop or args.status:
+        frames: list[dict[str, Any]] = []
+        code = _daemon_call({"control": "stop" if args.stop else "status"}, frames.append)
+        if code is None:
+            print("실행 중인 데몬이 없습니다.")
+        elif args.status:
+            print("".join(frame.get("stdout", "") for frame in frames), end="")
+        else:
+            print("🛑 데몬을 중지했습니다.")
+        return
+
+    idle_timeout = args.idle_timeout
+    if idle_timeout is None:
+        idle_timeout = float(CONFIG.get("daemon", {}).get("idle_timeout", DEFAULT_DAEMON_IDLE_TIMEOUT))
+    if args.foreground:
+        serve_daemon(idle_timeout)
+        return
+
+    import subprocess
+
+    path = daemon_socket_path()
+    if (sock := _connect_daemon(path, timeout=1)) is not None:
+        sock.close()
+        print(f"이미 데몬이 실행 중입니다: {path}")
+        return
+    process = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "daemon", "--foreground", "--idle-timeout", str(idle_timeout)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline and process.poll() is None:
+        if (sock := _connect_daemon(path, timeout=1)) is not None:
+            sock.close()
+            print(f"🟢 데몬 시작 (pid {process.pid}, {path}, 유휴 {idle_timeout:g}초 후 종료)")
+            return
+        time.sleep(0.05)
+    raise RuntimeError("데몬을 시작하지 못했습니다.")
+
+
 # ============== 메인 ==============
 
-def main():
+def positive_int(value: str) -> int:
+    """1 이상의 정수 인자."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("1 이상이어야 합니다")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 파서 생성 (직접 실행과 데몬이 같이 사용)."""
     parser = argparse.ArgumentParser(
         description="Notion Task CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    parser.add_argument("--no-cache", action="store_true", help="디스크 응답 캐시를 읽지 않고 Notion에서 새로 조회")
+    parser.add_argument("--no-daemon", action="store_true", help="실행 중인 데몬이 있어도 직접 실행")
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -571,6 +1740,8 @@ def main():
     list_parser.add_argument("--priority", help="우선순위 필터 (높음, 중간, 낮음)")
     list_parser.add_argument("--assignee", help="담당자 ID 필터")
     list_parser.add_argument("--type", help="타입 필터 (Task, Epic, Issue, Project)")
+    list_parser.add_argument("--limit", type=positive_int, help="최대 개수 (채우면 페이지 조회 중단)")
+    list_parser.add_argument("--ndjson", action="store_true", help="한 줄에 Task 하나씩 JSON으로 바로바로 출력")
     list_parser.set_defaults(func=cmd_list)
 
     # get
@@ -590,7 +1761,7 @@ def main():
 
     # update
     update_parser = subparsers.add_parser("update", help="Task 수정")
-    update_parser.add_argument("task_id", help="Task ID")
+    update_parser.add_argument("task_ids", nargs="+", help="Task ID 또는 티켓 번호 (여러 개 가능, -면 stdin)")
     update_parser.add_argument("--title", help="제목")
     update_parser.add_argument("--status", help="상태")
     update_parser.add_argument("--priority", help="우선순위")
@@ -600,7 +1771,7 @@ def main():
 
     # done
     done_parser = subparsers.add_parser("done", help="Task 완료 처리")
-    done_parser.add_argument("task_id", help="Task ID")
+    done_parser.add_argument("task_ids", nargs="+", help="Task ID 또는 티켓 번호 (여러 개 가능, -면 stdin)")
     done_parser.set_defaults(func=cmd_done)
 
     # projects
@@ -613,15 +1784,55 @@ def main():
     epics_parser.add_argument("--assignee", help="담당자 ID (미지정시 config에서 자동)")
     epics_parser.set_defaults(func=cmd_epics)
 
-    args = parser.parse_args()
+    # tree
+    tree_parser = subparsers.add_parser("tree", help="내 Project → Epic → Task 계층")
+    tree_parser.add_argument("--assignee", help="담당자 ID (미지정시 config에서 자동)")
+    tree_parser.set_defaults(func=cmd_tree)
+
+    # daemon
+    daemon_parser = subparsers.add_parser("daemon", help="연결/캐시를 유지하는 백그라운드 데몬 (Unix 소켓)")
+    daemon_parser.add_argument("--idle-timeout", type=float, help="요청이 없으면 종료할 시간 (초, 기본 600)")
+    daemon_parser.add_argument("--foreground", action="store_true", help="현재 프로세스에서 실행")
+    daemon_parser.add_argument("--status", action="store_true", help="실행 중인 데몬 상태")
+    daemon_parser.add_argument("--stop", action="store_true", help="실행 중인 데몬 중지")
+    daemon_parser.set_defaults(func=cmd_daemon)
 
+    return parser
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """명령 실행. 종료 코드 반환."""
     try:
         args.func(args)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    except BrokenPipeError:
+        raise  # 출력을 받는 쪽이 먼저 닫힘 (예: `| head`) - 오류 메시지 없이 중단
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main():
+    argv = sys.argv[1:]
+    args = build_parser().parse_args(argv)
+    args.stdin = sys.stdin
+
+    try:
+        # 데몬이 실행 중이면 명령을 넘기고, 없으면 직접 실행
+        if args.command != "daemon" and not args.no_daemon and CONFIG.get("daemon", {}).get("enabled", True):
+            stdin = sys.stdin.read() if "-" in argv else None
+            code = forward_to_daemon(argv, stdin, retry_safe=args.command in RETRY_SAFE_COMMANDS)
+            if code is not None:
+                sys.exit(code)
+            if stdin is not None:  # 이미 읽은 stdin을 직접 실행에 넘긴다
+                import io
+
+                args.stdin = io.StringIO(stdin)
+
+        sys.exit(run_command(args))
+    except BrokenPipeError:
+        # 남은 출력을 버려 종료 시 flush 오류가 다시 나지 않게 한다
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
         sys.exit(1)
 
 
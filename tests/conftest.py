@@ -0,0 +1,110 @@
+"""공용 테스트 fixture.
+
+실제 Notion API 없이 NotionTaskClient를 테스트하기 위한 인메모리 SDK 대역을 제공합니다.
+대역의 상태와 쿼리 동작은 가짜 서버(fake_notion.FakeNotionServer)와 같은 FakeDatabase가 맡습니다.
+"""
+
+from typing import Any
+
+import pytest
+
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+
+from .fake_notion import FakeDatabase
+
+TEST_DATABASE_ID = "test-db"
+
+
+def make_page(page_id: str, title: str = "", status: str = "시작전", **extra: Any) -> dict[str, Any]:
+    """테스트용 Notion 페이지 객체 생성."""
+    properties: dict[str, Any] = {
+        "제목": {"title": [{"plain_text": title}]},
+        "상태": {"status": {"name": status}},
+    }
+    properties.update(extra)
+    return {
+        "id": page_id,
+        "archived": False,
+        "last_edited_time": "2026-01-01T00:00:00.000Z",
+        "properties": properties,
+    }
+
+
+class _FakeEndpoint:
+    # 하위 클래스 이름은 SDK와 같게 둔다 (메트릭의 엔드포인트 이름이 클래스 이름에서 나옴)
+
+    def __init__(self, notion: "FakeNotion") -> None:
+        self.notion = notion
+
+
+class PagesEndpoint(_FakeEndpoint):
+    async def retrieve(self, page_id: str) -> dict[str, Any]:
+        self.notion.calls.append(("pages.retrieve", {"page_id": page_id}))
+        return self.notion.database.get_page(page_id)
+
+    async def create(self, parent: dict[str, Any], properties: dict[str, Any]) -> dict[str, Any]:
+        self.notion.calls.append(("pages.create", {"parent": parent, "properties": properties}))
+        return self.notion.database.create_page({"parent": parent, "properties": properties})
+
+    async def update(self, page_id: str, **kwargs: Any) -> dict[str, Any]:
+        self.notion.calls.append(("pages.update", {"page_id": page_id, **kwargs}))
+        return self.notion.database.update_page(page_id, kwargs)
+
+
+class DatabasesEndpoint(_FakeEndpoint):
+    async def retrieve(self, database_id: str) -> dict[str, Any]:
+        self.notion.calls.append(("databases.retrieve", {"database_id": database_id}))
+        return self.notion.database.retrieve()
+
+    async def query(self, database_id: str, **kwargs: Any) -> dict[str, Any]:
+        self.notion.calls.append(("databases.query", {"database_id": database_id, **kwargs}))
+        return self.notion.database.query(kwargs)
+
+
+class FakeNotion:
+    """notion_client.AsyncClient 최소 대역.
+
+    HTTP 없이 가짜 서버와 같은 FakeDatabase를 직접 호출한다 (필터/정렬/커서, 속성 검증이 같음).
+    """
+
+    def __init__(self, database_id: str = TEST_DATABASE_ID) -> None:
+        self.database = FakeDatabase(database_id)
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.pages_endpoint = PagesEndpoint(self)
+        self.databases = DatabasesEndpoint(self)
+
+    @property
+    def pages(self) -> dict[str, dict[str, Any]]:
+        """페이지 ID → 저장된 페이지."""
+        return self.database.pages
+
+    def add(self, page: dict[str, Any]) -> dict[str, Any]:
+        """make_page()로 만든 페이지를 넣고 저장된 페이지를 반환."""
+        return self.database.insert(page)
+
+
+class _FakeSDK:
+    """FakeNotion을 SDK와 같은 속성 구조(client.pages, client.databases)로 노출."""
+
+    def __init__(self, notion: FakeNotion) -> None:
+        self.pages = notion.pages_endpoint
+        self.databases = notion.databases
+
+
+@pytest.fixture
+def fake_notion() -> FakeNotion:
+    """인메모리 Notion 대역."""
+    return FakeNotion()
+
+
+@pytest.fixture
+def fake_client(fake_notion: FakeNotion) -> NotionTaskClient:
+    """인메모리 Notion 대역에 연결된 NotionTaskClient."""
+    client = NotionTaskClient(
+        api_key="test-key",
+        database_id=TEST_DATABASE_ID,
+        rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+    )
+    client.client = _FakeSDK(fake_notion)  # type: ignore[assignment]
+    return client
@@ -0,0 +1,821 @@
+"""로컬 가짜 Notion API 서버.
+
+실제 NOTION_API_KEY 없이 서버/CLI의 성능과 동작을 확인하기 위한 표준 라이브러리 전용 HTTP 서버.
+이 프로젝트가 쓰는 엔드포인트만 구현한다 (Notion-Version 2022-06-28 형식).
+
+    POST  /v1/databases/{id}/query   필터(and/or, 속성/타임스탬프 조건), 정렬, 커서 페이지네이션
+    GET   /v1/databases/{id}         속성 스키마
+    GET   /v1/pages/{id}
+    POST  /v1/pages
+    PATCH /v1/pages/{id}             속성 수정, archived/in_trash
+    GET   /v1/pages/{id}/properties/{property_id}   잘린 relation/title 속성의 전체 값 (커서 페이지네이션)
+    GET   /v1/blocks/{id}/children   페이지 본문 블록 (커서 페이지네이션)
+    PATCH /v1/blocks/{id}/children   블록 추가
+    GET   /_fake/stats               엔드포인트별 요청 수 (테스트/부하 측정용)
+
+지연(latency/jitter), 429 rate_limited, 5xx 오류를 주입할 수 있다.
+페이지 객체의 relation/title은 실제 API처럼 INLINE_ITEM_LIMIT개까지만 담는다 (relation은 has_more=true).
+HTTP/1.1 keep-alive를 지원하고, `Accept-Encoding: gzip` 요청에는 큰 응답을 gzip으로 압축한다.
+
+사용법 (저장소 루트에서):
+    python -m tests.fake_notion --size 10000 --port 8765 --latency 80 --jitter 40
+    NOTION_BASE_URL=http://127.0.0.1:8765 NOTION_API_KEY=fake NOTION_DATABASE_ID=<출력된 ID> notion-task-mcp
+"""
+
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_DATABASE_ID = "fa4e0000-0000-4000-8000-000000000001"
+MAX_PAGE_SIZE = 100
+INLINE_ITEM_LIMIT = 25  # 페이지 객체에 담기는 relation/title 항목 수 상한 (넘으면 잘림)
+GZIP_MIN_SIZE = 1024  # Accept-Encoding: gzip 요청에 대해 이 크기 이상의 응답은 압축 (실제 API와 유사)
+
+# 속성 이름 → (속성 ID, 타입, 선택지). 서버(NotionTaskClient)의 속성 이름을 따른다.
+SCHEMA: dict[str, tuple[str, str, list[str]]] = {
+    "제목": ("title", "title", []),
+    "No": ("%3DNo", "unique_id", []),
+    "타입": ("%3FTy", "select", ["Task", "Epic", "Issue", "Project"]),
+    "상태": ("%3ASt", "status", ["보류", "시작전", "진행중", "완료", "배포됨", "보관"]),
+    "우선순위": ("%40Pr", "select", ["낮음", "중간", "높음"]),
+    "담당자": ("%5BAs", "people", []),
+    "생성자": ("%5DCr", "created_by", []),
+    "시작일": ("%60Sd", "date", []),
+    "종료일": ("%60Ed", "date", []),
+    "라벨": ("%7BLb", "multi_select", ["백엔드", "프론트엔드", "인프라", "버그", "개선", "문서", "API", "DB"]),
+    "서비스": ("%7DSv", "multi_select", ["결제", "주문", "회원", "정산", "알림", "검색", "관리자"]),
+    "상위항목": ("%7EPa", "relation", []),
+    "하위항목": ("%7ECh", "relation", []),
+}
+# 양방향 relation 쌍 (한쪽을 바꾸면 반대쪽도 갱신)
+DUAL_RELATIONS = {"상위항목": "하위항목", "하위항목": "상위항목"}
+
+USERS = [
+    {"object": "user", "id": f"0a0a0000-0000-4000-8000-{i:012d}", "name": name}
+    for i, name in enumerate(["김민준", "이서연", "박지훈", "최수아", "정예준", "강하은", "조도윤", "윤지우"], start=1)
+]
+_USERS_BY_ID = {user["id"]: user for user in USERS}
+
+_TITLE_PREFIXES = ["[결제]", "[주문]", "[회원]", "[정산]", "[알림]", "[검색]", "[관리자]", ""]
+_TITLE_SUBJECTS = ["결제 승인", "주문 목록", "회원 가입", "정산 배치", "푸시 알림", "검색 색인", "관리자 화면"]
+_TITLE_ACTIONS = ["API 개발", "버그 수정", "성능 개선", "리팩토링", "테스트 추가", "모니터링 구축", "문서화"]
+
+
+def notion_time(moment: datetime) -> str:
+    """Notion 형식 시각 문자열 (last_edited_time처럼 분 단위로 내림)."""
+    return moment.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:00.000Z")
+
+
+def _copy(page: dict[str, Any]) -> dict[str, Any]:
+    """응답용 깊은 복사 (이후 상태 변경이 이미 보낸 응답에 섞이지 않도록)."""
+    copied: dict[str, Any] = json.loads(json.dumps(page))
+    return copied
+
+
+def _page_response(page: dict[str, Any]) -> dict[str, Any]:
+    """페이지 응답: 사본에서 relation/title을 INLINE_ITEM_LIMIT개로 자른다 (relation은 has_more 표시)."""
+    copied = _copy(page)
+    for prop in copied["properties"].values():
+        if prop["type"] == "relation" and len(prop["relation"]) > INLINE_ITEM_LIMIT:
+            prop["relation"] = prop["relation"][:INLINE_ITEM_LIMIT]
+            prop["has_more"] = True
+        elif prop["type"] == "title":
+            prop["title"] = prop["title"][:INLINE_ITEM_LIMIT]
+    return copied
+
+
+def _error(status: int, code: str, message: str) -> dict[str, Any]:
+    return {"object": "error", "status": status, "code": code, "message": message}
+
+
+class FakeNotionError(Exception):
+    """Notion 오류 응답으로 바꿔 보낼 예외."""
+
+    def __init__(self, status: int, code: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+# ============== 데이터베이스 상태 ==============
+
+
+class FakeDatabase:
+    """인메모리 Task DB. 모든 접근은 lock으로 직렬화한다."""
+
+    def __init__(
+        self, database_id: str = DEFAULT_DATABASE_ID, prefix: str = "WIRB", renames: dict[str, str] | None = None
+    ) -> None:
+        """초기화.
+
+        Args:
+            database_id: DB ID.
+            prefix: No(unique_id) 접두사.
+            renames: 기본 속성 이름(SCHEMA) → 이 DB의 속성 이름 (DB마다 속성 이름이 다른 경우).
+        """
+        self.database_id = database_id
+        self.prefix = prefix
+        self.renames = renames or {}
+        self.schema = {self._name(name): spec for name, spec in SCHEMA.items()}
+        self.dual_relations = {self._name(name): self._name(other) for name, other in DUAL_RELATIONS.items()}
+        self.pages: dict[str, dict[str, Any]] = {}
+        self.next_number = 1
+        # 블록(또는 페이지) ID → 하위 블록 목록, 블록 ID → 블록이 속한 페이지 ID
+        self.blocks: dict[str, list[dict[str, Any]]] = {}
+        self._block_pages: dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    # ---------- 속성 변환 ----------
+
+    def _name(self, name: str) -> str:
+        """기본 속성 이름의 이 DB 속성 이름."""
+        return self.renames.get(name, name)
+
+    @staticmethod
+    def _rich_text(text: str) -> list[dict[str, Any]]:
+        return [{"type": "text", "text": {"content": text, "link": None}, "plain_text": text, "href": None}]
+
+    @staticmethod
+    def _option(name: str) -> dict[str, Any]:
+        return {"id": f"opt-{name}", "name": name, "color": "default"}
+
+    def _to_response_property(self, name: str, value: dict[str, Any]) -> dict[str, Any]:
+        """요청 형식 속성 값을 응답 형식으로 변환 (스키마 검증 포함)."""
+        if name not in self.schema:
+            raise FakeNotionError(400, "validation_error", f"{name} is not a property that exists.")
+        prop_id, prop_type, options = self.schema[name]
+        result: dict[str, Any] = {"id": prop_id, "type": prop_type}
+
+        if prop_type == "title":
+            result["title"] = self._rich_text("".join(t["text"]["content"] for t in value.get("title", [])))
+        elif prop_type in ("select", "status"):
+            option = value.get(prop_type)
+            if option is not None and prop_type == "status" and option["name"] not in options:
+                raise FakeNotionError(400, "validation_error", f"Invalid status option: {option['name']}")
+            result[prop_type] = self._option(option["name"]) if option else None
+        elif prop_type == "multi_select":
+            result["multi_select"] = [self._option(item["name"]) for item in value.get("multi_select", [])]
+        elif prop_type == "people":
+            result["people"] = [_USERS_BY_ID.get(p["id"], {"object": "user", "id": p["id"]}) for p in value["people"]]
+        elif prop_type == "date":
+            result["date"] = value.get("date")
+        elif prop_type == "relation":
+            result["relation"] = [{"id": r["id"]} for r in value.get("relation", [])]
+            result["has_more"] = False
+        else:
+            raise FakeNotionError(400, "validation_error", f"{name} cannot be updated.")
+        return result
+
+    def _set_relation(self, page: dict[str, Any], name: str, ids: list[str]) -> None:
+        """relation 값을 바꾸고 반대쪽 relation도 맞춘다."""
+        before = [r["id"] for r in page["properties"][name]["relation"]]
+        page["properties"][name]["relation"] = [{"id": i} for i in ids]
+        reverse = self.dual_relations.get(name)
+        if reverse is None:
+            return
+        for other_id in set(before) - set(ids):
+            if other := self.pages.get(other_id):
+                rel = other["properties"][reverse]["relation"]
+                other["properties"][reverse]["relation"] = [r for r in rel if r["id"] != page["id"]]
+        for other_id in set(ids) - set(before):
+            if other := self.pages.get(other_id):
+                other["properties"][reverse]["relation"].append({"id": page["id"]})
+        # 반대쪽 페이지도 수정된 것으로 본다 (실제 API와 같음)
+        edited = notion_time(datetime.now(UTC))
+        for other_id in set(before) ^ set(ids):
+            if other := self.pages.get(other_id):
+                other["last_edited_time"] = edited
+
+    def _empty_page(
+        self, page_id: str, created: datetime, creator: dict[str, Any], defaults: bool = True
+    ) -> dict[str, Any]:
+        """빈 페이지. defaults면 실제 DB처럼 No를 매기고 상태/타입 기본값을 채운다."""
+        number = self.next_number if defaults else None
+        self.next_number += defaults
+        properties: dict[str, Any] = {}
+        for name, (prop_id, prop_type, _) in self.schema.items():
+            prop: dict[str, Any] = {"id": prop_id, "type": prop_type}
+            if prop_type == "title":
+                prop["title"] = []
+            elif prop_type in ("select", "status", "date"):
+                prop[prop_type] = None
+            elif prop_type in ("multi_select", "people"):
+                prop[prop_type] = []
+            elif prop_type == "relation":
+                prop.update(relation=[], has_more=False)
+            elif prop_type == "created_by":
+                prop["created_by"] = creator
+            elif prop_type == "unique_id":
+                prop["unique_id"] = {"prefix": self.prefix, "number": number} if defaults else None
+            properties[name] = prop
+        if defaults:
+            properties[self._name("상태")]["status"] = self._option("시작전")
+            properties[self._name("타입")]["select"] = self._option("Task")
+        return {
+            "object": "page",
+            "id": page_id,
+            "created_time": notion_time(created),
+            "last_edited_time": notion_time(created),
+            "created_by": {"object": "user", "id": creator["id"]},
+            "last_edited_by": {"object": "user", "id": creator["id"]},
+            "archived": False,
+            "in_trash": False,
+            "url": f"https://www.notion.so/{page_id.replace('-', '')}",
+            "parent": {"type": "database_id", "database_id": self.database_id},
+            "properties": properties,
+        }
+
+    def _apply(self, page: dict[str, Any], properties: dict[str, Any]) -> None:
+        converted = {name: self._to_response_property(name, value) for name, value in properties.items()}
+        for name, prop in converted.items():
+            if prop["type"] == "relation":
+                self._set_relation(page, name, [r["id"] for r in prop["relation"]])
+            else:
+                page["properties"][name] = prop
+
+    def insert(self, page: dict[str, Any]) -> dict[str, Any]:
+        """응답 형식 속성 일부만 담은 페이지를 그대로 넣는다 (나머지 속성은 No 포함 빈 값). 저장된 페이지를 반환.
+
+        단위 테스트에서 특정 값(잘못된 값 포함)을 가진 페이지를 검증 없이 만들 때 쓴다.
+        """
+        with self.lock:
+            stored = self._empty_page(page["id"], datetime.now(UTC), USERS[0], defaults=False)
+            for name, value in page.get("properties", {}).items():
+                stored["properties"].setdefault(name, {"id": name, "type": next(iter(value))}).update(value)
+            for key in ("archived", "in_trash", "last_edited_time"):
+                if key in page:
+                    stored[key] = page[key]
+            self.pages[stored["id"]] = stored
+            return stored
+
+    def contains(self, block_id: str) -> bool:
+        """페이지 또는 블록이 이 DB에 있는지 여부."""
+        return block_id in self.pages or block_id in self._block_pages
+
+    # ---------- 엔드포인트 ----------
+
+    def create_page(self, body: dict[str, Any], now: datetime | None = None) -> dict[str, Any]:
+        """POST /v1/pages."""
+        if body.get("parent", {}).get("database_id") not in (self.database_id, self.database_id.replace("-", "")):
+            raise FakeNotionError(404, "object_not_found", "Could not find database.")
+        with self.lock:
+            page = self._empty_page(str(uuid.uuid4()), now or datetime.now(UTC), USERS[0])
+            self.pages[page["id"]] = page
+            try:
+                self._apply(page, body.get("properties", {}))
+            except FakeNotionError:
+                del self.pages[page["id"]]
+                raise
+            return _page_response(page)
+
+    def get_page(self, page_id: str) -> dict[str, Any]:
+        """GET /v1/pages/{id}."""
+        with self.lock:
+            return _page_response(self._find(page_id))
+
+    def update_page(self, page_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        """PATCH /v1/pages/{id}."""
+        with self.lock:
+            page = self._find(page_id)
+            if page["archived"] and body.get("archived") is not False and "properties" in body:
+                raise FakeNotionError(400, "validation_error", "Can't edit block that is archived.")
+            self._apply(page, body.get("properties", {}))
+            for flag in ("archived", "in_trash"):
+                if flag in body:
+                    page[flag] = bool(body[flag])
+            page["last_edited_time"] = notion_time(datetime.now(UTC))
+            return _page_response(page)
+
+    def get_property(self, page_id: str, property_id: str, query: dict[str, str]) -> dict[str, Any]:
+        """GET /v1/pages/{id}/properties/{property_id}: relation/title 항목을 커서로 나눠 반환."""
+        page_size = min(int(query.get("page_size", MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+        start = int(query.get("start_cursor", "0") or 0)
+        with self.lock:
+            page = self._find(page_id)
+            prop = next((prop for prop in page["properties"].values() if prop["id"] == property_id), None)
+            if prop is None or prop["type"] not in ("relation", "title"):
+                raise FakeNotionError(404, "object_not_found", f"Could not find property with ID: {property_id}.")
+            items = _copy({"items": prop[prop["type"]]})["items"]
+        chunk = items[start : start + page_size]
+        has_more = start + page_size < len(items)
+        return {
+            "object": "list",
+            "results": [
+                {"object": "property_item", "id": property_id, "type": prop["type"], prop["type"]: item}
+                for item in chunk
+            ],
+            "next_cursor": str(start + page_size) if has_more else None,
+            "has_more": has_more,
+            "type": "property_item",
+            "property_item": {"id": property_id, "type": prop["type"], prop["type"]: {}},
+        }
+
+    def append_blocks(self, block_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        """PATCH /v1/blocks/{id}/children: 요청 형식 블록을 추가하고 페이지를 수정된 것으로 표시."""
+        with self.lock:
+            page_id = block_id if block_id in self.pages else self._block_pages.get(block_id)
+            if page_id is None:
+                raise FakeNotionError(404, "object_not_found", f"Could not find block with ID: {block_id}.")
+            created = []
+            for child in body.get("children", []):
+                block_type = child["type"]
+                value = dict(child[block_type])
+                if "rich_text" in value:
+                    value["rich_text"] = self._rich_text("".join(t["text"]["content"] for t in value["rich_text"]))
+                block = {
+                    "object": "block",
+                    "id": str(uuid.uuid4()),
+                    "type": block_type,
+                    block_type: value,
+                    "has_children": False,
+                }
+                self.blocks.setdefault(block_id, []).append(block)
+                self._block_pages[block["id"]] = page_id
+                created.append(_copy(block))
+            for siblings in self.blocks.values():
+                for block in siblings:
+                    if block["id"] == block_id:
+                        block["has_children"] = True
+            self.pages[page_id]["last_edited_time"] = notion_time(datetime.now(UTC))
+        return {"object": "list", "results": created, "next_cursor": None, "has_more": False}
+
+    def list_blocks(self, block_id: str, query: dict[str, str]) -> dict[str, Any]:
+        """GET /v1/blocks/{id}/children."""
+        page_size = min(int(query.get("page_size", MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+        start = int(query.get("start_cursor", "0") or 0)
+        with self.lock:
+            if block_id not in self.pages and block_id not in self._block_pages:
+                raise FakeNotionError(404, "object_not_found", f"Could not find block with ID: {block_id}.")
+            children = self.blocks.get(block_id, [])
+            chunk = [_copy(block) for block in children[start : start + page_size]]
+            has_more = start + page_size < len(children)
+        return {
+            "object": "list",
+            "results": chunk,
+            "next_cursor": str(start + page_size) if has_more else None,
+            "has_more": has_more,
+            "type": "block",
+            "block": {},
+        }
+
+    def _find(self, page_id: str) -> dict[str, Any]:
+        page = self.pages.get(page_id)
+        if page is None:
+            raise FakeNotionError(
+                404,
+                "object_not_found",
+                f"Could not find page with ID: {page_id}. Make sure the relevant pages "
+                "and databases are shared with your integration.",
+            )
+        return page
+
+    def retrieve(self) -> dict[str, Any]:
+        """GET /v1/databases/{id}."""
+        properties = {}
+        for name, (prop_id, prop_type, options) in self.schema.items():
+            prop: dict[str, Any] = {"id": prop_id, "name": name, "type": prop_type}
+            if prop_type in ("select", "multi_select", "status"):
+                prop[prop_type] = {"options": [self._option(option) for option in options]}
+            else:
+                prop[prop_type] = {}
+            properties[name] = prop
+        return {
+            "object": "database",
+            "id": self.database_id,
+            "title": self._rich_text("Task DB"),
+            "properties": properties,
+        }
+
+    def query(self, body: dict[str, Any]) -> dict[str, Any]:
+        """POST /v1/databases/{id}/query."""
+        page_size = min(int(body.get("page_size", MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+        start = 0
+        if cursor := body.get("start_cursor"):
+            try:
+                start = int(cursor.removeprefix("cursor-"))
+            except ValueError:
+                raise FakeNotionError(400, "validation_error", "start_cursor should be a valid uuid.") from None
+
+        with self.lock:
+            pages = [p for p in self.pages.values() if not p["archived"] and not p["in_trash"]]
+            if filter_ := body.get("filter"):
+                pages = [p for p in pages if _matches(p, filter_)]
+            for sort in reversed(body.get("sorts", [])):
+                key = partial(_sort_key, sort=sort)
+                pages.sort(key=lambda p: key(p)[1], reverse=sort.get("direction") == "descending")
+                # 빈 값은 방향과 관계없이 맨 뒤
+                pages.sort(key=lambda p: key(p)[0])
+            chunk = pages[start : start + page_size]
+            has_more = start + page_size < len(pages)
+            results = [_page_response(page) for page in chunk]
+
+        return {
+            "object": "list",
+            "results": results,
+            "next_cursor": f"cursor-{start + page_size}" if has_more else None,
+            "has_more": has_more,
+            "type": "page_or_database",
+            "page_or_database": {},
+        }
+
+    # ---------- 시드 ----------
+
+    def seed(self, size: int, seed: int = 0) -> None:
+        """합성 Task를 size개 생성.
+
+        약 1%는 Project, 5%는 Epic, 나머지는 Task/Issue이며 Task → Epic → Project로 상위 항목이 연결된다.
+        """
+        rng = random.Random(seed)
+        base = datetime(2026, 1, 1, tzinfo=UTC)
+        labels, services = SCHEMA["라벨"][2], SCHEMA["서비스"][2]
+        projects: list[str] = []
+        epics: list[str] = []
+        with self.lock:
+            for i in range(size):
+                if i < max(1, size // 100):
+                    task_type = "Project"
+                elif i < max(2, size // 100 + size // 20):
+                    task_type = "Epic"
+                else:
+                    task_type = rng.choices(["Task", "Issue"], weights=[4, 1])[0]
+                created = base + timedelta(minutes=rng.randint(0, 60 * 24 * 270))
+                page_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+                page = self._empty_page(page_id, created, rng.choice(USERS))
+                self.pages[page_id] = page
+
+                words = (rng.choice(_TITLE_PREFIXES), rng.choice(_TITLE_SUBJECTS), rng.choice(_TITLE_ACTIONS))
+                title = " ".join(word for word in words if word)
+                start = base.date() + timedelta(days=rng.randint(0, 270))
+                properties: dict[str, Any] = {
+                    "제목": {"title": [{"text": {"content": f"{title} #{i + 1}"}}]},
+                    "타입": {"select": {"name": task_type}},
+                    "상태": {"status": {"name": rng.choices(SCHEMA["상태"][2], weights=[1, 4, 3, 6, 2, 1])[0]}},
+                    "담당자": {"people": [{"id": u["id"]} for u in rng.sample(USERS, rng.choice([0, 1, 1, 1, 2]))]},
+                    "라벨": {"multi_select": [{"name": n} for n in rng.sample(labels, rng.randint(0, 3))]},
+                    "서비스": {"multi_select": [{"name": n} for n in rng.sample(services, rng.randint(0, 2))]},
+                }
+                if rng.random() < 0.8:
+                    properties["우선순위"] = {"select": {"name": rng.choice(SCHEMA["우선순위"][2])}}
+                if rng.random() < 0.7:
+                    properties["시작일"] = {"date": {"start": start.isoformat()}}
+                    properties["종료일"] = {"date": {"start": (start + timedelta(days=rng.randint(1, 30))).isoformat()}}
+                parents = {"Epic": projects, "Task": epics, "Issue": epics}.get(task_type)
+                if parents:
+                    properties["상위항목"] = {"relation": [{"id": rng.choice(parents)}]}
+                self._apply(page, {self._name(name): value for name, value in properties.items()})
+                page["last_edited_time"] = notion_time(created + timedelta(minutes=rng.randint(0, 60 * 24 * 30)))
+
+                if task_type == "Project":
+                    projects.append(page_id)
+                elif task_type == "Epic":
+                    epics.append(page_id)
+
+
+# ============== 필터 / 정렬 ==============
+
+
+def _property_values(page: dict[str, Any], name: str) -> tuple[str, list[Any]]:
+    """속성 값을 (타입, 비교용 값 목록)으로 변환."""
+    prop = page["properties"].get(name)
+    if prop is None:
+        raise FakeNotionError(400, "validation_error", f"Could not find property with name or id: {name}")
+    prop_type = prop["type"]
+    value = prop.get(prop_type)
+    if prop_type in ("title", "rich_text"):
+        return prop_type, ["".join(t["plain_text"] for t in value)]
+    if prop_type in ("select", "status"):
+        return prop_type, [value["name"]] if value else []
+    if prop_type == "multi_select":
+        return prop_type, [item["name"] for item in value]
+    if prop_type in ("people", "relation"):
+        return prop_type, [item["id"] for item in value]
+    if prop_type == "date":
+        return prop_type, [value["start"][:10]] if value else []
+    if prop_type == "unique_id":
+        return prop_type, [value["number"]]
+    return prop_type, [value] if value is not None else []
+
+
+def _compare(values: list[Any], condition: dict[str, Any], text: bool) -> bool:
+    for op, expected in condition.items():
+        if op == "equals":
+            ok = expected in values if not text else bool(values) and values[0] == expected
+        elif op == "does_not_equal":
+            ok = expected not in values
+        elif op == "contains":
+            ok = any(expected in v for v in values) if text else expected in values
+        elif op == "does_not_contain":
+            ok = not any(expected in v for v in values) if text else expected not in values
+        elif op == "is_empty":
+            ok = not values or values == [""]
+        elif op == "is_not_empty":
+            ok = bool(values) and values != [""]
+        elif op in ("on_or_after", "after", "on_or_before", "before"):
+            if not values:
+                return False
+            target = str(expected)[: len(str(values[0]))]
+            actual = str(values[0])
+            ok = {
+                "on_or_after": actual >= target,
+                "after": actual > target,
+                "on_or_before": actual <= target,
+                "before": actual < target,
+            }[op]
+        else:
+            raise FakeNotionError(400, "validation_error", f"Unsupported filter condition: {op}")
+        if not ok:
+            return False
+    return True
+
+
+def _matches(page: dict[str, Any], filter_: dict[str, Any]) -> bool:
+    """Notion 필터 객체 평가."""
+    if "and" in filter_:
+        return all(_matches(page, f) for f in filter_["and"])
+    if "or" in filter_:
+        return any(_matches(page, f) for f in filter_["or"])
+    if timestamp := filter_.get("timestamp"):
+        return _compare([page[timestamp]], filter_[timestamp], text=False)
+    prop_type, values = _property_values(page, filter_["property"])
+    condition_key = next((k for k in filter_ if k != "property"), prop_type)
+    return _compare(values, filter_.get(condition_key, {}), text=prop_type in ("title", "rich_text"))
+
+
+def _sort_key(page: dict[str, Any], sort: dict[str, Any]) -> tuple[bool, Any]:
+    if timestamp := sort.get("timestamp"):
+        return (False, page[timestamp])
+    _, values = _property_values(page, sort["property"])
+    return (not values, values[0] if values else "")
+
+
+# ============== HTTP 서버 ==============
+
+
+@dataclass
+class FaultConfig:
+    """지연/오류 주입 설정.
+
+    Attributes:
+        latency: 모든 응답에 더할 기본 지연 (초).
+        jitter: 0~jitter초 사이 무작위 추가 지연.
+        rate_limit_rate: 요청을 429 rate_limited로 거절할 확률 (0~1).
+        requests_per_second: 0보다 크면 실제 Notion처럼 초당 요청 수를 넘는 요청을 429로 거절.
+        retry_after: 429 응답의 Retry-After 값 (초).
+        error_rate: 요청을 5xx로 실패시킬 확률 (0~1).
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit_rate: float = 0.0
+    requests_per_second: float = 0.0
+    retry_after: float = 1.0
+    error_rate: float = 0.0
+
+
+class FakeNotionServer:
+    """FakeDatabase를 Notion REST API 형식으로 노출하는 HTTP 서버."""
+
+    def __init__(
+        self,
+        database: FakeDatabase | None = None,
+        faults: FaultConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int | None = None,
+        extra_databases: Iterable[FakeDatabase] = (),
+    ) -> None:
+        """초기화.
+
+        Args:
+            database: 노출할 DB. 없으면 빈 DB.
+            faults: 지연/오류 주입 설정.
+            host: 바인드 주소.
+            port: 포트. 0이면 임의의 빈 포트.
+            seed: 지연/오류 주입 난수 시드.
+            extra_databases: 함께 노출할 다른 DB (여러 DB 조회 테스트용).
+        """
+        self.database = database or FakeDatabase()
+        # 하이픈 없는 DB ID → DB
+        self.databases = {db.database_id.replace("-", ""): db for db in (self.database, *extra_databases)}
+        self.faults = faults or FaultConfig()
+        self.requests: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+        self._window: list[float] = []
+        self._stats_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """NOTION_BASE_URL로 쓸 주소 (/v1 제외)."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "FakeNotionServer":
+        """백그라운드 스레드에서 서버 시작."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-notion", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeNotionServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버 실행."""
+        self._httpd.serve_forever()
+
+    def stats(self) -> dict[str, int]:
+        """엔드포인트별 요청 수 사본 (`rate_limited`, `server_error`는 주입된 오류 응답 수)."""
+        with self._stats_lock:
+            return dict(self.requests)
+
+    # ---------- 요청 처리 ----------
+
+    def _inject_fault(self) -> tuple[int, dict[str, Any], dict[str, str]] | None:
+        faults = self.faults
+        with self._stats_lock:
+            delay = faults.latency + (self._rng.uniform(0, faults.jitter) if faults.jitter else 0.0)
+            limited = faults.rate_limit_rate and self._rng.random() < faults.rate_limit_rate
+            if faults.requests_per_second > 0:
+                now = time.monotonic()
+                self._window = [t for t in self._window if now - t < 1.0]
+                if len(self._window) >= faults.requests_per_second:
+                    limited = True
+                else:
+                    self._window.append(now)
+            failed = faults.error_rate and self._rng.random() < faults.error_rate
+        if delay:
+            time.sleep(delay)
+        if limited:
+            self.requests["rate_limited"] += 1
+            message = "You have been rate limited. Please try again in a few minutes."
+            return 429, _error(429, "rate_limited", message), {"Retry-After": f"{faults.retry_after:g}"}
+        if failed:
+            self.requests["server_error"] += 1
+            return 503, _error(503, "service_unavailable", "Notion is unavailable, please try again later."), {}
+        return None
+
+    def _database(self, database_id: str) -> FakeDatabase:
+        """ID로 DB 찾기 (하이픈 유무 무관)."""
+        if db := self.databases.get(database_id.replace("-", "")):
+            return db
+        raise FakeNotionError(404, "object_not_found", f"Could not find database with ID: {database_id}.")
+
+    def _owner(self, block_id: str) -> FakeDatabase:
+        """페이지/블록이 속한 DB. 없으면 기본 DB (그 DB가 404 응답)."""
+        for db in self.databases.values():
+            if db.contains(block_id):
+                return db
+        return self.database
+
+    def handle(self, method: str, path: str, query: dict[str, str], body: dict[str, Any]) -> tuple[int, Any]:
+        """요청 하나를 처리하여 (상태 코드, 응답 본문) 반환."""
+        if match := re.fullmatch(r"/v1/databases/([^/]+)/query", path):
+            endpoint = "databases.query"
+            if method != "POST":
+                raise FakeNotionError(400, "invalid_request_url", "Invalid request URL.")
+            result = self._database(match[1]).query(body)
+        elif match := re.fullmatch(r"/v1/databases/([^/]+)", path):
+            endpoint = "databases.retrieve"
+            result = self._database(match[1]).retrieve()
+        elif path == "/v1/pages" and method == "POST":
+            endpoint = "pages.create"
+            result = self._database(body.get("parent", {}).get("database_id") or "").create_page(body)
+        elif match := re.fullmatch(r"/v1/blocks/([^/]+)/children", path):
+            db = self._owner(match[1])
+            if method == "PATCH":
+                endpoint = "blocks.children.append"
+                result = db.append_blocks(match[1], body)
+            else:
+                endpoint = "blocks.children.list"
+                result = db.list_blocks(match[1], query)
+        elif match := re.fullmatch(r"/v1/pages/([^/]+)/properties/([^/]+)", path):
+            endpoint = "pages.properties.retrieve"
+            result = self._owner(match[1]).get_property(match[1], match[2], query)
+        elif match := re.fullmatch(r"/v1/pages/([^/]+)", path):
+            db = self._owner(match[1])
+            if method == "PATCH":
+                endpoint = "pages.update"
+                result = db.update_page(match[1], body)
+            else:
+                endpoint = "pages.retrieve"
+                result = db.get_page(match[1])
+        else:
+            raise FakeNotionError(400, "invalid_request_url", "Invalid request URL.")
+
+        with self._stats_lock:
+            self.requests[endpoint] += 1
+        return 200, result
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                if len(data) >= GZIP_MIN_SIZE and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    data = gzip.compress(data)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _dispatch(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                url = urlsplit(self.path)
+
+                if url.path == "/_fake/stats":
+                    self._send(200, server.stats())
+                    return
+                if not self.headers.get("Authorization", "").removeprefix("Bearer ").strip():
+                    self._send(401, _error(401, "unauthorized", "API token is invalid."))
+                    return
+                if fault := server._inject_fault():
+                    self._send(*fault)
+                    return
+                try:
+                    body = json.loads(raw) if raw else {}
+                    query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                    self._send(*server.handle(self.command, url.path, query, body))
+                except FakeNotionError as e:
+                    self._send(e.status, _error(e.status, e.code, str(e)))
+                except (ValueError, KeyError, TypeError) as e:
+                    self._send(400, _error(400, "validation_error", f"body failed validation: {e}"))
+
+            do_GET = do_POST = do_PATCH = _dispatch  # noqa: N815
+
+        return Handler
+
+
+def main() -> None:
+    """가짜 Notion 서버 실행."""
+    parser = argparse.ArgumentParser(description="로컬 가짜 Notion API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--size", type=int, default=1000, help="합성 Task 수 (기본 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--database-id", default=DEFAULT_DATABASE_ID)
+    parser.add_argument("--latency", type=float, default=0.0, help="기본 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="무작위 추가 지연 상한 (ms)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 확률 (0~1)")
+    parser.add_argument("--rps", type=float, default=0.0, help="초당 허용 요청 수 (초과 시 429, 0이면 무제한)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 응답 확률 (0~1)")
+    args = parser.parse_args()
+
+    database = FakeDatabase(args.database_id)
+    database.seed(args.size, seed=args.seed)
+    faults = FaultConfig(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        rate_limit_rate=args.rate_limit_rate,
+        requests_per_second=args.rps,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+    )
+    server = FakeNotionServer(database, faults, host=args.host, port=args.port, seed=args.seed)
+    print(f"Fake Notion API: {server.base_url}  (database_id={database.database_id}, {args.size} tasks)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
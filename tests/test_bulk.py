@@ -0,0 +1,121 @@
+"""일괄 처리(아카이브/복원/수정) 테스트."""
+
+import asyncio
+import time
+
+from notion_task_mcp.models import Priority, TaskBatchUpdate, TaskFilter, TaskStatus
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+
+from .conftest import FakeNotion, make_page
+
+
+class TestBulkArchive:
+    """delete_tasks / restore_tasks / delete_tasks_by_filter 테스트."""
+
+    async def test_delete_tasks_reports_per_item(self, fake_client: NotionTaskClient, fake_notion: FakeNotion):
+        """존재하지 않는 ID는 실패로 보고하고 나머지는 아카이브."""
+        fake_notion.add(make_page("a", "A"))
+        fake_notion.add(make_page("b", "B"))
+
+        results = await fake_client.delete_tasks(["a", "missing", "b", "a"])
+
+        assert [r.task_id for r in results] == ["a", "missing", "b"]
+        assert [r.success for r in results] == [True, False, True]
+        assert "missing" in (results[1].error or "")
+        assert fake_notion.pages["a"]["archived"] is True
+        assert fake_notion.pages["b"]["archived"] is True
+
+    async def test_restore_tasks(self, fake_client: NotionTaskClient, fake_notion: FakeNotion):
+        """아카이브된 Task 복원."""
+        fake_notion.add(make_page("a", "A"))["archived"] = True
+
+        results = await fake_client.restore_tasks(["a"])
+
+        assert results[0].success is True
+        assert results[0].task is not None
+        assert results[0].task.title == "A"
+        assert fake_notion.pages["a"]["archived"] is False
+
+    async def test_delete_tasks_by_filter_spans_pages(
+        self, fake_client: NotionTaskClient, fake_notion: FakeNotion
+    ):
+        """조건에 맞는 쿼리 결과 전체를 페이지 단위로 아카이브하고, 맞지 않는 Task는 남긴다."""
+        for i in range(7):
+            fake_notion.add(make_page(f"p{i}", f"Task {i}", status=TaskStatus.DONE.value))
+        fake_notion.add(make_page("open", "진행 중인 Task", status=TaskStatus.IN_PROGRESS.value))
+
+        results = await fake_client.delete_tasks_by_filter(TaskFilter(status=TaskStatus.DONE), page_size=3)
+
+        assert [r.task_id for r in results] == [f"p{i}" for i in range(7)]
+        assert all(r.success and r.task is None for r in results)
+        assert [page_id for page_id, page in fake_notion.pages.items() if not page["archived"]] == ["open"]
+
+
+class TestBatchUpdate:
+    """batch_update 테스트."""
+
+    async def test_merges_updates_for_same_page(self, fake_client: NotionTaskClient, fake_notion: FakeNotion):
+        """같은 Task 대상 항목은 한 번의 요청으로 병합."""
+        fake_notion.add(make_page("a", "A"))
+        fake_notion.add(make_page("b", "B"))
+
+        results = await fake_client.batch_update([
+            TaskBatchUpdate(task_id="a", status=TaskStatus.IN_PROGRESS, priority=Priority.LOW),
+            TaskBatchUpdate(task_id="b", title="B2"),
+            TaskBatchUpdate(task_id="a", priority=Priority.HIGH),
+        ])
+
+        assert [r.task_id for r in results] == ["a", "b"]
+        assert all(r.success for r in results)
+        updates = [kwargs for name, kwargs in fake_notion.calls if name == "pages.update"]
+        assert len(updates) == 2
+        a_props = next(u["properties"] for u in updates if u["page_id"] == "a")
+        assert a_props["상태"] == {"status": {"name": "진행중"}}
+        assert a_props["우선순위"] == {"select": {"name": "높음"}}
+
+    async def test_reports_failures_per_item(self, fake_client: NotionTaskClient, fake_notion: FakeNotion):
+        """실패한 항목만 실패로 보고."""
+        fake_notion.add(make_page("a", "A"))
+
+        results = await fake_client.batch_update([
+            TaskBatchUpdate(task_id="missing", title="X"),
+            TaskBatchUpdate(task_id="a", title="A2"),
+        ])
+
+        assert [r.success for r in results] == [False, True]
+        assert results[1].task is not None
+        assert results[1].task.title == "A2"
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트."""
+
+    async def test_limits_concurrency(self):
+        """동시 실행 수가 max_concurrency를 넘지 않음."""
+        limiter = RateLimiter(requests_per_second=0, max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+
+    async def test_spaces_requests(self):
+        """초당 요청 수 제한에 따라 요청 간격을 둠."""
+        limiter = RateLimiter(requests_per_second=50, max_concurrency=10)
+        started = time.monotonic()
+
+        async def work() -> None:
+            async with limiter:
+                pass
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert time.monotonic() - started >= 5 / 50 * 0.9
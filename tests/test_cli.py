@@ -0,0 +1,451 @@
+"""Skills용 CLI(task/scripts/notion_task_cli.py) 테스트 (가짜 Notion 서버 대상)."""
+
+import importlib.util
+import io
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from .fake_notion import DEFAULT_DATABASE_ID, USERS, FakeDatabase, FakeNotionServer, FaultConfig
+
+CLI_PATH = Path(__file__).parent.parent / "task" / "scripts" / "notion_task_cli.py"
+
+
+@pytest.fixture(scope="module")
+def cli() -> ModuleType:
+    """CLI 스크립트를 모듈로 로드."""
+    spec = importlib.util.spec_from_file_location("notion_task_cli", CLI_PATH)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeNotionServer]:
+    """250개 Task로 시드된 가짜 Notion 서버."""
+    database = FakeDatabase()
+    database.seed(250, seed=7)
+    with FakeNotionServer(database) as server:
+        yield server
+
+
+@pytest.fixture
+def cli_client(cli: ModuleType, fake_server: FakeNotionServer, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Any:
+    """가짜 서버를 가리키는 CLI NotionTaskClient (캐시는 임시 디렉터리)."""
+    monkeypatch.setattr(cli, "CONFIG", {})
+    monkeypatch.setenv("NOTION_TASK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("NOTION_API_KEY", "fake-key")
+    monkeypatch.setenv("NOTION_DATABASE_ID", DEFAULT_DATABASE_ID)
+    monkeypatch.setenv("NOTION_BASE_URL", fake_server.base_url)
+    monkeypatch.setenv("NOTION_RATE_LIMIT", "0")
+    return cli.NotionTaskClient()
+
+
+class TestConnectionReuse:
+    """지속 연결 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def _one_worker(self, cli_client: Any) -> None:
+        # 잘린 relation 보충 요청도 같은 연결을 쓰도록 작업자 스레드 하나
+        cli_client.max_concurrency = 1
+
+    def test_pagination_reuses_one_connection(self, cli_client: Any, fake_server: FakeNotionServer):
+        """여러 페이지 조회가 연결 하나로 처리되고 gzip 응답도 해석됨."""
+        tasks = cli_client.list_tasks()
+        assert len(tasks) == 250
+        assert fake_server.stats()["databases.query"] == 3
+        assert fake_server.stats()["pages.properties.retrieve"] == 2
+        assert cli_client.http.connections_opened == 1
+
+    def test_reconnects_when_kept_alive_connection_was_closed(self, cli_client: Any):
+        """서버가 닫은 keep-alive 연결은 새 연결로 투명하게 재전송."""
+        task_id = cli_client.list_tasks(task_type="Epic")[0]["id"]
+
+        local, peer = socket.socketpair()
+        peer.close()
+        [idle] = cli_client.http._idle
+        idle.sock.close()
+        idle.sock = local
+
+        assert cli_client.get_task(task_id)["id"] == task_id
+        assert cli_client.http.connections_opened == 2
+
+    def test_write_is_not_resent_when_connection_drops_after_sending(
+        self, cli_client: Any, fake_server: FakeNotionServer
+    ):
+        """요청을 보낸 뒤 끊긴 연결에서는 조회만 다시 보내고, 생성(POST)은 중복 실행하지 않도록 오류로 끝낸다."""
+        task_id = cli_client.list_tasks(task_type="Epic")[0]["id"]
+
+        def read_request_and_close(peer: socket.socket) -> None:
+            with peer, peer.makefile("rb") as stream:
+                headers = dict(line.decode().partition(":")[::2] for line in iter(stream.readline, b"\r\n"))
+                stream.read(int(headers.get("Content-Length", 0)))
+
+        def drop_after_request() -> None:
+            local, peer = socket.socketpair()
+            [idle] = cli_client.http._idle
+            idle.sock.close()
+            idle.sock = local
+            threading.Thread(target=read_request_and_close, args=(peer,), daemon=True).start()
+
+        drop_after_request()
+        assert cli_client.get_task(task_id)["id"] == task_id
+        assert cli_client.http.connections_opened == 2
+
+        cli_client.ensure_schema()  # 스키마 조회가 끊긴 연결을 먼저 쓰지 않도록
+        drop_after_request()
+        with pytest.raises(ConnectionError):
+            cli_client.create_task("중복 금지")
+        assert fake_server.stats().get("pages.create", 0) == 0
+        assert cli_client.http.connections_opened == 2
+
+    def test_http_errors_are_reported(self, cli_client: Any):
+        """4xx 응답은 상태 코드와 본문을 담은 오류로 전달."""
+        with pytest.raises(Exception, match="Notion API Error: 404"):
+            cli_client.get_task("missing")
+
+
+class TestStreamingList:
+    """list 스트리밍 출력 테스트."""
+
+    def test_pages_are_fetched_lazily_and_limit_stops_pagination(self, cli_client: Any, fake_server: FakeNotionServer):
+        """첫 Task는 첫 페이지만 받은 뒤 나오고, limit을 채우면 더 요청하지 않는다."""
+        tasks = cli_client.iter_tasks()
+        next(tasks)
+        assert fake_server.stats()["databases.query"] == 1
+
+        limited = cli_client.list_tasks(limit=120)
+        assert len(limited) == 120
+        assert fake_server.stats()["databases.query"] == 1 + 2
+
+    def test_ndjson_prints_one_compact_task_per_line(
+        self, cli: ModuleType, cli_client: Any, capsys: pytest.CaptureFixture[str]
+    ):
+        """--ndjson은 줄마다 압축된 JSON Task 하나, 표 출력은 개수를 마지막에 출력."""
+        args = cli.build_parser().parse_args(["--no-cache", "list", "--ndjson", "--limit", "5"])
+        assert cli.run_command(args) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 5
+        assert all(json.loads(line)["id"] and ", " not in line for line in lines)
+
+        args = cli.build_parser().parse_args(["list", "--limit", "3"])
+        assert cli.run_command(args) == 0
+        assert capsys.readouterr().out.rstrip().endswith("총 3개의 Task")
+
+
+class TestRelatedItems:
+    """관련 항목 동시 조회 테스트."""
+
+    def test_results_keep_input_order_and_report_failures(self, cli_client: Any, fake_server: FakeNotionServer):
+        """입력 순서 유지, 중복은 한 번만 조회, 실패는 사유와 함께 반환."""
+        ids = [task["id"] for task in cli_client.list_tasks(task_type="Epic")[:5]]
+        requested = [ids[3], "missing-1", ids[0], ids[3], ids[1], "missing-2", ids[4], ids[2]]
+        before = fake_server.stats().get("pages.retrieve", 0)
+
+        items, failures = cli_client.get_related_items(requested)
+
+        assert [item["id"] for item in items] == [ids[3], ids[0], ids[1], ids[4], ids[2]]
+        assert [failure["id"] for failure in failures] == ["missing-1", "missing-2"]
+        assert "404" in failures[0]["error"]
+        assert fake_server.stats()["pages.retrieve"] - before == 5
+
+    def test_rate_limiter_spaces_requests_across_threads(self, cli: ModuleType):
+        """공용 RateLimiter는 여러 스레드의 요청도 초당 상한에 맞춰 간격을 둔다."""
+        limiter = cli.RateLimiter(requests_per_second=20)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: limiter.acquire(), range(6)))
+        assert time.monotonic() - started >= 5 / 20 * 0.9
+
+
+class TestTruncatedProperties:
+    """잘린 relation 보충 테스트."""
+
+    def test_large_epics_get_all_children(self, cli: ModuleType, cli_client: Any, fake_server: FakeNotionServer):
+        """하위 항목이 25개를 넘는 Epic만 전체를 받고, 다른 CLI 프로세스는 디스크 캐시를 쓴다."""
+        pages = fake_server.database.pages
+        large = [pid for pid, page in pages.items() if len(page["properties"]["하위항목"]["relation"]) > 25]
+        assert large
+
+        epics = {task["id"]: task for task in cli_client.list_tasks(task_type="Epic")}
+        for page_id in large:
+            expected = [r["id"] for r in pages[page_id]["properties"]["하위항목"]["relation"]]
+            assert epics[page_id]["children_ids"] == expected
+        assert fake_server.stats()["pages.properties.retrieve"] == len(large)
+
+        assert len(cli.NotionTaskClient().get_task(large[0])["children_ids"]) > 25
+        assert fake_server.stats()["pages.properties.retrieve"] == len(large)
+
+
+class TestBulkUpdate:
+    """update / done 일괄 처리 테스트."""
+
+    def test_mixed_refs_are_resolved_in_one_query_and_reported_per_item(
+        self, cli_client: Any, fake_server: FakeNotionServer
+    ):
+        """티켓 번호는 한 번의 쿼리로 찾고, 항목별 성공/실패를 입력 순서대로 반환."""
+        tasks = cli_client.list_tasks(limit=4)
+        refs = [tasks[0]["no"], tasks[1]["id"], "WIRB-99999", tasks[2]["no"].lower(), "missing-id", tasks[0]["no"]]
+        queries = fake_server.stats()["databases.query"]
+
+        results = cli_client.bulk_update(refs, status="완료")
+
+        assert fake_server.stats()["databases.query"] == queries + 1
+        assert [result["ref"] for result in results] == refs[:5]
+        assert [result["ok"] for result in results] == [True, True, False, True, False]
+        assert [result["id"] for result in results[:2]] == [tasks[0]["id"], tasks[1]["id"]]
+        assert results[3]["task"]["status"] == "완료"
+        assert "404" in results[4]["error"]
+
+    def test_done_reads_refs_from_stdin(self, cli: ModuleType, cli_client: Any, capsys: pytest.CaptureFixture[str]):
+        """`done -`는 stdin의 번호를 읽어 처리하고, 실패가 있으면 종료 코드 1."""
+        tasks = cli_client.list_tasks(limit=3)
+        args = cli.build_parser().parse_args(["--json", "done", "-"])
+        args.stdin = io.StringIO(f"{tasks[0]['no']}\n{tasks[1]['no']}, {tasks[2]['id']}\nWIRB-99999\n")
+
+        assert cli.run_command(args) == 1
+        results = json.loads(capsys.readouterr().out)
+        assert [result["ok"] for result in results] == [True, True, True, False]
+        assert all(cli_client.get_task(task["id"])["status"] == "완료" for task in tasks)
+
+
+class TestHierarchy:
+    """projects / epics / tree 공용 계층 해석 테스트."""
+
+    def test_resolves_parents_once_in_one_batch(self, cli_client: Any, fake_server: FakeNotionServer):
+        """내 Task는 한 번만 조회하고, 모르는 상위 항목만 중복 없이 조회."""
+        user_id = USERS[0]["id"]
+        hierarchy = cli_client.resolve_hierarchy(user_id)
+
+        assert fake_server.stats()["databases.query"] == 3
+        tasks = hierarchy["tasks"]
+        known = {item["id"] for item in (*tasks, *cli_client.list_tasks(task_type="Epic", assignee=user_id))}
+        missing = {parent_id for task in tasks for parent_id in task["parent_ids"]} - known
+        assert fake_server.stats()["pages.retrieve"] == len(missing)
+
+        epic_ids = [epic["id"] for epic in hierarchy["epics"]]
+        assert len(epic_ids) == len(set(epic_ids))
+        assert {parent_id for task in tasks for parent_id in task["parent_ids"]} <= set(epic_ids)
+        assert hierarchy["failures"] == []
+
+    def test_tree_nests_tasks_under_epics_under_projects(self, cli: ModuleType, cli_client: Any):
+        """tree는 Project → Epic → Task 순서로 중첩."""
+        hierarchy = cli_client.resolve_hierarchy(USERS[0]["id"], depth=2)
+        roots = cli.build_tree(hierarchy)
+
+        placed = []
+
+        def walk(node: dict[str, Any], parent: dict[str, Any] | None) -> None:
+            placed.append(node["id"])
+            if parent is not None:
+                assert parent["id"] in node["parent_ids"]
+            for child in node["children"]:
+                walk(child, node)
+
+        for root in roots:
+            walk(root, None)
+        assert sorted(placed) == sorted(hierarchy["items"])
+        assert all(task["id"] not in {root["id"] for root in roots} for task in hierarchy["tasks"])
+        assert "📁" in cli.format_tree(roots)
+
+
+class TestResponseCache:
+    """프로세스 간 디스크 응답 캐시 테스트."""
+
+    def test_reads_are_shared_across_clients(self, cli: ModuleType, cli_client: Any, fake_server: FakeNotionServer):
+        """다른 클라이언트(새 CLI 프로세스에 해당)도 같은 조회는 캐시에서 응답."""
+        first = cli_client.list_tasks(status="진행중")
+        queries = fake_server.stats()["databases.query"]
+
+        assert cli.NotionTaskClient().list_tasks(status="진행중") == first
+        assert fake_server.stats()["databases.query"] == queries
+
+        cli.NotionTaskClient(use_cache=False).list_tasks(status="진행중")
+        assert fake_server.stats()["databases.query"] == queries + 1
+
+    def test_writes_invalidate(self, cli: ModuleType, cli_client: Any, fake_server: FakeNotionServer):
+        """수정하면 목록 캐시는 무효화되고, 수정 응답은 조회 캐시에 남는다."""
+        task = cli_client.list_tasks(status="진행중")[0]
+        cli_client.update_task(task["id"], status="완료")
+        queries = fake_server.stats()["databases.query"]
+
+        assert task["id"] not in {t["id"] for t in cli.NotionTaskClient().list_tasks(status="진행중")}
+        assert fake_server.stats()["databases.query"] == queries + 1
+        assert cli.NotionTaskClient().get_task(task["id"])["status"] == "완료"
+        assert "pages.retrieve" not in fake_server.stats()
+
+    def test_stale_generation_and_expiry_are_misses(self, cli: ModuleType, tmp_path: Path):
+        """무효화 전에 시작한 조회가 늦게 저장한 응답, 만료된 응답은 읽히지 않는다."""
+        cache = cli.ResponseCache(tmp_path, {"list": 60, "get": 0.05})
+        before = cache.generation()
+        cache.invalidate()
+        cache.put("list", "k1", {"results": []}, before)
+        assert cache.get("list", "k1") is None
+
+        cache.put("get", "k2", {"id": "a"}, cache.generation())
+        assert cache.get("get", "k2") == {"id": "a"}
+        time.sleep(0.06)
+        assert cache.get("get", "k2") is None
+
+    def test_concurrent_writers_never_expose_partial_entries(self, cli: ModuleType, tmp_path: Path):
+        """여러 작업자가 같은 키를 동시에 쓰고 무효화해도 읽기는 완전한 응답 또는 미스."""
+        cache = cli.ResponseCache(tmp_path)
+        payload = {"results": [{"id": str(i), "title": "한글 제목" * 50} for i in range(200)]}
+
+        def work(i: int) -> Any:
+            if i % 10 == 0:
+                cache.invalidate()
+            cache.put("list", "same-key", payload, cache.generation())
+            return cache.get("list", "same-key")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            seen = list(executor.map(work, range(100)))
+        assert all(value in (None, payload) for value in seen)
+        assert not list(tmp_path.glob(".tmp-*"))
+
+
+class TestSchema:
+    """DB 스키마 캐시와 이름 매핑 테스트."""
+
+    def test_spaced_names_are_mapped_and_schema_survives_writes(
+        self, cli: ModuleType, cli_client: Any, fake_server: FakeNotionServer
+    ):
+        """띄어쓰기가 다른 상태 이름도 찾고, 스키마는 클라이언트 간 공유되며 수정에도 유지된다."""
+        tasks = cli_client.list_tasks(status="진행 중")
+        assert tasks and {task["status"] for task in tasks} == {"진행중"}
+        assert cli.format_task(tasks[0]).startswith("🔄")
+
+        cli_client.update_task(tasks[0]["id"], status="시작 전")
+        assert cli.NotionTaskClient().get_task(tasks[0]["id"])["status"] == "시작전"
+        assert fake_server.stats()["databases.retrieve"] == 1
+
+    def test_unknown_option_fails_before_any_write(
+        self, cli: ModuleType, cli_client: Any, fake_server: FakeNotionServer, capsys: pytest.CaptureFixture[str]
+    ):
+        """DB에 없는 상태는 Notion에 수정 요청을 보내지 않고 가능한 값과 함께 실패한다."""
+        task = cli_client.list_tasks(limit=1)[0]
+        args = cli.build_parser().parse_args(["update", task["id"], "--status", "검토중"])
+
+        assert cli.run_command(args) == 1
+        assert "가능한 값: 보류, 시작전, 진행중" in capsys.readouterr().err
+        assert "pages.update" not in fake_server.stats()
+
+
+class TestDaemon:
+    """Unix 소켓 데몬 테스트."""
+
+    @pytest.fixture
+    def daemon(
+        self, cli: ModuleType, cli_client: Any, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> Iterator[subprocess.Popen[bytes]]:
+        """별도 프로세스로 데몬 실행 (유휴 종료 1초). 소켓은 임시 디렉터리."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        # 잘린 relation 보충 요청도 같은 연결을 쓰도록 작업자 스레드 하나
+        monkeypatch.setenv("NOTION_MAX_CONCURRENCY", "1")
+        path = cli.daemon_socket_path()
+        process = subprocess.Popen(
+            [sys.executable, str(CLI_PATH), "daemon", "--foreground", "--idle-timeout", "1"],
+            stdout=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 10
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        yield process
+        process.wait(timeout=10)
+
+    @staticmethod
+    def call(cli: ModuleType, argv: list[str]) -> tuple[int | None, str, str]:
+        """데몬에 명령을 보내고 (종료 코드, stdout, stderr) 반환."""
+        frames: list[dict[str, str]] = []
+        code = cli._daemon_call({"argv": argv, "stdin": None, "env": cli.daemon_env()}, frames.append)
+        return code, "".join(f.get("stdout", "") for f in frames), "".join(f.get("stderr", "") for f in frames)
+
+    def test_forwards_commands_and_keeps_connection_warm(self, cli: ModuleType, daemon: subprocess.Popen[bytes]):
+        """명령 출력과 종료 코드를 그대로 전달하고, 호출 사이에 연결을 재사용."""
+        code, out, _ = self.call(cli, ["--json", "list", "--type", "Epic"])
+        epics = json.loads(out)
+        assert code == 0
+        assert epics and all(epic["type"] == "Epic" for epic in epics)
+
+        code, out, _ = self.call(cli, ["--json", "get", epics[0]["id"]])
+        assert (code, json.loads(out)["id"]) == (0, epics[0]["id"])
+        code, _, err = self.call(cli, ["get", "missing"])
+        assert code == 1
+        assert "Notion API Error: 404" in err
+
+        code, out, _ = self.call(cli, [])
+        assert code == 2  # argparse 오류도 종료 코드로 전달
+
+        status: list[dict[str, Any]] = []
+        assert cli._daemon_call({"control": "status"}, status.append) == 0
+        info = json.loads(status[0]["stdout"])
+        assert info["requests"] == 4
+        assert info["connections_opened"] == 1
+
+    def test_falls_back_when_environment_differs(
+        self, cli: ModuleType, daemon: subprocess.Popen[bytes], monkeypatch: pytest.MonkeyPatch
+    ):
+        """NOTION_* 환경변수가 데몬과 다르면 데몬 설정으로 실행하지 않고 직접 실행으로 돌려보낸다."""
+        assert self.call(cli, ["list", "--limit", "1"])[0] == 0
+        monkeypatch.setenv("NOTION_DATABASE_ID", "other-database")
+        assert self.call(cli, ["list"])[0] is None
+        monkeypatch.setenv("NOTION_RATE_LIMIT", "1")
+        assert cli.forward_to_daemon(["create", "--title", "x"], None, retry_safe=False) is None
+
+        status: list[dict[str, Any]] = []
+        assert cli._daemon_call({"control": "status"}, status.append) == 0
+        assert json.loads(status[0]["stdout"])["requests"] == 1
+
+    def test_stop_waits_for_in_flight_requests(
+        self, cli: ModuleType, daemon: subprocess.Popen[bytes], fake_server: FakeNotionServer
+    ):
+        """처리 중에 stop을 받으면 그 요청을 끝까지 처리해 응답한 뒤 종료하고, 새 요청은 직접 실행으로 돌려보낸다."""
+        assert self.call(cli, ["list", "--limit", "1"])[0] == 0  # 스키마를 미리 받아 둔다
+        fake_server.faults = FaultConfig(latency=0.5)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            creating = executor.submit(cli.forward_to_daemon, ["create", "--title", "느린 생성"], None, False)
+            time.sleep(0.2)
+            assert cli._daemon_call({"control": "stop"}, lambda frame: None) == 0
+            assert self.call(cli, ["list", "--limit", "1"])[0] is None  # 종료 중: 실행하지 않고 거절
+            assert creating.result(timeout=10) == 0
+        assert daemon.wait(timeout=10) == 0
+        assert fake_server.stats()["pages.create"] == 1
+
+    def test_write_is_not_retried_after_request_was_sent(
+        self, cli: ModuleType, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ):
+        """요청을 보낸 뒤 응답 없이 끊기면 읽기 명령만 직접 실행으로 대체한다."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(cli.daemon_socket_path()))
+        listener.listen()
+
+        def drop_after_request() -> None:
+            for _ in range(2):
+                connection, _ = listener.accept()
+                connection.makefile("rb").readline()
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(drop_after_request)
+            assert cli.forward_to_daemon(["list"], None, retry_safe=True) is None
+            assert cli.forward_to_daemon(["create", "--title", "x"], None, retry_safe=False) == 1
+        listener.close()
+
+    def test_exits_when_idle_and_falls_back(self, cli: ModuleType, daemon: subprocess.Popen[bytes]):
+        """유휴 시간이 지나면 소켓을 지우고 종료하며, 이후 전달은 직접 실행으로 대체."""
+        assert daemon.wait(timeout=10) == 0
+        assert not cli.daemon_socket_path().exists()
+        assert cli.forward_to_daemon(["list"], None) is None
@@ -0,0 +1,98 @@
+"""프로필별 클라이언트 풀 테스트."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from notion_task_mcp.client_pool import ClientPool, Profile, parse_profiles
+from notion_task_mcp.tools.task_tools import PROFILE_ARG, build_tools, dispatch_tool
+
+from .fake_notion import DEFAULT_DATABASE_ID, FakeDatabase, FakeNotionServer
+
+OTHER_DATABASE_ID = "0f0e0d0c-0b0a-4908-8706-050403020100"
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeNotionServer]:
+    first = FakeDatabase()
+    first.seed(10, seed=21)
+    second = FakeDatabase(OTHER_DATABASE_ID, prefix="OPS")
+    second.seed(10, seed=22)
+    with FakeNotionServer(first, extra_databases=[second]) as server:
+        yield server
+
+
+@pytest.fixture
+def pool(fake_server: FakeNotionServer) -> ClientPool:
+    def profile(name: str, database_id: str) -> Profile:
+        return Profile(name, "fake-key", database_id, rate_limit=0, base_url=fake_server.base_url)
+
+    profiles = {
+        "dev": profile("dev", DEFAULT_DATABASE_ID),
+        "ops": profile("ops", OTHER_DATABASE_ID),
+        "ops-ro": profile("ops-ro", OTHER_DATABASE_ID),
+    }
+    return ClientPool(profiles, max_clients=2)
+
+
+class TestParseProfiles:
+    """NOTION_PROFILES 해석 테스트."""
+
+    def test_json_file_and_env_token(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """파일 경로도 받고, 토큰은 환경변수 이름으로 지정할 수 있다."""
+        monkeypatch.setenv("ACME_NOTION_KEY", "secret")
+        path = tmp_path / "profiles.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "acme": {"api_key_env": "ACME_NOTION_KEY", "database_id": "db1", "rate_limit": 2},
+                    "multi": {"api_key": "k", "databases": ["db2", {"id": "db3", "name": "ops"}]},
+                }
+            )
+        )
+        profiles = parse_profiles(str(path))
+        assert (profiles["acme"].api_key, profiles["acme"].rate_limit) == ("secret", 2)
+        assert [config.label for config in profiles["multi"].databases] == ["db2", "ops"]
+
+        with pytest.raises(ValueError, match="API 키"):
+            parse_profiles('{"x": {"api_key_env": "MISSING_KEY", "database_id": "db"}}')
+
+
+class TestClientPool:
+    """도구 호출별 클라이언트 선택 테스트."""
+
+    async def test_profile_argument_selects_client(self, pool: ClientPool):
+        """profile 인자로 워크스페이스를 고르고, 클라이언트마다 속도 제한기는 따로, 메트릭은 공유한다."""
+        default = pool.client(pool.default)
+        [content] = await dispatch_tool(default, "list_tasks", {PROFILE_ARG: "ops"}, pool)
+        numbers = {task["no"].split("-")[0] for task in json.loads(content.text)["tasks"]}
+        assert numbers == {"OPS"}
+
+        ops = pool.client("ops")
+        assert ops is not default
+        assert ops.rate_limiter is not default.rate_limiter
+        assert ops.metrics is default.metrics is pool.metrics
+        assert pool.metrics.snapshot()["tools"]["list_tasks"]["count"] == 1
+
+        [content] = await dispatch_tool(default, "get_task", {"task_id": "x", PROFILE_ARG: "nope"}, pool)
+        assert "알 수 없는 프로필" in content.text
+
+    async def test_idle_clients_are_closed_over_capacity(self, pool: ClientPool):
+        """max_clients를 넘으면 가장 오래 쓰지 않은 유휴 클라이언트를 닫는다 (기본 프로필은 유지)."""
+        default = pool.client(pool.default)
+        async with pool.acquire("ops") as ops:
+            await ops.list_tasks()
+            assert ops._client is not None
+        async with pool.acquire("ops-ro"):
+            pass
+        assert list(pool._clients) == ["dev", "ops-ro"]
+        assert ops._client is None
+        assert pool.client(pool.default) is default
+
+    def test_schema_lists_profiles(self):
+        """풀이 있으면 모든 도구에 profile 인자(enum)를 추가한다."""
+        for tool in build_tools(["dev", "ops"]):
+            assert tool.inputSchema["properties"][PROFILE_ARG]["enum"] == ["dev", "ops"]
+        assert all(PROFILE_ARG not in tool.inputSchema.get("properties", {}) for tool in build_tools())
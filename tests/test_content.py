@@ -0,0 +1,126 @@
+"""페이지 본문 조회(get_task_content) 테스트."""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from notion_task_mcp.content import TRUNCATED_MARK, render_blocks
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.tools.task_tools import dispatch_tool
+
+from .fake_notion import DEFAULT_DATABASE_ID, FakeDatabase, FakeNotionServer
+
+
+def block(block_type: str, text: str = "", **extra: Any) -> dict[str, Any]:
+    """요청 형식 블록."""
+    return {"type": block_type, block_type: {"rich_text": [{"text": {"content": text}}], **extra}}
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeNotionServer]:
+    database = FakeDatabase()
+    database.seed(10, seed=1)
+    with FakeNotionServer(database) as server:
+        yield server
+
+
+@pytest.fixture
+def http_client(fake_server: FakeNotionServer) -> NotionTaskClient:
+    return NotionTaskClient(
+        api_key="fake-key",
+        database_id=DEFAULT_DATABASE_ID,
+        rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+        base_url=fake_server.base_url,
+    )
+
+
+class TestRenderBlocks:
+    """Markdown 변환 테스트."""
+
+    def test_renders_common_blocks_with_nesting(self):
+        """제목/목록/할 일/코드와 하위 블록 들여쓰기."""
+        rich = [{"plain_text": "굵게", "annotations": {"bold": True}}, {"plain_text": " 링크", "href": "https://x"}]
+        blocks = [
+            {"type": "heading_2", "heading_2": {"rich_text": [{"plain_text": "요구사항"}]}},
+            {"type": "paragraph", "paragraph": {"rich_text": rich}},
+            {
+                "type": "numbered_list_item",
+                "numbered_list_item": {"rich_text": [{"plain_text": "첫째"}]},
+                "children": [{"type": "to_do", "to_do": {"rich_text": [{"plain_text": "확인"}], "checked": True}}],
+            },
+            {"type": "numbered_list_item", "numbered_list_item": {"rich_text": [{"plain_text": "둘째"}]}},
+            {"type": "code", "code": {"rich_text": [{"plain_text": "SELECT 1"}], "language": "sql"}},
+            {"type": "divider", "divider": {}},
+        ]
+        markdown, truncated = render_blocks(blocks, 1000)
+        assert not truncated
+        assert markdown == "\n".join(
+            [
+                "## 요구사항",
+                "**굵게**[ 링크](https://x)",
+                "1. 첫째",
+                "  - [x] 확인",
+                "2. 둘째",
+                "```sql",
+                "SELECT 1",
+                "```",
+                "---",
+            ]
+        )
+
+    def test_stops_at_block_boundary_when_over_budget(self):
+        """max_chars를 넘으면 블록 경계에서 멈추고 표시."""
+        blocks = [{"type": "paragraph", "paragraph": {"rich_text": [{"plain_text": "가" * 40}]}}] * 5
+        markdown, truncated = render_blocks(blocks, 100)
+        assert truncated
+        assert markdown.splitlines() == ["가" * 40, "가" * 40, TRUNCATED_MARK]
+
+
+class TestGetTaskContent:
+    """가짜 서버 대상 본문 조회 테스트."""
+
+    async def test_fetches_depth_limited_tree_and_caches_by_last_edited_time(
+        self, http_client: NotionTaskClient, fake_server: FakeNotionServer
+    ):
+        """같은 깊이의 하위 블록은 한 번에 받고, 깊이 제한을 지키며, 수정 전까지는 블록을 다시 받지 않는다."""
+        database = fake_server.database
+        page_id = next(iter(database.pages))
+        top = database.append_blocks(page_id, {"children": [block("paragraph", f"문단 {i}") for i in range(120)]})
+        toggles = database.append_blocks(page_id, {"children": [block("toggle", "접기 1"), block("toggle", "접기 2")]})
+        for toggle in toggles["results"]:
+            inner = database.append_blocks(toggle["id"], {"children": [block("bulleted_list_item", "항목")]})
+            database.append_blocks(inner["results"][0]["id"], {"children": [block("paragraph", "너무 깊음")]})
+        assert len(top["results"]) == 120
+
+        content = await http_client.get_task_content(page_id, max_depth=2)
+        assert content.markdown.count("\n  - 항목") == 2
+        assert "너무 깊음" not in content.markdown
+        assert not content.truncated
+        assert content.block_count == 124
+        assert fake_server.stats()["blocks.children.list"] == 2 + 2  # 최상위 122개(2페이지) + 토글 2개
+
+        again = await http_client.get_task_content(page_id, max_depth=2)
+        assert again == content
+        assert fake_server.stats()["blocks.children.list"] == 4
+
+        database.pages[page_id]["last_edited_time"] = "2099-01-01T00:00:00.000Z"
+        await http_client.get_task_content(page_id, max_depth=2)
+        assert fake_server.stats()["blocks.children.list"] == 8
+
+    async def test_budget_stops_fetching_and_tool_reports_truncation(
+        self, http_client: NotionTaskClient, fake_server: FakeNotionServer
+    ):
+        """글자 수 제한을 넘으면 다음 블록 페이지를 받지 않고, 도구 응답에 truncated로 알린다."""
+        database = fake_server.database
+        page_id = next(iter(database.pages))
+        database.append_blocks(page_id, {"children": [block("paragraph", "본문" * 50) for _ in range(250)]})
+
+        [result] = await dispatch_tool(http_client, "get_task_content", {"task_id": page_id, "max_chars": 500})
+        content = json.loads(result.text)
+        assert content["truncated"]
+        assert content["markdown"].endswith(TRUNCATED_MARK)
+        assert len(content["markdown"]) <= 500 + len(TRUNCATED_MARK) + 1
+        assert fake_server.stats()["blocks.children.list"] == 1
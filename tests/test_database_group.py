@@ -0,0 +1,177 @@
+"""여러 DB 동시 조회(DatabaseGroupClient) 테스트."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from notion_task_mcp.database_group import (
+    DatabaseConfig,
+    DatabaseGroupClient,
+    merge_streams,
+    parse_database_configs,
+)
+from notion_task_mcp.models import Priority, SortField, TaskFilter, TaskStatus, TaskType, TaskUpdate
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.store import sort_tasks
+
+from .conftest import make_page
+from .fake_notion import DEFAULT_DATABASE_ID, FakeDatabase, FakeNotionServer
+
+OTHER_DATABASE_ID = "0f0e0d0c-0b0a-4908-8706-050403020100"
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeNotionServer]:
+    first = FakeDatabase()
+    first.seed(40, seed=11)
+    second = FakeDatabase(OTHER_DATABASE_ID, prefix="OPS")
+    second.seed(30, seed=12)
+    with FakeNotionServer(first, extra_databases=[second]) as server:
+        yield server
+
+
+@pytest.fixture
+def group_client(fake_server: FakeNotionServer) -> DatabaseGroupClient:
+    return DatabaseGroupClient(
+        [DatabaseConfig(DEFAULT_DATABASE_ID, "dev"), DatabaseConfig(OTHER_DATABASE_ID, "ops")],
+        api_key="fake-key",
+        rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+        base_url=fake_server.base_url,
+    )
+
+
+class TestDatabaseGroup:
+    """가짜 서버의 두 DB를 함께 조회."""
+
+    async def test_list_tasks_fans_out_and_tags_source(
+        self, group_client: DatabaseGroupClient, fake_server: FakeNotionServer
+    ):
+        """모든 DB를 조회해 합치고, 각 Task에 원본 DB 이름을 붙인다. 속도 제한기는 하나를 공유한다."""
+        tasks = await group_client.list_tasks(TaskFilter(task_type=TaskType.TASK))
+        sources = {task.database for task in tasks}
+        assert sources == {"dev", "ops"}
+        assert {task.no.split("-")[0] for task in tasks if task.database == "ops" and task.no} == {"OPS"}
+        assert fake_server.stats()["databases.query"] == 2
+        assert all(client.rate_limiter is group_client.rate_limiter for client in group_client.database_clients)
+
+    async def test_sorted_stream_merge_keeps_order(self, group_client: DatabaseGroupClient):
+        """정렬 조회는 DB별 정렬 결과를 순서를 유지하며 합친다 (빈 값은 맨 뒤)."""
+        for descending in (False, True):
+            streamed = [
+                task
+                async for task in group_client.iter_tasks(
+                    page_size=7, sort_by=SortField.END_DATE, descending=descending
+                )
+            ]
+            assert len(streamed) == 70
+            expected = sort_tasks(streamed, SortField.END_DATE, descending)
+            assert [task.end_date for task in streamed] == [task.end_date for task in expected]
+            assert streamed[-1].end_date is None
+
+        listed = await group_client.list_tasks(sort_by=SortField.END_DATE)
+        assert [task.end_date for task in listed] == [task.end_date for task in sort_tasks(listed, SortField.END_DATE)]
+
+    async def test_writes_go_to_the_task_database(
+        self, group_client: DatabaseGroupClient, fake_server: FakeNotionServer
+    ):
+        """다른 DB의 Task는 그 DB의 클라이언트가 조회/수정한다."""
+        page_id = next(iter(fake_server.databases[OTHER_DATABASE_ID.replace("-", "")].pages))
+        task = await group_client.get_task(page_id)
+        assert task.database == "ops"
+
+        updated = await group_client.update_task(page_id, TaskUpdate(status=TaskStatus.DONE))
+        assert updated.database == "ops"
+        assert updated.status == TaskStatus.DONE
+        assert fake_server.stats()["databases.retrieve"] == 2  # DB마다 스키마를 한 번씩
+
+    async def test_first_write_routes_by_page_parent(self):
+        """처음 보는 Task도 수정 전에 소속 DB를 확인해 그 DB의 속성 이름으로 보낸다."""
+        first = FakeDatabase()
+        first.seed(5, seed=13)
+        second = FakeDatabase(OTHER_DATABASE_ID, prefix="OPS", renames={"상태": "State", "우선순위": "Priority"})
+        second.seed(5, seed=14)
+        with FakeNotionServer(first, extra_databases=[second]) as server:
+            client = DatabaseGroupClient(
+                [
+                    DatabaseConfig(DEFAULT_DATABASE_ID, "dev"),
+                    DatabaseConfig(OTHER_DATABASE_ID, "ops", {"status": "State", "priority": "Priority"}),
+                ],
+                api_key="fake-key",
+                rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+                base_url=server.base_url,
+            )
+            page_id = next(iter(second.pages))
+            updated = await client.update_task(page_id, TaskUpdate(status=TaskStatus.DONE, priority=Priority.HIGH))
+            assert (updated.database, updated.status, updated.priority) == ("ops", TaskStatus.DONE, Priority.HIGH)
+            assert second.pages[page_id]["properties"]["State"]["status"]["name"] == "완료"
+            assert "상태" not in second.pages[page_id]["properties"]
+
+            assert await client.delete_task(page_id)
+            assert second.pages[page_id]["archived"]
+            assert server.stats()["pages.retrieve"] == 1  # 소속 확인은 처음 한 번만
+            await client.aclose()
+
+    async def test_delete_by_filter_covers_every_database(
+        self, group_client: DatabaseGroupClient, fake_server: FakeNotionServer
+    ):
+        """필터 일괄 삭제는 모든 DB에서 조건에 맞는 Task를 모아 각 DB에서 아카이브한다."""
+        matches = await group_client.list_tasks(TaskFilter(task_type=TaskType.TASK))
+        assert {task.database for task in matches} == {"dev", "ops"}
+
+        results = await group_client.delete_tasks_by_filter(TaskFilter(task_type=TaskType.TASK), page_size=7)
+        assert sorted(result.task_id for result in results) == sorted(task.id for task in matches)
+        assert all(result.success for result in results)
+        assert await group_client.list_tasks(TaskFilter(task_type=TaskType.TASK)) == []
+        archived = [page for database in fake_server.databases.values() for page in database.pages.values()]
+        assert sum(page["archived"] for page in archived) == len(matches)
+
+    async def test_stopping_early_cancels_other_streams(self):
+        """소비를 멈추면 나머지 스트림 조회도 취소되고, 스트림 예외는 그대로 전달된다."""
+        cancelled = asyncio.Event()
+
+        async def endless() -> AsyncIterator[int]:
+            try:
+                while True:
+                    yield 1
+                    await asyncio.sleep(0)
+            finally:
+                cancelled.set()
+
+        async def failing() -> AsyncIterator[int]:
+            yield 2
+            raise RuntimeError("boom")
+
+        merged = merge_streams([endless(), endless()], buffer=2)
+        assert await anext(merged) == 1
+        await merged.aclose()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            [item async for item in merge_streams([failing()], key=lambda item: item)]
+
+
+class TestDatabaseConfig:
+    """DB 설정/속성 이름 매핑 테스트."""
+
+    def test_parse_json_and_comma_separated(self):
+        """JSON 배열(문자열/객체)과 쉼표 구분 ID 목록."""
+        configs = parse_database_configs('["a", {"id": "b", "name": "ops", "properties": {"status": "State"}}]')
+        assert [(c.id, c.label, c.properties) for c in configs] == [("a", "a", {}), ("b", "ops", {"status": "State"})]
+        assert [c.id for c in parse_database_configs(" a , b ")] == ["a", "b"]
+        with pytest.raises(ValueError):
+            parse_database_configs("[]")
+
+    def test_property_names_override_defaults(self):
+        """DB별 속성 이름으로 읽고, 모르는 속성 키는 거부한다."""
+        client = NotionTaskClient(
+            api_key="k", database_id="d", database_name="ops", property_names={"status": "State", "no": "Key"}
+        )
+        page = make_page("a", "할 일", State={"status": {"name": "진행중"}}, Key={"unique_id": {"number": 3}})
+        page["properties"].pop("상태")
+        task = client._parse_task(page)
+        assert (task.status, task.no, task.database) == (TaskStatus.IN_PROGRESS, "3", "ops")
+
+        with pytest.raises(ValueError, match="colour"):
+            NotionTaskClient(api_key="k", database_id="d", property_names={"colour": "색"})
@@ -0,0 +1,127 @@
+"""도구 제한 시간/취소 테스트."""
+
+import asyncio
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from notion_task_mcp.deadline import MAX_TIMEOUT, ToolTimeouts
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.tools.task_tools import TIMEOUT_ARG, dispatch_tool
+
+from .fake_notion import FakeDatabase, FakeNotionServer, FaultConfig
+
+LATENCY = 0.05
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeNotionServer]:
+    database = FakeDatabase()
+    database.seed(100, seed=41)
+    with FakeNotionServer(database, faults=FaultConfig(latency=LATENCY)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(fake_server: FakeNotionServer) -> NotionTaskClient:
+    return NotionTaskClient(
+        api_key="fake-key",
+        database_id=fake_server.database.database_id,
+        rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+        base_url=fake_server.base_url,
+    )
+
+
+async def settled(fake_server: FakeNotionServer, endpoint: str) -> int:
+    """진행 중이던 요청이 끝날 때까지 기다린 뒤 요청 수."""
+    await asyncio.sleep(LATENCY * 3)
+    return fake_server.stats().get(endpoint, 0)
+
+
+class TestDeadline:
+    """제한 시간을 넘기면 남은 요청을 보내지 않고 부분 결과를 반환."""
+
+    async def test_list_tasks_returns_partial_result(self, client: NotionTaskClient, fake_server: FakeNotionServer):
+        """페이지네이션을 멈추고 그때까지 받은 Task를 partial=true로 돌려준다."""
+        await client.ensure_schema()
+        [content] = await dispatch_tool(client, "list_tasks", {"page_size": 10, TIMEOUT_ARG: LATENCY * 6})
+        result = json.loads(content.text)
+        assert result["partial"] is True
+        assert 0 < result["count"] < 100
+        assert result["count"] == len(result["tasks"])
+
+        queries = await settled(fake_server, "databases.query")
+        await asyncio.sleep(LATENCY * 4)
+        assert fake_server.stats()["databases.query"] == queries < 10
+
+    async def test_batch_stops_and_reports_completed_items(
+        self, client: NotionTaskClient, fake_server: FakeNotionServer
+    ):
+        """일괄 처리는 남은 항목을 보내지 않고, 이미 수정한 Task만 결과에 담는다."""
+        await client.ensure_schema()
+        task_ids = list(fake_server.database.pages)[:20]
+        arguments = {"task_ids": task_ids, "status": "완료", TIMEOUT_ARG: LATENCY * 6}
+        [content] = await dispatch_tool(client, "batch_update_status", arguments)
+        result = json.loads(content.text)
+        assert result["partial"] is True
+        assert 0 < result["count"] < 20
+        assert {task["status"] for task in result["tasks"]} == {"완료"}
+        assert await settled(fake_server, "pages.update") < 20
+
+    async def test_configured_timeout_and_tools_without_partial_result(self, client: NotionTaskClient):
+        """설정한 도구별 제한 시간을 쓰고, 부분 결과가 없는 도구는 오류로 알린다."""
+        timeouts = ToolTimeouts(per_tool={"get_task": LATENCY / 2})
+        [content] = await dispatch_tool(client, "get_task", {"task_id": "x"}, timeouts=timeouts)
+        assert content.text == f"Error: 제한 시간({LATENCY / 2:g}초)을 넘어 중단했습니다."
+        assert client.metrics.snapshot()["tools"]["get_task"]["errors"] == 1
+
+        [content] = await dispatch_tool(client, "get_task", {"task_id": "x", TIMEOUT_ARG: 0})
+        assert "0보다 커야" in content.text
+
+
+class TestCancellation:
+    """MCP 취소 알림(호출 태스크 취소)이 Notion 요청까지 전파."""
+
+    async def test_cancel_stops_pagination(self, client: NotionTaskClient, fake_server: FakeNotionServer):
+        """취소하면 진행 중인 요청을 끊고 다음 페이지를 요청하지 않는다."""
+        call = asyncio.create_task(dispatch_tool(client, "list_tasks", {"page_size": 10}))
+        while fake_server.stats().get("databases.query", 0) < 2:
+            await asyncio.sleep(0.01)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        queries = await settled(fake_server, "databases.query")
+        await asyncio.sleep(LATENCY * 4)
+        assert fake_server.stats()["databases.query"] == queries < 10
+        assert client.metrics.snapshot()["tools"]["list_tasks"]["errors"] == 1
+
+    async def test_cancelled_wait_returns_rate_limit_slot(self):
+        """속도 제한 대기 중에 취소된 요청은 예약한 슬롯을 돌려준다."""
+        limiter = RateLimiter(requests_per_second=1, max_concurrency=3)
+        async with limiter:
+            pass
+        reserved = limiter._next_slot
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert limiter._next_slot == reserved
+
+
+class TestToolTimeouts:
+    """제한 시간 설정 해석."""
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        """기본값, 도구별 값(0이면 제한 없음), 인자 우선순위."""
+        monkeypatch.setenv("NOTION_TASK_TIMEOUT", "30")
+        monkeypatch.setenv("NOTION_TASK_TIMEOUTS", '{"list_tasks": 10, "server_stats": 0}')
+        timeouts = ToolTimeouts.from_env()
+        assert timeouts.for_tool("get_task") == 30
+        assert timeouts.for_tool("list_tasks") == 10
+        assert timeouts.for_tool("server_stats") is None
+        assert timeouts.for_tool("list_tasks", 5) == 5
+        assert timeouts.for_tool("list_tasks", 10_000) == MAX_TIMEOUT
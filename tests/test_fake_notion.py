@@ -0,0 +1,149 @@
+"""가짜 Notion 서버 대상 테스트 (실제 SDK/HTTP 경로 사용, API 키 불필요)."""
+
+from collections.abc import Iterator
+
+import pytest
+from notion_client import APIResponseError
+
+from notion_task_mcp.models import TaskCreate, TaskFilter, TaskStatus, TaskType, TaskUpdate
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.store import matches
+from notion_task_mcp.tools.task_tools import dispatch_tool
+
+from .fake_notion import DEFAULT_DATABASE_ID, FakeDatabase, FakeNotionServer, FaultConfig
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeNotionServer]:
+    """250개 Task로 시드된 가짜 Notion 서버."""
+    database = FakeDatabase()
+    database.seed(250, seed=7)
+    with FakeNotionServer(database) as server:
+        yield server
+
+
+@pytest.fixture
+def http_client(fake_server: FakeNotionServer) -> NotionTaskClient:
+    """가짜 서버를 가리키는 NotionTaskClient."""
+    return NotionTaskClient(
+        api_key="fake-key",
+        database_id=DEFAULT_DATABASE_ID,
+        rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+        base_url=fake_server.base_url,
+    )
+
+
+class TestFakeNotionServer:
+    """가짜 서버 + NotionTaskClient 테스트."""
+
+    async def test_list_paginates(self, http_client: NotionTaskClient, fake_server: FakeNotionServer):
+        """커서 페이지네이션으로 전체 목록 조회."""
+        tasks = await http_client.list_tasks()
+        assert len(tasks) == 250
+        assert len({t.id for t in tasks}) == 250
+        assert fake_server.requests["databases.query"] == 3
+        assert sum(t.task_type == TaskType.PROJECT for t in tasks) == 2
+
+    async def test_server_side_filter_matches_local_filter(self, http_client: NotionTaskClient):
+        """서버 필터 결과가 로컬 필터(store.matches)와 일치."""
+        everything = await http_client.list_tasks()
+        filter_ = TaskFilter(task_type=TaskType.TASK, status_group="할일", labels=["백엔드", "버그"])
+        filtered = await http_client.list_tasks(filter_)
+        assert filtered
+        assert {t.id for t in filtered} == {t.id for t in everything if matches(t, filter_)}
+
+    async def test_create_update_keeps_relations_in_sync(self, http_client: NotionTaskClient):
+        """상위 항목을 지정하면 상위 페이지의 하위 항목에도 반영."""
+        epic = (await http_client.list_tasks(TaskFilter(task_type=TaskType.EPIC)))[0]
+        created = await http_client.create_task(TaskCreate(title="새 작업 한글 제목", parent_id=epic.id))
+        assert created.no and created.no.startswith("WIRB-")
+
+        parent = await http_client.get_task(epic.id)
+        assert created.id in parent.children_ids
+
+        updated = await http_client.update_task(created.id, TaskUpdate(status=TaskStatus.IN_PROGRESS))
+        assert updated.status == TaskStatus.IN_PROGRESS
+        assert updated.parent_id == epic.id
+
+    async def test_archived_pages_leave_query(self, http_client: NotionTaskClient):
+        """아카이브한 페이지는 쿼리 결과에서 빠짐."""
+        created = await http_client.create_task(TaskCreate(title="삭제할 작업"))
+        await http_client.delete_task(created.id)
+        assert created.id not in {t.id for t in await http_client.list_tasks()}
+
+    async def test_delete_by_filter_spans_pages(self, http_client: NotionTaskClient):
+        """아카이브로 결과 집합이 줄어도 여러 페이지에 걸친 대상을 빠짐없이 아카이브."""
+        filter_ = TaskFilter(task_type=TaskType.TASK)
+        matching = await http_client.list_tasks(filter_)
+        assert len(matching) > 100
+
+        results = await http_client.delete_tasks_by_filter(filter_, page_size=20)
+
+        assert len(results) == len(matching)
+        assert all(r.success for r in results)
+        assert await http_client.list_tasks(filter_) == []
+        assert len(await http_client.list_tasks()) == 250 - len(matching)
+
+        with pytest.raises(ValueError, match="필터 조건"):
+            await http_client.delete_tasks_by_filter(TaskFilter())
+
+    async def test_delete_tasks_tool_rejects_empty_or_unknown_filter(self, http_client: NotionTaskClient):
+        """조건 없는 filter와 모르는 키가 든 filter는 아무것도 아카이브하지 않고 거부."""
+        for filter_ in ({}, {"stauts": "완료"}, {"labels": []}):
+            [content] = await dispatch_tool(http_client, "delete_tasks", {"filter": filter_})
+            assert content.text.startswith("Error:")
+        assert len(await http_client.list_tasks()) == 250
+
+    async def test_rate_limit_injection(self, http_client: NotionTaskClient, fake_server: FakeNotionServer):
+        """429 주입 시 클라이언트가 재시도 후 실패."""
+        await http_client.ensure_schema()
+        fake_server.faults = FaultConfig(rate_limit_rate=1.0, retry_after=0)
+        with pytest.raises(APIResponseError):
+            await http_client.list_tasks()
+        assert fake_server.requests["rate_limited"] == http_client.MAX_RETRIES + 1
+        assert http_client.metrics.retries["databases.query"] == http_client.MAX_RETRIES
+
+    async def test_server_error_injection(self, http_client: NotionTaskClient, fake_server: FakeNotionServer):
+        """5xx 주입."""
+        fake_server.faults = FaultConfig(error_rate=1.0)
+        with pytest.raises(APIResponseError) as exc_info:
+            await http_client.get_task("anything")
+        assert exc_info.value.status == 503
+
+
+class TestTruncatedProperties:
+    """잘린 relation/title 속성 보충 테스트."""
+
+    async def test_large_relations_are_completed_and_cached(
+        self, http_client: NotionTaskClient, fake_server: FakeNotionServer
+    ):
+        """잘린 하위 항목만 페이지 속성 엔드포인트로 나눠 받고, 바뀌지 않은 페이지는 다시 받지 않는다."""
+        database = fake_server.database
+        epic = await http_client.create_task(TaskCreate(title="큰 Epic", task_type=TaskType.EPIC))
+        for i in range(130):
+            database.create_page(
+                {
+                    "parent": {"database_id": DEFAULT_DATABASE_ID},
+                    "properties": {
+                        "제목": {"title": [{"text": {"content": f"하위 {i}"}}]},
+                        "상위항목": {"relation": [{"id": epic.id}]},
+                    },
+                }
+            )
+        children = [r["id"] for r in database.pages[epic.id]["properties"]["하위항목"]["relation"]]
+
+        task = await http_client.get_task(epic.id)
+        assert task.children_ids == children
+        assert fake_server.stats()["pages.properties.retrieve"] == 2  # 100 + 30
+
+        tasks = {t.id: t for t in await http_client.list_tasks()}
+        for page_id, page in database.pages.items():
+            assert tasks[page_id].children_ids == [r["id"] for r in page["properties"]["하위항목"]["relation"]]
+        fetched = fake_server.stats()["pages.properties.retrieve"]
+        await http_client.list_tasks()
+        assert fake_server.stats()["pages.properties.retrieve"] == fetched
+
+        updated = await http_client.update_task(epic.id, TaskUpdate(status=TaskStatus.IN_PROGRESS))
+        assert updated.children_ids == children
+        assert fake_server.stats()["pages.properties.retrieve"] == fetched + 2
@@ -0,0 +1,72 @@
+"""Streamable HTTP 전송 테스트."""
+
+import asyncio
+import json
+import socket
+from collections.abc import Iterator
+
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+from notion_task_mcp.http_transport import MCP_PATH, is_loopback, security_settings, serve_http
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.server import create_server
+
+from .fake_notion import FakeDatabase, FakeNotionServer
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeNotionServer]:
+    database = FakeDatabase()
+    database.seed(20, seed=31)
+    with FakeNotionServer(database) as server:
+        yield server
+
+
+async def call_list_tasks(url: str) -> int:
+    """세션 하나를 열어 list_tasks를 호출하고 Task 수를 반환."""
+    async with streamablehttp_client(url) as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            result = await session.call_tool("list_tasks", {})
+            return len(json.loads(result.content[0].text)["tasks"])  # type: ignore[union-attr]
+
+
+class TestHttpTransport:
+    """한 프로세스에 여러 세션 연결."""
+
+    async def test_sessions_share_one_client(self, fake_server: FakeNotionServer):
+        """동시에 붙은 세션들이 같은 Notion 클라이언트(스키마 캐시, 속도 제한기)를 쓴다."""
+        client = NotionTaskClient(
+            api_key="fake-key",
+            database_id=fake_server.database.database_id,
+            rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+            base_url=fake_server.base_url,
+        )
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()  # 서버가 뜨기 전 연결은 backlog에서 대기
+        url = f"http://127.0.0.1:{sock.getsockname()[1]}{MCP_PATH}/"
+        serving = asyncio.create_task(serve_http(create_server(client), sock=sock))
+        try:
+            counts = await asyncio.wait_for(asyncio.gather(*(call_list_tasks(url) for _ in range(3))), 30)
+        finally:
+            serving.cancel()
+            await asyncio.gather(serving, return_exceptions=True)
+            sock.close()
+            await client.aclose()
+
+        assert counts == [20, 20, 20]
+        assert fake_server.stats()["databases.retrieve"] == 1
+        assert client.metrics.snapshot()["tools"]["list_tasks"]["count"] == 3
+
+    def test_loopback_only_accepts_local_hosts(self):
+        """루프백 바인드 시 로컬 Host 헤더만 허용한다."""
+        assert is_loopback("127.0.0.1") and is_loopback("localhost") and is_loopback("::1")
+        assert not is_loopback("0.0.0.0")
+        settings = security_settings("127.0.0.1", 8765)
+        assert settings.enable_dns_rebinding_protection
+        assert "localhost:8765" in settings.allowed_hosts
+        assert not security_settings("0.0.0.0", 8765).enable_dns_rebinding_protection
@@ -0,0 +1,119 @@
+"""내장 메트릭 테스트."""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+from notion_client import APIErrorCode, APIResponseError, AsyncClient
+
+from notion_task_mcp.metrics import Histogram, Metrics
+from notion_task_mcp.models import TaskUpdate
+from notion_task_mcp.notion_client import NotionTaskClient, endpoint_name
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.tools.task_tools import dispatch_tool
+
+from .conftest import FakeNotion, make_page
+from .fake_notion import FakeDatabase
+
+
+class TestHistogram:
+    """Histogram 테스트."""
+
+    def test_quantiles_are_interpolated_within_bucket(self):
+        """분위수는 해당 버킷 안에서 선형 보간."""
+        histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+        for value in (0.05, 0.15, 0.15, 0.3):
+            histogram.observe(value)
+        assert histogram.count == 4
+        assert histogram.quantile(0.5) == pytest.approx(0.15)
+        assert histogram.quantile(1.0) == 0.3
+        assert histogram.summary()["max_ms"] == 300.0
+
+    def test_overflow_bucket_reports_max(self):
+        """마지막 버킷을 넘는 값은 최댓값으로 추정."""
+        histogram = Histogram(buckets=(0.1,))
+        histogram.observe(5.0)
+        assert histogram.quantile(0.99) == 5.0
+
+    def test_prometheus_buckets_are_cumulative(self):
+        """Prometheus 출력은 누적 버킷이며 +Inf가 전체 개수."""
+        metrics = Metrics()
+        metrics.observe_tool("get_task", 0.003)
+        metrics.observe_tool("get_task", 20.0, error=True)
+        metrics.record_cache("store", hit=True)
+        text = metrics.to_prometheus()
+        assert 'notion_task_mcp_tool_duration_seconds_bucket{tool="get_task",le="0.005"} 1' in text
+        assert 'notion_task_mcp_tool_duration_seconds_bucket{tool="get_task",le="+Inf"} 2' in text
+        assert 'notion_task_mcp_tool_duration_seconds_count{tool="get_task"} 2' in text
+        assert 'notion_task_mcp_tool_errors_total{tool="get_task"} 1' in text
+        assert 'notion_task_mcp_cache_requests_total{cache="store",result="hit"} 1' in text
+
+
+class TestInstrumentation:
+    """도구 디스패치 / Notion API 호출 계측 테스트."""
+
+    async def test_dispatch_records_tool_and_endpoint(self, fake_client: NotionTaskClient, fake_notion: FakeNotion):
+        """도구 호출 시간, 엔드포인트 응답 시간, 파싱/직렬화 단계가 기록됨."""
+        fake_notion.add(make_page("a", "할 일"))
+        await dispatch_tool(fake_client, "get_task", {"task_id": "a"})
+        await dispatch_tool(fake_client, "get_task", {"task_id": "missing"})
+
+        [content] = await dispatch_tool(fake_client, "server_stats", {})
+        stats = json.loads(content.text)
+        assert stats["tools"]["get_task"]["count"] == 2
+        assert stats["tools"]["get_task"]["errors"] == 1
+        assert stats["notion"]["pages.retrieve"]["count"] == 2
+        assert stats["notion"]["pages.retrieve"]["errors"] == 1
+        assert {"parse", "serialize", "rate_limit_wait"} <= stats["stages"].keys()
+
+    async def test_rate_limited_retries_are_counted(self, fake_client: NotionTaskClient):
+        """429 응답과 재시도 횟수 집계."""
+        fake_client.DEFAULT_RETRY_AFTER = 0
+        calls = 0
+
+        class PagesEndpoint:
+            async def retrieve(self, page_id: str) -> dict[str, Any]:
+                nonlocal calls
+                calls += 1
+                if calls == 1:
+                    response = httpx.Response(429, headers={"retry-after": "0"})
+                    raise APIResponseError(response, "rate limited", APIErrorCode.RateLimited)
+                return make_page(page_id)
+
+        await fake_client._request(PagesEndpoint().retrieve, page_id="a")
+        metrics = fake_client.metrics
+        assert metrics.rate_limited["pages.retrieve"] == 1
+        assert metrics.retries["pages.retrieve"] == 1
+        assert metrics.notion_seconds["pages.retrieve"].count == 2
+
+    async def test_http_hooks_count_bytes(self):
+        """SDK의 HTTP 요청/응답 본문 바이트를 엔드포인트별로 집계."""
+        body = json.dumps(make_page("a", "할 일")).encode()
+        schema = json.dumps(FakeDatabase("test-db").retrieve()).encode()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            content = schema if request.url.path.startswith("/v1/databases/") else body
+            return httpx.Response(200, content=content, headers={"content-type": "application/json"})
+
+        client = NotionTaskClient(
+            api_key="test-key",
+            database_id="test-db",
+            rate_limiter=RateLimiter(requests_per_second=0),
+        )
+        sdk = client._create_sdk_client()
+        hooks = sdk.client.event_hooks
+        sdk.client = httpx.AsyncClient(transport=httpx.MockTransport(handler), event_hooks=hooks)
+        client.client = sdk
+
+        task = await client.update_task("a", TaskUpdate(title="할 일"))
+        assert task.title == "할 일"
+        assert client.metrics.request_bytes["pages.update"] > 0
+        assert client.metrics.response_bytes["pages.update"] == len(body)
+
+    def test_endpoint_name(self, fake_notion: FakeNotion):
+        """SDK 엔드포인트 클래스/메서드 이름에서 라벨 생성."""
+        assert endpoint_name(fake_notion.pages_endpoint.retrieve) == "pages.retrieve"
+        assert endpoint_name(fake_notion.databases.query) == "databases.query"
+        sdk = AsyncClient(auth="test-key")
+        assert endpoint_name(sdk.pages.properties.retrieve) == "pages.properties.retrieve"
@@ -0,0 +1,76 @@
+"""도구 호출 프로파일링 테스트."""
+
+from pathlib import Path
+
+import pytest
+from mcp.server import Server
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.profiling import ToolProfiler
+from notion_task_mcp.tools import register_task_tools
+
+from .conftest import FakeNotion, make_page
+
+
+async def _call(server: Server, name: str, arguments: dict) -> None:
+    handler = server.request_handlers[CallToolRequest]
+    await handler(CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)))
+
+
+class TestToolProfiler:
+    """ToolProfiler 테스트."""
+
+    async def test_profiles_every_nth_selected_call(
+        self, fake_client: NotionTaskClient, fake_notion: FakeNotion, tmp_path: Path
+    ):
+        """선택한 도구의 N번째 호출마다 pstats 덤프와 보고서 기록."""
+        fake_notion.add(make_page("a", "할 일"))
+        profiler = ToolProfiler(tools={"get_task"}, output_dir=tmp_path, every=2)
+        server = Server("test")
+        register_task_tools(server, fake_client, profiler)
+
+        for _ in range(4):
+            await _call(server, "get_task", {"task_id": "a"})
+        await _call(server, "list_tasks", {})
+
+        assert len(list(tmp_path.glob("*-get_task-*.prof"))) == 2
+        reports = sorted(tmp_path.glob("*.txt"))
+        assert [r.name.rsplit("-", 1)[-1] for r in reports] == ["2.txt", "4.txt"]
+        assert "_parse_task" in reports[0].read_text(encoding="utf-8")
+        assert profiler.calls == {"get_task": 4}
+
+    async def test_tracemalloc_report(self, fake_client: NotionTaskClient, fake_notion: FakeNotion, tmp_path: Path):
+        """tracemalloc 모드는 할당 상위 항목 보고서만 기록."""
+        fake_notion.add(make_page("a", "할 일"))
+        profiler = ToolProfiler(tools=None, output_dir=tmp_path, modes=("tracemalloc",), top=5)
+        server = Server("test")
+        register_task_tools(server, fake_client, profiler)
+
+        await _call(server, "get_task", {"task_id": "a"})
+
+        assert not list(tmp_path.glob("*.prof"))
+        [report] = tmp_path.glob("*.txt")
+        text = report.read_text(encoding="utf-8")
+        assert "== tracemalloc" in text
+        assert "cProfile" not in text
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        """환경변수 설정 해석."""
+        monkeypatch.delenv("NOTION_TASK_PROFILE", raising=False)
+        assert ToolProfiler.from_env() is None
+
+        monkeypatch.setenv("NOTION_TASK_PROFILE", "list_tasks, get_task")
+        monkeypatch.setenv("NOTION_TASK_PROFILE_MODE", "cprofile,tracemalloc")
+        monkeypatch.setenv("NOTION_TASK_PROFILE_EVERY", "10")
+        monkeypatch.setenv("NOTION_TASK_PROFILE_DIR", str(tmp_path))
+        profiler = ToolProfiler.from_env()
+        assert profiler is not None
+        assert profiler.tools == {"list_tasks", "get_task"}
+        assert profiler.modes == ("cprofile", "tracemalloc")
+        assert profiler.every == 10
+        assert profiler.output_dir == tmp_path
+
+        monkeypatch.setenv("NOTION_TASK_PROFILE_MODE", "perf")
+        with pytest.raises(ValueError):
+            ToolProfiler.from_env()
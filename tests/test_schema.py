@@ -0,0 +1,117 @@
+"""DB 스키마 캐시와 로컬 검증 테스트."""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from notion_task_mcp.models import StatusGroup, TaskFilter, TaskStatus, TaskUpdate
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.rate_limit import RateLimiter
+from notion_task_mcp.schema import DatabaseSchema, SchemaError
+
+from .conftest import FakeNotion, make_page
+from .fake_notion import DEFAULT_DATABASE_ID, FakeDatabase, FakeNotionServer
+
+
+def spaced_schema(drop_status: str | None = None) -> DatabaseSchema:
+    """CLI와 같은 띄어쓰기 이름을 쓰는 DB 스키마 (ID 속성 이름도 다름)."""
+    renames = {"상위항목": "상위 항목", "하위항목": "하위 항목", "No": "ID"}
+    properties: dict[str, Any] = {}
+    for name, prop in FakeDatabase().retrieve()["properties"].items():
+        properties[renames.get(name, name)] = prop
+    options = properties["상태"]["status"]["options"]
+    for option in options:
+        option["name"] = {"시작전": "시작 전", "진행중": "진행 중"}.get(option["name"], option["name"])
+    properties["상태"]["status"]["options"] = [option for option in options if option["name"] != drop_status]
+    return DatabaseSchema(properties)
+
+
+class TestSchemaMapping:
+    """속성/옵션 이름 매핑 테스트."""
+
+    def test_parse_and_build_use_database_names(self, fake_client: NotionTaskClient):
+        """띄어쓰기만 다른 속성/옵션과 하나뿐인 unique_id 속성을 DB 이름으로 읽고 쓴다."""
+        fake_client.apply_schema(spaced_schema())
+        page = make_page(
+            "a",
+            "할 일",
+            status="진행 중",
+            **{"상위 항목": {"relation": [{"id": "epic"}]}, "ID": {"unique_id": {"prefix": "WIRB", "number": 7}}},
+        )
+
+        task = fake_client._parse_task(page)
+        assert (task.status, task.parent_id, task.no) == (TaskStatus.IN_PROGRESS, "epic", "WIRB-7")
+
+        props = fake_client._build_properties(TaskUpdate(status=TaskStatus.NOT_STARTED, parent_id="epic"), True)
+        assert props == {"상태": {"status": {"name": "시작 전"}}, "상위 항목": {"relation": [{"id": "epic"}]}}
+
+        notion_filter = fake_client._build_filter(TaskFilter(status_group=StatusGroup.IN_PROGRESS, parent_id="epic"))
+        assert notion_filter == {
+            "and": [
+                {"property": "상태", "status": {"equals": "진행 중"}},
+                {"property": "상위 항목", "relation": {"contains": "epic"}},
+            ]
+        }
+
+    async def test_unknown_options_fail_before_any_request(
+        self, fake_client: NotionTaskClient, fake_notion: FakeNotion
+    ):
+        """DB에 없는 상태는 요청 없이 거부하고, 그룹 필터에서는 조건만 뺀다."""
+        fake_client.apply_schema(spaced_schema(drop_status="배포됨"))
+        fake_notion.add(make_page("a", "할 일"))
+
+        with pytest.raises(SchemaError, match="배포됨"):
+            await fake_client.update_task("a", TaskUpdate(status=TaskStatus.DEPLOYED))
+        assert fake_notion.calls == []
+
+        notion_filter = fake_client._build_filter(TaskFilter(status_group=StatusGroup.DONE))
+        assert notion_filter is not None
+        assert [c["status"]["equals"] for c in notion_filter["or"]] == ["완료", "보관"]
+
+    async def test_status_group_without_any_status_is_rejected(
+        self, fake_client: NotionTaskClient, fake_notion: FakeNotion
+    ):
+        """그룹의 상태가 모두 DB에 없으면 조건을 빼서 전체를 조회하지 않고 거부한다."""
+        fake_client.apply_schema(spaced_schema(drop_status="진행 중"))
+        fake_notion.add(make_page("a", "할 일"))
+        status_filter = TaskFilter(status_group=StatusGroup.IN_PROGRESS)
+
+        with pytest.raises(SchemaError, match="진행 중"):
+            fake_client._build_filter(status_filter)
+        with pytest.raises(SchemaError):
+            await fake_client.delete_tasks_by_filter(status_filter)
+        assert fake_notion.calls == []
+        assert fake_notion.pages["a"]["archived"] is False
+
+
+class TestSchemaCache:
+    """스키마 조회 캐시 테스트."""
+
+    @pytest.fixture
+    def fake_server(self) -> Iterator[FakeNotionServer]:
+        database = FakeDatabase()
+        database.seed(30, seed=3)
+        with FakeNotionServer(database) as server:
+            yield server
+
+    async def test_retrieved_once_until_ttl_expires(self, fake_server: FakeNotionServer):
+        """동시 요청도 스키마는 한 번만 받고, TTL이 지나면 다시 받는다."""
+        client = NotionTaskClient(
+            api_key="fake-key",
+            database_id=DEFAULT_DATABASE_ID,
+            rate_limiter=RateLimiter(requests_per_second=0, max_concurrency=3),
+            base_url=fake_server.base_url,
+        )
+        task_ids = list(fake_server.database.pages)[:5]
+        await asyncio.gather(*(client.get_task(task_id) for task_id in task_ids))
+        await client.list_tasks()
+        assert fake_server.stats()["databases.retrieve"] == 1
+        assert client.schema is not None
+        assert client.schema.property_id("상태") == "%3ASt"
+
+        client.schema_ttl = 0.01
+        await asyncio.sleep(0.02)
+        await client.get_task(task_ids[0])
+        assert fake_server.stats()["databases.retrieve"] == 2
@@ -0,0 +1,130 @@
+"""로컬 복제본/웜 스타트 스냅샷 테스트."""
+
+from datetime import date
+from pathlib import Path
+
+from notion_task_mcp.models import Priority, StatusGroup, Task, TaskFilter, TaskStatus, TaskType
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.store import TaskStore, matches
+
+from .conftest import FakeNotion, make_page
+
+
+def _task(task_id: str, **kwargs: object) -> Task:
+    kwargs.setdefault("title", f"Task {task_id}")
+    return Task(id=task_id, **kwargs)  # type: ignore[arg-type]
+
+
+class TestSnapshot:
+    """스냅샷 저장/복원 테스트."""
+
+    def test_roundtrip(self, tmp_path: Path):
+        """저장한 Task와 watermark가 그대로 복원됨."""
+        store = TaskStore("db-1", path=tmp_path / "snap.bin")
+        task = _task(
+            "a",
+            no="WIRB-1",
+            title="한글 제목",
+            task_type=TaskType.EPIC,
+            status=TaskStatus.IN_PROGRESS,
+            priority=Priority.HIGH,
+            assignee_ids=["u1", "u2"],
+            start_date=date(2026, 1, 2),
+            labels=["백엔드"],
+            children_ids=["c1"],
+            last_edited_time="2026-01-02T03:04:00.000Z",
+        )
+        store.apply_changes([task, _task("b")])
+        store.save()
+
+        loaded = TaskStore("db-1", path=tmp_path / "snap.bin")
+        assert loaded.load() is True
+        assert loaded.watermark == "2026-01-02T03:04:00.000Z"
+        assert loaded.get("a") == task
+        assert len(loaded) == 2
+        assert loaded.dirty is False
+
+    def test_rejects_other_database_and_garbage(self, tmp_path: Path):
+        """다른 DB의 스냅샷이나 깨진 파일은 무시."""
+        path = tmp_path / "snap.bin"
+        store = TaskStore("db-1", path=path)
+        store.apply_changes([_task("a", last_edited_time="2026-01-01T00:00:00.000Z")])
+        store.save()
+
+        assert TaskStore("db-2", path=path).load() is False
+        path.write_bytes(b"garbage")
+        assert TaskStore("db-1", path=path).load() is False
+        assert TaskStore("db-1", path=tmp_path / "missing.bin").load() is False
+
+
+class TestLocalFilter:
+    """로컬 필터 판정 테스트."""
+
+    def test_matches(self):
+        """_build_filter와 같은 의미로 판정."""
+        task = _task(
+            "a",
+            status=TaskStatus.DEPLOYED,
+            assignee="u1",
+            assignee_ids=["u1", "u2"],
+            labels=["백엔드", "API"],
+            end_date=date(2026, 3, 1),
+        )
+        assert matches(task, TaskFilter(status_group=StatusGroup.DONE))
+        assert matches(task, TaskFilter(assignee="u2"))
+        assert matches(task, TaskFilter(labels=["프론트", "API"]))
+        assert matches(task, TaskFilter(end_date_from=date(2026, 3, 1), end_date_to=date(2026, 3, 31)))
+        assert not matches(task, TaskFilter(status=TaskStatus.DONE))
+        assert not matches(task, TaskFilter(start_date_from=date(2026, 1, 1)))
+        assert not matches(task, TaskFilter(assignee="u3"))
+
+
+class TestWarmStart:
+    """웜 상태 복제본으로 목록 조회."""
+
+    async def test_list_tasks_catches_up_incrementally(
+        self, tmp_path: Path, fake_client: NotionTaskClient, fake_notion: FakeNotion
+    ):
+        """스냅샷이 있으면 last_edited_time 증분 쿼리 후 로컬에서 필터링."""
+        store = TaskStore("test-db", path=tmp_path / "snap.bin")
+        store.apply_changes([
+            _task("old", status=TaskStatus.DONE, last_edited_time="2026-01-01T00:00:00.000Z"),
+        ])
+        store.last_sync = None
+        fake_client.attach_store(store)
+        changed = make_page("new", "새 Task", status="진행중")
+        changed["last_edited_time"] = "2026-01-05T00:00:00.000Z"
+        fake_notion.add(changed)
+
+        tasks = await fake_client.list_tasks(TaskFilter(status=TaskStatus.IN_PROGRESS))
+
+        assert [t.id for t in tasks] == ["new"]
+        [(name, kwargs)] = [call for call in fake_notion.calls if call[0] != "databases.retrieve"]
+        assert name == "databases.query"
+        assert kwargs["filter"] == {
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": "2026-01-01T00:00:00.000Z"},
+        }
+        assert store.watermark == "2026-01-05T00:00:00.000Z"
+
+        # 방금 동기화했으므로 다음 조회는 API 호출 없이 처리
+        calls = len(fake_notion.calls)
+        await fake_client.list_tasks()
+        assert len(fake_notion.calls) == calls
+
+    async def test_writes_update_store_without_advancing_watermark(
+        self, tmp_path: Path, fake_client: NotionTaskClient, fake_notion: FakeNotion
+    ):
+        """직접 수정/삭제는 복제본에 반영하되 watermark는 유지."""
+        store = TaskStore("test-db", path=tmp_path / "snap.bin")
+        store.replace_all([])
+        fake_client.attach_store(store)
+        page = fake_notion.add(make_page("a", "A"))
+        page["last_edited_time"] = "2026-02-01T00:00:00.000Z"
+
+        await fake_client.get_task("a")
+        assert store.get("a") is not None
+        assert store.watermark == ""
+
+        await fake_client.delete_task("a")
+        assert store.get("a") is None
@@ -0,0 +1,98 @@
+"""MCP 도구 레지스트리/디스패치 테스트."""
+
+import json
+
+from notion_task_mcp.notion_client import NotionTaskClient
+from notion_task_mcp.tools.task_tools import TOOL_SPECS, build_tools, dispatch_tool
+
+from .conftest import FakeNotion, make_page
+
+
+class TestToolRegistry:
+    """도구 스키마 생성 테스트."""
+
+    def test_schemas_are_inlined(self):
+        """$ref/$defs/anyOf 없이 평탄한 스키마 생성."""
+        tools = build_tools()
+        assert [t.name for t in tools] == [spec.name for spec in TOOL_SPECS]
+        for tool in tools:
+            text = json.dumps(tool.inputSchema)
+            assert "$ref" not in text
+            assert "$defs" not in text
+            assert "anyOf" not in text
+            assert tool.inputSchema["type"] == "object"
+
+    def test_enum_and_required_fields(self):
+        """enum 값과 필수 필드가 모델에서 반영됨."""
+        schemas = {t.name: t.inputSchema for t in build_tools()}
+        assert schemas["create_task"]["required"] == ["title"]
+        status_enum = schemas["list_tasks"]["properties"]["status"]["enum"]
+        assert status_enum == ["보류", "시작전", "진행중", "완료", "배포됨", "보관"]
+        assert schemas["update_task"]["required"] == ["task_id"]
+
+
+class TestDispatch:
+    """dispatch_tool 테스트."""
+
+    async def test_get_task(self, fake_client: NotionTaskClient, fake_notion: FakeNotion):
+        """이름으로 핸들러를 찾아 JSON 응답 생성."""
+        fake_notion.add(make_page("a", "할 일"))
+        [content] = await dispatch_tool(fake_client, "get_task", {"task_id": "a"})
+        assert json.loads(content.text)["title"] == "할 일"
+
+    async def test_invalid_enum_is_reported(self, fake_client: NotionTaskClient):
+        """모델 검증 실패는 오류 응답으로 반환."""
+        [content] = await dispatch_tool(fake_client, "list_tasks", {"status": "없는상태"})
+        assert content.text.startswith("Error:")
+
+    async def test_unknown_tool(self, fake_client: NotionTaskClient):
+        """알 수 없는 도구."""
+        [content] = await dispatch_tool(fake_client, "nope", {})
+        assert content.text == "Unknown tool: nope"
+
+
+class TestExpand:
+    """expand 옵션 테스트."""
+
+    async def test_list_tasks_resolves_related_ids_once(self, fake_client: NotionTaskClient, fake_notion: FakeNotion):
+        """결과 전체의 관련 ID를 중복 없이 한 번씩만 조회하고, 결과에 있는 Task는 다시 조회하지 않는다."""
+        epic = make_page("e", "에픽", status="진행중", 하위항목={"relation": [{"id": "a"}, {"id": "b"}]})
+        epic["archived"] = True
+        fake_notion.add(epic)
+        fake_notion.add(
+            make_page(
+                "a",
+                "할 일",
+                상위항목={"relation": [{"id": "e"}]},
+                하위항목={"relation": [{"id": "b"}, {"id": "gone"}]},
+                No={"unique_id": {"prefix": "WIRB", "number": 1}},
+            )
+        )
+        fake_notion.add(make_page("b", "하위 일", status="완료", 상위항목={"relation": [{"id": "e"}]}))
+
+        [content] = await dispatch_tool(fake_client, "list_tasks", {"expand": ["parent", "children"]})
+        tasks = {task["id"]: task for task in json.loads(content.text)["tasks"]}
+        assert tasks["a"]["parent"] == {"id": "e", "no": None, "title": "에픽", "status": "진행중"}
+        assert tasks["a"]["children"] == [
+            {"id": "b", "no": None, "title": "하위 일", "status": "완료"},
+            {"id": "gone", "error": "조회하지 못했습니다."},
+        ]
+        assert tasks["b"]["parent"]["title"] == "에픽"
+        assert tasks["b"]["children"] == []
+        retrieved = sorted(kwargs["page_id"] for name, kwargs in fake_notion.calls if name == "pages.retrieve")
+        assert retrieved == ["e", "gone"]
+
+    async def test_get_task_without_expand_keeps_plain_shape(
+        self, fake_client: NotionTaskClient, fake_notion: FakeNotion
+    ):
+        """expand가 없으면 관련 항목을 조회하지 않는다."""
+        fake_notion.add(make_page("e", "에픽"))
+        fake_notion.add(make_page("a", "할 일", 상위항목={"relation": [{"id": "e"}]}))
+
+        [content] = await dispatch_tool(fake_client, "get_task", {"task_id": "a"})
+        assert "parent" not in json.loads(content.text)
+        [content] = await dispatch_tool(fake_client, "get_task", {"task_id": "a", "expand": ["parent"]})
+        task = json.loads(content.text)
+        assert task["parent"]["title"] == "에픽"
+        assert "children" not in task
+        assert [name for name, _ in fake_notion.calls].count("pages.retrieve") == 3